@@ -35,6 +35,7 @@ from nion.swift import NotificationDialog
 from nion.swift import Panel
 from nion.swift import ProjectPanel
 from nion.swift import SessionPanel
+from nion.swift import StartupProfile
 from nion.swift import Task
 from nion.swift import ToolbarPanel
 from nion.swift import Workspace
@@ -349,14 +350,17 @@ class Application(UIApplication.BaseApplication):
             app_data_file_path = self.ui.get_configuration_location() / pathlib.Path("nionswift_appdata.json")
             ApplicationData.set_file_path(app_data_file_path)
             logging.info("Application data: " + str(app_data_file_path))
-            self.__initialize_features()
-            PlugInManager.load_plug_ins(self.ui.get_document_location(), self.ui.get_data_location(), get_root_dir() if use_root_dir else None)
-            color_maps_dir = self.ui.get_configuration_location() / pathlib.Path("Color Maps")
-            if color_maps_dir.exists():
-                logging.info("Loading color maps from " + str(color_maps_dir))
-                ColorMaps.load_color_maps(color_maps_dir)
-            else:
-                logging.info("NOT Loading color maps from " + str(color_maps_dir) + " (missing)")
+            with StartupProfile.phase("features"):
+                self.__initialize_features()
+            with StartupProfile.phase("plug-ins"):
+                PlugInManager.load_plug_ins(self.ui.get_document_location(), self.ui.get_data_location(), get_root_dir() if use_root_dir else None)
+            with StartupProfile.phase("color maps"):
+                color_maps_dir = self.ui.get_configuration_location() / pathlib.Path("Color Maps")
+                if color_maps_dir.exists():
+                    logging.info("Loading color maps from " + str(color_maps_dir))
+                    ColorMaps.load_color_maps(color_maps_dir)
+                else:
+                    logging.info("NOT Loading color maps from " + str(color_maps_dir) + " (missing)")
         Registry.register_component(self, {"application"})
 
     def deinitialize(self) -> None:
@@ -429,7 +433,8 @@ class Application(UIApplication.BaseApplication):
                 profile_name = pathlib.Path(self.ui.get_persistent_string("profile_name", "Profile"))
                 profile_path = data_dir / profile_name.with_suffix(".nsproj")
             # create the profile
-            profile, is_created = self.__establish_profile(profile_path)
+            with StartupProfile.phase("profile"):
+                profile, is_created = self.__establish_profile(profile_path)
         self.__profile = profile
         assert self.__profile
 
@@ -517,10 +522,14 @@ class Application(UIApplication.BaseApplication):
 
             # launch the find existing projects task asynchronously.
             window_handler.window.event_loop.create_task(find_existing_projects())
+            StartupProfile.finish()
             return True
         else:
             # continue with opening the default project
-            return self.__open_default_project(profile_dir, is_created)
+            with StartupProfile.phase("project window"):
+                result = self.__open_default_project(profile_dir, is_created)
+            StartupProfile.finish()
+            return result
 
     def __show_project_error_dialog(self, title: str, message: str, *, completion_fn: typing.Optional[typing.Callable[[], None]] = None) -> None:
         # during project management dialogs, we want to prevent the application from closing.
@@ -369,7 +369,8 @@ class DataPanel(Panel.Panel):
         # note is_shared_selection is True for both list and grid canvas items. prevents the selection from being updated when items are inserted.
         # instead, the selection in the model itself is used.
         line_height = document_controller.get_font_metrics("11px sans-serif", "M").height
-        grid_canvas_item = GridCanvasItem.GridCanvasItem2(Panel.ThreadSafeListModel(display_items_model, document_controller.event_loop), self.__selection, grid_item_factory, item_delegate, item_size=Geometry.IntSize(80 + line_height, 80), key="display_items", is_shared_selection=True)
+        grid_item_size = Geometry.IntSize(80 + line_height, 80)
+        grid_canvas_item = GridCanvasItem.GridCanvasItem2(Panel.ThreadSafeListModel(display_items_model, document_controller.event_loop), self.__selection, grid_item_factory, item_delegate, item_size=grid_item_size, key="display_items", is_shared_selection=True)
         grid_canvas_item.wants_drag_events = True
         grid_scroll_area_canvas_item = CanvasItem.ScrollAreaCanvasItem(grid_canvas_item)
         grid_scroll_area_canvas_item.auto_resize_contents = True
@@ -437,9 +438,24 @@ class DataPanel(Panel.Panel):
         self.data_view_widget = ui.create_canvas_widget(properties={"size-policy-vertical": "expanding"})
         self.data_view_widget.canvas_item.add_canvas_item(stack_canvas_item)
 
+        # when scrolling, read the cached thumbnails of the visible items before the others.
+        # the list items span the full width; the grid items fill as many columns as fit the width.
+        self.__stack_canvas_item = stack_canvas_item
+        self.__display_items_model = display_items_model
+        list_item_size = Geometry.IntSize(height=80, width=0)
+        self.__list_content_updated_listener = list_scroll_area_canvas_item.content_updated_event.listen(ReferenceCounting.weak_partial(DataPanel.__load_visible_thumbnails, self, 0, list_item_size, list_scroll_area_canvas_item))
+        self.__grid_content_updated_listener = grid_scroll_area_canvas_item.content_updated_event.listen(ReferenceCounting.weak_partial(DataPanel.__load_visible_thumbnails, self, 1, grid_item_size, grid_scroll_area_canvas_item))
+
+        def view_index_changed(index: int) -> None:
+            stack_canvas_item.current_index = index
+            if index == 0:
+                self.__load_visible_thumbnails(index, list_item_size, list_scroll_area_canvas_item)
+            else:
+                self.__load_visible_thumbnails(index, grid_item_size, grid_scroll_area_canvas_item)
+
         self.__view_button_group = CanvasItem.RadioButtonGroup([list_icon_button, grid_icon_button])
         self.__view_button_group.current_index = 0
-        self.__view_button_group.on_current_index_changed = lambda index: setattr(stack_canvas_item, "current_index", index)
+        self.__view_button_group.on_current_index_changed = view_index_changed
 
         self.__filter_description_combo_box = ui.create_combo_box_widget(item_getter=operator.attrgetter("title"))
 
@@ -504,6 +520,10 @@ class DataPanel(Panel.Panel):
     def close(self) -> None:
         self.__selection_changed_event_listener.close()
         self.__selection_changed_event_listener = typing.cast(Event.EventListener, None)
+        self.__list_content_updated_listener.close()
+        self.__list_content_updated_listener = typing.cast(Event.EventListener, None)
+        self.__grid_content_updated_listener.close()
+        self.__grid_content_updated_listener = typing.cast(Event.EventListener, None)
         self.__filter_description_action = typing.cast(typing.Any, None)
         self.__view_button_group.close()
         self.__view_button_group = typing.cast(CanvasItem.RadioButtonGroup, None)
@@ -522,6 +542,18 @@ class DataPanel(Panel.Panel):
     def _grid_canvas_item(self) -> GridCanvasItem.GridCanvasItem2:
         return self.__grid_canvas_item
 
+    def __load_visible_thumbnails(self, view_index: int, item_size: Geometry.IntSize, scroll_area_canvas_item: CanvasItem.ScrollAreaCanvasItem) -> None:
+        # ask the thumbnail manager to read the visible thumbnails first, followed by a prefetch window of the same
+        # size below and then above the visible items. an item width of zero means one item per row.
+        visible_rect = scroll_area_canvas_item.visible_rect
+        if self.__stack_canvas_item.current_index == view_index and visible_rect and visible_rect.height > 0 and visible_rect.width > 0:
+            column_count = max(1, round(visible_rect.width / item_size.width)) if item_size.width > 0 else 1
+            first_index = max(0, visible_rect.top // item_size.height) * column_count
+            last_index = ((visible_rect.bottom - 1) // item_size.height + 1) * column_count
+            prefetch_count = max(0, last_index - first_index)
+            display_items = self.__display_items_model.display_items
+            Thumbnails.ThumbnailManager().load_thumbnails(list(display_items[first_index:last_index + prefetch_count]) + list(display_items[max(0, first_index - prefetch_count):first_index]))
+
     def __notify_focus_changed(self) -> None:
         # this is called when the keyboard focus for the data panel is changed.
         # if we are receiving focus, tell the window (document_controller) that
@@ -1635,25 +1635,57 @@ class ChangeDisplayCommand(Undo.UndoableCommand):
 
 
 class ChangeGraphicsCommand(Undo.UndoableCommand):
+    """Change graphics on a display item.
+
+    Only the properties that change between creating and committing the command are recorded, using a property change
+    capture on each graphic, so that changing many graphics does not write each one to a dict.
+    """
 
     def __init__(self, document_model: DocumentModel.DocumentModel, display_item: DisplayItem.DisplayItem, graphics: typing.Sequence[Graphics.Graphic], *, title: typing.Optional[str] = None, command_id: typing.Optional[str] = None, is_mergeable: bool=False, modify_fn: typing.Optional[typing.Callable[[Graphics.Graphic], None]] = None, **kwargs: typing.Any) -> None:
         super().__init__(title if title else _("Change Graphics"), command_id=command_id, is_mergeable=is_mergeable)
         self.__document_model = document_model
         self.__display_item_proxy = display_item.create_proxy()
         self.__graphic_indexes = [display_item.graphics.index(graphic) for graphic in graphics]
-        self.__graphic_properties = [graphic.write_to_dict() for graphic in graphics]
+        self.__graphic_property_change_captures: typing.Optional[typing.List[Persistence.PersistentPropertyChangeCapture]] = [Persistence.PersistentPropertyChangeCapture(graphic) for graphic in graphics]
+        # the stored properties, per graphic, per property name.
+        self.__graphic_properties: typing.Union[typing.List[typing.Dict[str, Persistence.PersistentDictType]], Changes.StoredSnapshot] = list()
         self.__modify_fn = modify_fn
         self.__value_dict = kwargs
         self.initialize()
 
     def close(self) -> None:
+        self.__end_property_change_captures()
         self.__document_model = typing.cast(typing.Any, None)
+        if isinstance(self.__graphic_properties, Changes.StoredSnapshot):
+            self.__graphic_properties.close()
         self.__graphic_properties = typing.cast(typing.Any, None)
         self.__display_item_proxy.close()
         self.__display_item_proxy = typing.cast(typing.Any, None)
         self.__graphic_indexes = typing.cast(typing.Any, None)
         super().close()
 
+    def __end_property_change_captures(self) -> None:
+        if self.__graphic_property_change_captures is not None:
+            self.__graphic_properties = [dict(property_change_capture.properties) for property_change_capture in self.__graphic_property_change_captures]
+            for property_change_capture in self.__graphic_property_change_captures:
+                property_change_capture.close()
+            self.__graphic_property_change_captures = None
+
+    def __get_graphic_properties(self) -> typing.List[typing.Dict[str, Persistence.PersistentDictType]]:
+        self.__end_property_change_captures()
+        graphic_properties = self.__graphic_properties
+        if isinstance(graphic_properties, Changes.StoredSnapshot):
+            stored_snapshot = graphic_properties
+            graphic_properties = typing.cast(typing.List[typing.Dict[str, Persistence.PersistentDictType]], stored_snapshot.load())
+            stored_snapshot.close()
+            self.__graphic_properties = graphic_properties
+            self._update_memory_size()
+        return graphic_properties
+
+    def commit(self, was_merge: bool = False) -> None:
+        self.__end_property_change_captures()
+        super().commit(was_merge)
+
     def _perform(self) -> None:
         display_item = self.__display_item_proxy.item
         if display_item:
@@ -1682,12 +1714,32 @@ class ChangeGraphicsCommand(Undo.UndoableCommand):
     def _undo(self) -> None:
         display_item = self.__display_item_proxy.item
         if display_item:
-            properties = self.__graphic_properties
+            graphic_properties = self.__get_graphic_properties()
             graphics = [display_item.graphics[index] for index in self.__graphic_indexes]
-            self.__graphic_properties = [graphic.write_to_dict() for graphic in graphics]
-            for graphic, graphic_properties in zip(graphics, properties):
+            # record the current values of the same properties for redo.
+            self.__graphic_properties = [graphic.write_properties_to_dict(properties.keys()) for graphic, properties in zip(graphics, graphic_properties)]
+            for graphic, properties in zip(graphics, graphic_properties):
+                # read the changed properties back in one batch. keys not in the dict are left unchanged.
                 # NOTE: use read_properties_from_dict (read properties only), not read_from_dict (used for initialization).
-                graphic.read_properties_from_dict(graphic_properties)
+                if properties:
+                    graphic_properties_dict: Persistence.PersistentDictType = dict()
+                    for property_dict in properties.values():
+                        graphic_properties_dict.update(property_dict)
+                    graphic.read_properties_from_dict(graphic_properties_dict)
+
+    def _merge(self, command: Undo.UndoableCommand) -> None:
+        # properties first changed by the merged command have the same stored value before this command.
+        assert isinstance(command, ChangeGraphicsCommand)
+        graphic_properties = self.__get_graphic_properties()
+        for properties, command_properties in zip(graphic_properties, command.__get_graphic_properties()):
+            for name, property_dict in command_properties.items():
+                if name not in properties:
+                    properties[name] = property_dict
+                    self._update_memory_size()
+
+    def _spill(self, snapshot_store: Changes.UndoSnapshotStore) -> None:
+        if not isinstance(self.__graphic_properties, Changes.StoredSnapshot):
+            self.__graphic_properties = snapshot_store.store(self.__graphic_properties)
 
     def can_merge(self, command: Undo.UndoableCommand) -> bool:
         return isinstance(command, ChangeGraphicsCommand) and bool(self.command_id) and self.command_id == command.command_id and self.__display_item_proxy.item == command.__display_item_proxy.item and self.__graphic_indexes == command.__graphic_indexes
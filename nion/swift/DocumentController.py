@@ -256,7 +256,7 @@ class DocumentController(Window.Window):
         self.__project_reference = project_reference
         self.__class__.count += 1
 
-        self.__undo_stack = Undo.UndoStack()
+        self.__undo_stack = Undo.UndoStack(memory_budget=512 * 1024 * 1024, spill_size=16 * 1024 * 1024)
 
         self.__closed = False  # debugging
 
@@ -6,7 +6,6 @@ import typing
 
 # third party libraries
 import numpy
-import scipy.stats
 
 # local libraries
 from nion.data import Calibration
@@ -208,6 +207,7 @@ class GenerateDataDialog(Declarative.WindowHandler):
             data = dr.data
             if data is not None:
                 if datum_rank == 1:
+                    import scipy.stats  # slow to import; import on first use.
                     n = scipy.stats.norm()
                     length = data.shape[-1]
                     data[..., :] = n.pdf(numpy.linspace(n.ppf(1.0 / length), n.ppf(1.0 - 1.0 / length), length))
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 # standard libraries
 import asyncio
+import concurrent.futures
 import dataclasses
 import functools
 import gettext
+import math
 import operator
+import os
 import threading
 import typing
 import weakref
@@ -21,6 +24,7 @@ from nion.data import Image
 from nion.swift import Panel
 from nion.swift.model import DisplayItem
 from nion.swift.model import Graphics
+from nion.swift.model import Symbolic
 from nion.ui import CanvasItem
 from nion.ui import DrawingContext
 from nion.ui import Widgets
@@ -478,7 +482,7 @@ class HistogramWidget(Widgets.CompositeWidgetBase):
 class StatisticsWidget(Widgets.CompositeWidgetBase):
 
     def __init__(self, ui: UserInterface.UserInterface, statistics_model: Model.PropertyModel[typing.Dict[str, str]]) -> None:
-        content_widget = ui.create_column_widget(properties={"min-height": 18 * 3, "max-height": 18 * 3})
+        content_widget = ui.create_column_widget(properties={"min-height": 18 * 3, "max-height": 18 * 4})
         super().__init__(content_widget)
 
         # create property models for the UI
@@ -530,11 +534,46 @@ class StatisticsWidget(Widgets.CompositeWidgetBase):
         super().close()
 
 
+def get_region_mask(graphic: Graphics.Graphic, data_shape: DataAndMetadata.ShapeType) -> typing.Tuple[typing.Tuple[slice, ...], _NDArray]:
+    """Return the bounding box slices and the boolean mask within the bounding box of the region graphic.
+
+    The mask is rasterized once per graphic modified count and data shape and kept in the shared mask cache; the region
+    data of each frame is then gathered from the bounding box of the mask only.
+    """
+    def make_mask() -> typing.Tuple[typing.Tuple[slice, ...], _NDArray]:
+        mask = numpy.asarray(graphic.get_mask(tuple(data_shape))) != 0
+        rows = numpy.flatnonzero(mask.any(axis=1))
+        columns = numpy.flatnonzero(mask.any(axis=0))
+        if rows.size > 0 and columns.size > 0:
+            slices = (slice(int(rows[0]), int(rows[-1]) + 1), slice(int(columns[0]), int(columns[-1]) + 1))
+        else:
+            slices = (slice(0, 0), slice(0, 0))
+        return slices, numpy.ascontiguousarray(mask[slices])
+
+    return Symbolic.mask_cache.get_mask((graphic.uuid, graphic.modified_count, tuple(data_shape)), make_mask)
+
+
+def is_masked_region(region: Graphics.Graphic) -> bool:
+    """Return whether the statistics of the region are calculated from its mask rather than its bounds."""
+    if isinstance(region, Graphics.RectangleGraphic):
+        return region.rotation != 0.0
+    return isinstance(region, (Graphics.EllipseGraphic, Graphics.RingGraphic, Graphics.SpotGraphic, Graphics.WedgeGraphic))
+
+
 # Python 3.9+: weakref typing
 def calculate_region_data(display_data_and_metadata_ref: typing.Any, region_ref: typing.Any) -> typing.Optional[DataAndMetadata.DataAndMetadata]:
+    """Return the display data within the region.
+
+    Masked regions (see is_masked_region) on 2d data return the 1d data of the pixels within the mask.
+    """
     display_data_and_metadata = typing.cast(typing.Optional[DataAndMetadata.DataAndMetadata], display_data_and_metadata_ref() if display_data_and_metadata_ref else None)
     region = typing.cast(typing.Optional[Graphics.Graphic], region_ref() if region_ref else None)
     if region and display_data_and_metadata:
+        if display_data_and_metadata.is_data_2d and is_masked_region(region):
+            display_data = display_data_and_metadata.data
+            if display_data is not None:
+                slices, mask = get_region_mask(region, display_data_and_metadata.data_shape)
+                return DataAndMetadata.new_data_and_metadata(display_data[slices][mask], intensity_calibration=display_data_and_metadata.intensity_calibration)
         if display_data_and_metadata.is_data_1d and isinstance(region, Graphics.IntervalGraphic):
             interval = region.interval
             if 0 <= interval[0] < 1 and 0 < interval[1] <= 1:
@@ -550,19 +589,16 @@ def calculate_region_data(display_data_and_metadata_ref: typing.Any, region_ref:
     return display_data_and_metadata
 
 
-def calculate_histogram_widget_data(display_data_and_metadata: typing.Optional[DataAndMetadata.DataAndMetadata], display_range: typing.Optional[typing.Tuple[float, float]]) -> HistogramWidgetData:
+def calculate_histogram_widget_data(display_data_and_metadata: typing.Optional[DataAndMetadata.DataAndMetadata], display_range: typing.Optional[typing.Tuple[float, float]], subsample: typing.Optional[int] = None) -> HistogramWidgetData:
+    """Calculate the histogram widget data, from a subsample of about subsample values if specified."""
     bins = 320
-    subsample = 0  # hard coded subsample size
-    subsample_fraction = None  # fraction of total pixels
-    subsample_min = 1024  # minimum subsample size
     display_data = display_data_and_metadata.data if display_data_and_metadata else None
     display_data_and_metadata = None  # release ref for gc. needed for tests, because this may occur on a thread.
     if display_data is not None:
-        total_pixels = numpy.prod(display_data.shape, dtype=numpy.uint64)
-        if not subsample and subsample_fraction:
-            subsample = min(max(total_pixels * subsample_fraction, subsample_min), total_pixels)
-        if subsample:
-            data_sample = numpy.random.choice(display_data.reshape(numpy.prod(display_data.shape, dtype=numpy.uint64)), subsample)
+        if subsample and display_data.size > subsample:
+            # a strided view samples a regular grid of the data without copying it.
+            step = max(1, int(math.ceil((display_data.size / subsample) ** (1 / display_data.ndim))))
+            data_sample = display_data[tuple(slice(None, None, step) for _ in display_data.shape)]
         else:
             data_sample = numpy.copy(display_data)
         if display_range is None or data_sample is None:
@@ -592,15 +628,30 @@ def calculate_statistics(display_data_and_metadata: typing.Optional[DataAndMetad
     display_data_and_metadata = None  # release ref for gc. needed for tests, because this may occur on a thread.
     data_range = display_data_range
     if data is not None and data.size > 0 and displayed_intensity_calibration:
-        mean = numpy.mean(data).item()
-        std = numpy.std(data).item()
-        rms = numpy.sqrt(numpy.mean(numpy.square(numpy.absolute(data)))).item()
+        # non-finite values (dead or hot pixels) are counted and excluded from the other statistics.
+        nan_count = 0
+        inf_count = 0
+        if numpy.issubdtype(data.dtype, numpy.floating):
+            finite_mask = numpy.isfinite(data)
+            finite_count = int(numpy.count_nonzero(finite_mask))
+            if finite_count < data.size:
+                nan_count = int(numpy.count_nonzero(numpy.isnan(data)))
+                inf_count = data.size - finite_count - nan_count
+                data = data[finite_mask]
+        if data.size > 0:
+            mean = numpy.mean(data).item()
+            std = numpy.std(data).item()
+            rms = numpy.sqrt(numpy.mean(numpy.square(numpy.absolute(data)))).item()
+        else:
+            mean = std = rms = 0.0
         dimensional_shape = Image.dimensional_shape_from_shape_and_dtype(data.shape, data.dtype) or (1, 1)
         sum_data = mean * functools.reduce(operator.mul, dimensional_shape)
         if region is None:
             data_min, data_max = data_range if data_range is not None else (None, None)
-        else:
+        elif data.size > 0:
             data_min, data_max = numpy.amin(data), numpy.amax(data)
+        else:
+            data_min, data_max = None, None
         mean_str = displayed_intensity_calibration.convert_to_calibrated_value_str(mean)
         std_str = displayed_intensity_calibration.convert_to_calibrated_value_str(std)
         data_min_str = displayed_intensity_calibration.convert_to_calibrated_value_str(data_min) if data_min is not None else str()
@@ -608,7 +659,12 @@ def calculate_statistics(display_data_and_metadata: typing.Optional[DataAndMetad
         rms_str = displayed_intensity_calibration.convert_to_calibrated_value_str(rms)
         sum_data_str = displayed_intensity_calibration.convert_to_calibrated_value_str(sum_data)
 
-        return { "mean": mean_str, "std": std_str, "min": data_min_str, "max": data_max_str, "rms": rms_str, "sum": sum_data_str }
+        statistics = { "mean": mean_str, "std": std_str, "min": data_min_str, "max": data_max_str, "rms": rms_str, "sum": sum_data_str }
+        if nan_count:
+            statistics["nan"] = str(nan_count)
+        if inf_count:
+            statistics["inf"] = str(inf_count)
+        return statistics
     return dict()
 
 
@@ -624,7 +680,18 @@ class PropertySetter(typing.Generic[T]):
 
 
 class HistogramProcessor(Observable.Observable):
-    """Computes a histogram and statistics."""
+    """Computes a histogram and statistics.
+
+    The work of all processors runs on a shared, bounded pool with at most one task per processor. Each input change
+    increments a generation; a task abandons its results when the generation changes and runs again with the latest
+    inputs. Large data is first histogrammed from a subsample so that an approximate histogram is shown quickly, then
+    refined to the exact histogram.
+    """
+
+    _executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 2), thread_name_prefix="histogram")
+
+    # data larger than this is first histogrammed from a subsample of about this size.
+    subsample_size = 256 * 1024
 
     def __init__(self, event_loop: typing.Optional[asyncio.AbstractEventLoop] = None) -> None:
         super().__init__()
@@ -638,58 +705,75 @@ class HistogramProcessor(Observable.Observable):
         self.__display_data_range: typing.Optional[typing.Tuple[float, float]] = None
         self.__displayed_intensity_calibration: typing.Optional[Calibration.Calibration] = None
         # these fields are used for computation.
+        self.__generation = 0
         self.__histogram_widget_data_dirty = False
         self.__statistics_dirty = False
         self.__region_data_and_metadata: typing.Optional[DataAndMetadata.DataAndMetadata] = None
+        self.__future: typing.Optional[concurrent.futures.Future[None]] = None
+        self.__closed = False
         # these fields are used for outputs.
         self.__histogram_widget_data = HistogramWidgetData()
         self.__statistics: _StatisticsTable = dict()
 
         self.__event_loop = event_loop
-        self.__cancel = threading.Event()
-        self.__event = threading.Event()
         self.__handle_lock = threading.RLock()
         self.__handle: typing.Optional[asyncio.Handle] = None
-        self.__thread = threading.Thread(target=self.__run)
-        self.__thread.start()
+        self.__notify_histogram_widget_data = False
+        self.__notify_statistics = False
 
     def close(self) -> None:
+        with self.__lock:
+            self.__closed = True
+            self.__generation += 1
+            future = self.__future
         with self.__handle_lock:
             if self.__handle:
                 self.__handle.cancel()
-        self.__cancel.set()
-        self.__event.set()
-        self.__thread.join(1.0)
-        self._thread = None
+                self.__handle = None
+        if future:
+            concurrent.futures.wait([future], timeout=1.0)
+
+    def __invalidate(self, histogram_widget_data: bool, statistics: bool) -> None:
+        # call with lock held.
+        self.__generation += 1
+        self.__histogram_widget_data_dirty = self.__histogram_widget_data_dirty or histogram_widget_data
+        self.__statistics_dirty = self.__statistics_dirty or statistics
+
+    def __schedule(self) -> None:
+        with self.__lock:
+            # a task already scheduled or running will run again with the latest inputs.
+            if self.__closed or self.__future:
+                return
+            self.__future = HistogramProcessor._executor.submit(self.__run)
 
     def __run(self) -> None:
-        while not self.__cancel.is_set():
-            if self.__event.wait(0.05):  # frequency to check for cancel
-                self.__event.clear()
-                if self.__cancel.wait(0.25):  # frequency to wait between updates
-                    break
-                with Process.audit("histogram"):
-                    old_histogram_widget_data = self.__histogram_widget_data
-                    old_statistics = self.__statistics
-                    self.__evaluate()
-                    notify_data = old_histogram_widget_data != self.__histogram_widget_data
-                    notify_statistics = old_statistics != self.__statistics
-
-                    def notify() -> None:
-                        with Process.audit("histogram-notify"):
-                            if notify_data:
-                                self.notify_property_changed("histogram_widget_data")
-                            if notify_statistics:
-                                self.notify_property_changed("statistics")
-                            with self.__handle_lock:
-                                self.__handle = None
-
-                    if notify_data or notify_statistics:
-                        with self.__handle_lock:
-                            if self.__handle:
-                                self.__handle.cancel()
-                                self.__handle = None
-                            self.__handle = self.__event_loop.call_soon_threadsafe(notify)
+        with Process.audit("histogram"):
+            self.__evaluate(progressive=True, notify=True)
+        with self.__lock:
+            self.__future = None
+            is_dirty = self.__histogram_widget_data_dirty or self.__statistics_dirty
+        if is_dirty:
+            self.__schedule()
+
+    def __notify_threadsafe(self, notify_histogram_widget_data: bool, notify_statistics: bool) -> None:
+        def notify() -> None:
+            with self.__handle_lock:
+                notify_histogram_widget_data = self.__notify_histogram_widget_data
+                notify_statistics = self.__notify_statistics
+                self.__notify_histogram_widget_data = False
+                self.__notify_statistics = False
+                self.__handle = None
+            with Process.audit("histogram-notify"):
+                if notify_histogram_widget_data:
+                    self.notify_property_changed("histogram_widget_data")
+                if notify_statistics:
+                    self.notify_property_changed("statistics")
+
+        with self.__handle_lock:
+            self.__notify_histogram_widget_data = self.__notify_histogram_widget_data or notify_histogram_widget_data
+            self.__notify_statistics = self.__notify_statistics or notify_statistics
+            if not self.__handle and not self.__closed:
+                self.__handle = self.__event_loop.call_soon_threadsafe(notify)
 
     # inputs
 
@@ -702,9 +786,8 @@ class HistogramProcessor(Observable.Observable):
         with self.__lock:
             self.__display_data_and_metadata = value
             self.__region_data_and_metadata = None
-            self.__histogram_widget_data_dirty = True
-            self.__statistics_dirty = True
-        self.__event.set()
+            self.__invalidate(True, True)
+        self.__schedule()
 
     @property
     def region(self) -> typing.Optional[Graphics.Graphic]:
@@ -715,9 +798,8 @@ class HistogramProcessor(Observable.Observable):
         with self.__lock:
             self.__region = value
             self.__region_data_and_metadata = None
-            self.__histogram_widget_data_dirty = True
-            self.__statistics_dirty = True
-        self.__event.set()
+            self.__invalidate(True, True)
+        self.__schedule()
 
     @property
     def display_range(self) -> typing.Optional[typing.Tuple[float, float]]:
@@ -727,8 +809,8 @@ class HistogramProcessor(Observable.Observable):
     def display_range(self, value: typing.Optional[typing.Tuple[float, float]]) -> None:
         with self.__lock:
             self.__display_range = value
-            self.__histogram_widget_data_dirty = True
-        self.__event.set()
+            self.__invalidate(True, False)
+        self.__schedule()
 
     @property
     def display_data_range(self) -> typing.Optional[typing.Tuple[float, float]]:
@@ -738,8 +820,8 @@ class HistogramProcessor(Observable.Observable):
     def display_data_range(self, value: typing.Optional[typing.Tuple[float, float]]) -> None:
         with self.__lock:
             self.__display_data_range = value
-            self.__statistics_dirty = True
-        self.__event.set()
+            self.__invalidate(False, True)
+        self.__schedule()
 
     @property
     def displayed_intensity_calibration(self) -> typing.Optional[Calibration.Calibration]:
@@ -749,8 +831,8 @@ class HistogramProcessor(Observable.Observable):
     def displayed_intensity_calibration(self, value: typing.Optional[Calibration.Calibration]) -> None:
         with self.__lock:
             self.__displayed_intensity_calibration = value
-            self.__statistics_dirty = True
-        self.__event.set()
+            self.__invalidate(False, True)
+        self.__schedule()
 
     # outputs
 
@@ -772,35 +854,57 @@ class HistogramProcessor(Observable.Observable):
 
     # private methods
 
-    def __evaluate(self) -> None:
-        try:
+    def __evaluate(self, *, progressive: bool = False, notify: bool = False) -> None:
+        with self.__lock:
+            generation = self.__generation
+            display_data_and_metadata = self.__display_data_and_metadata
+            region = self.__region
+            display_range = self.__display_range
+            display_data_range = self.__display_data_range
+            displayed_intensity_calibration = self.__displayed_intensity_calibration
+            region_data_and_metadata = self.__region_data_and_metadata
+            histogram_widget_data_dirty = self.__histogram_widget_data_dirty
+            statistics_dirty = self.__statistics_dirty
+            self.__histogram_widget_data_dirty = False
+            self.__statistics_dirty = False
+
+        def publish(histogram_widget_data: typing.Optional[HistogramWidgetData] = None, statistics: typing.Optional[_StatisticsTable] = None) -> bool:
+            # store the results unless the inputs changed, in which case the results are stale and the remaining work
+            # is left for the next run.
             with self.__lock:
-                display_data_and_metadata = self.__display_data_and_metadata
-                region = self.__region
-                display_range = self.__display_range
-                display_data_range = self.__display_data_range
-                displayed_intensity_calibration = self.__displayed_intensity_calibration
-                region_data_and_metadata = self.__region_data_and_metadata
-                histogram_widget_data_dirty = self.__histogram_widget_data_dirty
-                statistics_dirty = self.__statistics_dirty
-                histogram_widget_data = self.__histogram_widget_data
-                statistics = self.__statistics
-                self.__histogram_widget_data_dirty = False
-                self.__statistics_dirty = False
+                if generation != self.__generation:
+                    self.__histogram_widget_data_dirty = self.__histogram_widget_data_dirty or histogram_widget_data_dirty
+                    self.__statistics_dirty = self.__statistics_dirty or statistics_dirty
+                    return False
+                notify_histogram_widget_data = histogram_widget_data is not None and histogram_widget_data != self.__histogram_widget_data
+                notify_statistics = statistics is not None and statistics != self.__statistics
+                if histogram_widget_data is not None:
+                    self.__histogram_widget_data = histogram_widget_data
+                if statistics is not None:
+                    self.__statistics = statistics
+            if notify and (notify_histogram_widget_data or notify_statistics):
+                self.__notify_threadsafe(notify_histogram_widget_data, notify_statistics)
+            return True
+
+        try:
             if not region_data_and_metadata:
                 region_data_and_metadata = calculate_region_data(
                     weakref.ref(display_data_and_metadata) if display_data_and_metadata else None,
                     weakref.ref(region) if region else None
                 )
+                with self.__lock:
+                    if self.__display_data_and_metadata is display_data_and_metadata and self.__region is region:
+                        self.__region_data_and_metadata = region_data_and_metadata
             if histogram_widget_data_dirty:
-                histogram_widget_data = calculate_histogram_widget_data(region_data_and_metadata, display_range)
+                data_size = region_data_and_metadata.data.size if region_data_and_metadata and region_data_and_metadata.data is not None else 0
+                if progressive and data_size > self.subsample_size:
+                    if not publish(histogram_widget_data=calculate_histogram_widget_data(region_data_and_metadata, display_range, self.subsample_size)):
+                        return
+                if not publish(histogram_widget_data=calculate_histogram_widget_data(region_data_and_metadata, display_range)):
+                    return
+                histogram_widget_data_dirty = False
             if statistics_dirty:
-                statistics = calculate_statistics(region_data_and_metadata, display_data_range, region, displayed_intensity_calibration)
-            with self.__lock:
-                if not self.__histogram_widget_data_dirty and not self.__statistics_dirty:
-                    self.__region_data_and_metadata = region_data_and_metadata
-                self.__histogram_widget_data = histogram_widget_data
-                self.__statistics = statistics
+                publish(statistics=calculate_statistics(region_data_and_metadata, display_data_range, region, displayed_intensity_calibration))
         except Exception as e:
             import traceback
             traceback.print_exc()
@@ -808,6 +912,10 @@ class HistogramProcessor(Observable.Observable):
     # test methods
 
     def _evaluate_immediate(self) -> None:
+        # a run in progress may have taken the dirty state already, so invalidate everything to evaluate it here. the
+        # results of the run in progress become stale and are not published.
+        with self.__lock:
+            self.__invalidate(True, True)
         self.__evaluate()
         self.notify_property_changed("histogram_widget_data")
         self.notify_property_changed("statistics")
@@ -19,11 +19,13 @@ import numpy
 from nion.data import Calibration
 from nion.data import DataAndMetadata
 from nion.swift import DisplayCanvasItem
+from nion.swift.model import ColorMaps
 from nion.swift.model import DisplayItem
 from nion.swift.model import Graphics
 from nion.swift.model import UISettings
 from nion.swift.model import Utility
 from nion.ui import CanvasItem
+from nion.ui import DrawingContext
 from nion.utils import Geometry
 from nion.utils import Model
 from nion.utils import Registry
@@ -32,7 +34,6 @@ from nion.utils import ReferenceCounting
 
 if typing.TYPE_CHECKING:
     from nion.swift.model import Persistence
-    from nion.ui import DrawingContext
     from nion.ui import UserInterface
 
 
@@ -148,11 +149,45 @@ class ImageCanvasItemMapping(Graphics.CoordinateMappingLike):
         raise NotImplementedError()
 
 
+class GraphicDrawingCache:
+    """Cache the drawing commands of each graphic.
+
+    The drawing commands of a graphic are keyed by its modified count and the state it was drawn with (widget mapping,
+    selection, focus). Graphics which are unchanged since the last repaint re-emit their cached drawing commands instead
+    of drawing again.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.RLock()
+        self.__drawing_contexts: typing.Dict[uuid.UUID, typing.Tuple[typing.Any, DrawingContext.DrawingContext]] = dict()
+        self.draw_count = 0  # for testing
+
+    def get_drawing_context(self, graphic: Graphics.Graphic, key: typing.Any, draw_fn: typing.Callable[[DrawingContext.DrawingContext], None]) -> DrawingContext.DrawingContext:
+        key = (graphic.modified_count, key)
+        with self.__lock:
+            key_and_drawing_context = self.__drawing_contexts.get(graphic.uuid)
+            if key_and_drawing_context and key_and_drawing_context[0] == key:
+                return key_and_drawing_context[1]
+        drawing_context = DrawingContext.DrawingContext()
+        draw_fn(drawing_context)
+        with self.__lock:
+            self.__drawing_contexts[graphic.uuid] = key, drawing_context
+            self.draw_count += 1
+        return drawing_context
+
+    def prune(self, graphics: typing.Sequence[Graphics.Graphic]) -> None:
+        """Remove the drawing commands of graphics no longer in graphics."""
+        graphic_uuids = {graphic.uuid for graphic in graphics}
+        with self.__lock:
+            for graphic_uuid in set(self.__drawing_contexts.keys()) - graphic_uuids:
+                self.__drawing_contexts.pop(graphic_uuid)
+
+
 class GraphicsCanvasItemComposer(CanvasItem.BaseComposer):
     def __init__(self, canvas_item: CanvasItem.AbstractCanvasItem, layout_sizing: CanvasItem.Sizing, cache: CanvasItem.ComposerCache,
                  ui_settings: UISettings.UISettings, graphics: typing.List[Graphics.Graphic], graphic_selection: DisplayItem.GraphicSelection,
                  displayed_shape: typing.Optional[DataAndMetadata.ShapeType], coordinate_system: typing.List[Calibration.Calibration],
-                 is_focused: bool) -> None:
+                 is_focused: bool, graphic_drawing_cache: GraphicDrawingCache) -> None:
         super().__init__(canvas_item, layout_sizing, cache)
         self.__ui_settings = ui_settings
         self.__graphics = graphics
@@ -160,6 +195,7 @@ class GraphicsCanvasItemComposer(CanvasItem.BaseComposer):
         self.__displayed_shape = displayed_shape
         self.__coordinate_system = coordinate_system
         self.__is_focused = is_focused
+        self.__graphic_drawing_cache = graphic_drawing_cache
 
     def _repaint(self, drawing_context: DrawingContext.DrawingContext, canvas_bounds: Geometry.IntRect, composer_cache: CanvasItem.ComposerCache) -> None:
         ui_settings = self.__ui_settings
@@ -168,14 +204,23 @@ class GraphicsCanvasItemComposer(CanvasItem.BaseComposer):
         displayed_shape = self.__displayed_shape
         coordinate_system = self.__coordinate_system
         is_focused = self.__is_focused
+        graphic_drawing_cache = self.__graphic_drawing_cache
         widget_mapping = ImageCanvasItemMapping.make(displayed_shape, canvas_bounds, coordinate_system)
+        graphic_drawing_cache.prune(graphics)
         if graphics and widget_mapping:
+            # the widget mapping is determined by the displayed shape, canvas bounds, and coordinate system.
+            drawing_key = (tuple(displayed_shape or tuple()), canvas_bounds, tuple(coordinate_system), is_focused)
             with drawing_context.saver():
                 drawing_context.translate(canvas_bounds.left, canvas_bounds.top)
                 for graphic_index, graphic in enumerate(graphics):
                     if graphic.has_attribute(Graphics.GraphicAttributeEnum.TWO_DIMENSIONAL):
+                        is_selected = graphic_selection.contains(graphic_index)
+
+                        def draw_graphic(graphic_drawing_context: DrawingContext.DrawingContext) -> None:
+                            graphic.draw(graphic_drawing_context, ui_settings, widget_mapping, is_selected, is_focused)
+
                         try:
-                            graphic.draw(drawing_context, ui_settings, widget_mapping, graphic_selection.contains(graphic_index), is_focused)
+                            drawing_context.add(graphic_drawing_cache.get_drawing_context(graphic, (drawing_key, is_selected), draw_graphic))
                         except Exception as e:
                             import traceback
                             logging.debug("Graphic Repaint Error: %s", e)
@@ -186,7 +231,8 @@ class GraphicsCanvasItemComposer(CanvasItem.BaseComposer):
 class GraphicsCanvasItem(CanvasItem.AbstractCanvasItem):
     """A canvas item to paint the graphic items on the image.
 
-    Callers should call update_graphics when the graphics changes.
+    Callers should call update_graphics when the graphics changes. The drawing commands of each graphic are cached so
+    that only the graphics which changed are drawn again when repainting.
     """
 
     def __init__(self, ui_settings: UISettings.UISettings) -> None:
@@ -198,6 +244,7 @@ class GraphicsCanvasItem(CanvasItem.AbstractCanvasItem):
         self.__graphic_selection = DisplayItem.GraphicSelection()
         self.__coordinate_system: typing.List[Calibration.Calibration] = list()
         self.__is_focused = False
+        self.__graphic_drawing_cache = GraphicDrawingCache()
 
     @property
     def is_focused(self) -> bool:
@@ -232,8 +279,12 @@ class GraphicsCanvasItem(CanvasItem.AbstractCanvasItem):
         if needs_update:
             self.update()
 
+    @property
+    def graphic_drawing_cache(self) -> GraphicDrawingCache:
+        return self.__graphic_drawing_cache
+
     def _get_composer(self, composer_cache: CanvasItem.ComposerCache) -> typing.Optional[CanvasItem.BaseComposer]:
-        return GraphicsCanvasItemComposer(self, self.sizing, composer_cache, self.__ui_settings, self.__graphics, self.__graphic_selection, self.__displayed_shape, self.__coordinate_system, self.__is_focused)
+        return GraphicsCanvasItemComposer(self, self.sizing, composer_cache, self.__ui_settings, self.__graphics, self.__graphic_selection, self.__displayed_shape, self.__coordinate_system, self.__is_focused, self.__graphic_drawing_cache)
 
 
 class ScaleMarkerCanvasItemComposer(CanvasItem.BaseComposer):
@@ -759,6 +810,7 @@ class PointerMouseHandler(MouseHandler):
         graphic_drag_indexes = set()
 
         graphics = image_canvas_item.graphics
+        candidate_indexes = image_canvas_item.get_graphic_hit_test_candidate_indexes(start_drag_pos)
         selection_indexes = image_canvas_item.graphic_selection.indexes
         multiple_items_selected = len(selection_indexes) > 1
         part_specs: typing.List[typing.Tuple[int, Graphics.Graphic, bool, str]] = list()
@@ -767,7 +819,9 @@ class PointerMouseHandler(MouseHandler):
         # the graphics are drawn in order, which means the graphics with the higher index are "on top" of the
         # graphics with the lower index. but priority should also be given to selected graphics. so sort the
         # graphics according to whether they are selected or not (selected ones go later), then by their index.
-        for graphic_index, graphic in sorted(enumerate(graphics), key=lambda ig: (ig[0] in selection_indexes, ig[0])):
+        # only the graphics near the mouse position in the hit test index are tested.
+        for graphic_index in sorted(candidate_indexes, key=lambda i: (i in selection_indexes, i)):
+            graphic = graphics[graphic_index]
             if graphic.has_attribute(Graphics.GraphicAttributeEnum.TWO_DIMENSIONAL):
                 already_selected = graphic_index in selection_indexes
                 move_only = not already_selected or multiple_items_selected
@@ -815,7 +869,9 @@ class PointerMouseHandler(MouseHandler):
             delegate.clear_selection()
 
         def get_pointer_tool_shape(mouse_pos: Geometry.FloatPoint) -> str:
-            for graphic in graphics:
+            graphics = image_canvas_item.graphics
+            for graphic_index in sorted(image_canvas_item.get_graphic_hit_test_candidate_indexes(mouse_pos)):
+                graphic = graphics[graphic_index]
                 if isinstance(graphic, (Graphics.RectangleTypeGraphic, Graphics.SpotGraphic)):
                     part, specific = graphic.test(image_canvas_item.mouse_mapping, image_canvas_item.ui_settings, mouse_pos, False)
                     if part and part.endswith("rotate"):
@@ -1133,14 +1189,8 @@ class DisplayValueProcessor:
         if display_data and display_data.data_dtype == numpy.float32:
             display_range = display_values.transformed_display_range
             color_map_data = display_values.color_map_data
-            color_map_rgba: typing.Optional[DrawingContext.RGBA32Type]
-            if color_map_data is not None:
-                color_map_rgba = numpy.empty(color_map_data.shape[:-1] + (4,), numpy.uint8)
-                color_map_rgba[..., 0:3] = color_map_data
-                color_map_rgba[..., 3] = 255
-                color_map_rgba = color_map_rgba.view(numpy.uint32).reshape(color_map_rgba.shape[:-1])
-            else:
-                color_map_rgba = None
+            # the packed color map table is shared and read-only; it is not allocated per frame.
+            color_map_rgba = ColorMaps.get_color_map_rgba(color_map_data) if color_map_data is not None else None
             # the canvas item expects a ndarray. since the data is being accessed directly here, it could
             # be an array compatible that might be deleted (e.g. a hdf5 dataset). so convert it to a numpy
             # if not already.
@@ -1245,6 +1295,7 @@ class ImageCanvasItem(DisplayCanvasItem.DisplayCanvasItem):
         self.__data_shape: typing.Optional[DataAndMetadata.Shape2dType] = None
         self.__coordinate_system: typing.List[Calibration.Calibration] = list()
         self.__graphics: typing.List[Graphics.Graphic] = list()
+        self.__graphics_hit_test_index = Graphics.GraphicHitTestIndex()
         self.__graphic_selection: DisplayItem.GraphicSelection = DisplayItem.GraphicSelection()
 
         # used for dragging graphic items
@@ -1356,6 +1407,7 @@ class ImageCanvasItem(DisplayCanvasItem.DisplayCanvasItem):
 
     def __update_graphics_coordinate_system(self, graphics: typing.Sequence[Graphics.Graphic], graphic_selection: DisplayItem.GraphicSelection, display_calibration_info: DisplayItem.DisplayCalibrationInfo) -> None:
         self.__graphics = list(graphics)
+        self.__graphics_hit_test_index.update(self.__graphics)
         self.__graphic_selection = copy.copy(graphic_selection)
         self.__graphics_canvas_item.update_coordinate_system(display_calibration_info.display_data_shape, display_calibration_info.datum_calibrations, self.__graphics, self.__graphic_selection)
 
@@ -1402,6 +1454,17 @@ class ImageCanvasItem(DisplayCanvasItem.DisplayCanvasItem):
     def graphic_index(self, graphic: Graphics.Graphic) -> int:
         return self.__graphics.index(graphic)
 
+    def get_graphic_hit_test_candidate_indexes(self, mouse_pos: Geometry.FloatPoint) -> typing.Set[int]:
+        """Return the indexes of the graphics that may be hit at the mouse position (widget coordinates)."""
+        widget_mapping = ImageCanvasItemMapping.make(self.__data_shape, self.__composite_canvas_item.canvas_rect, self.__coordinate_system)
+        if not widget_mapping or not widget_mapping.canvas_rect.height or not widget_mapping.canvas_rect.width:
+            return set(range(len(self.__graphics)))
+        margin = self.ui_settings.cursor_tolerance + Graphics.HIT_TEST_WIDGET_MARGIN
+        p1 = widget_mapping.map_point_widget_to_image_norm(mouse_pos - Geometry.FloatSize(margin, margin))
+        p2 = widget_mapping.map_point_widget_to_image_norm(mouse_pos + Geometry.FloatSize(margin, margin))
+        rect = Geometry.FloatRect.from_tlbr(min(p1.y, p2.y), min(p1.x, p2.x), max(p1.y, p2.y), max(p1.x, p2.x))
+        return self.__graphics_hit_test_index.get_candidate_indexes(rect)
+
     @property
     def graphic_selection(self) -> DisplayItem.GraphicSelection:
         return self.__graphic_selection
@@ -1686,6 +1749,10 @@ class ImageCanvasItem(DisplayCanvasItem.DisplayCanvasItem):
     def _bitmap_canvas_item(self) -> CanvasItem.BitmapCanvasItem:
         return self.__bitmap_canvas_item
 
+    @property
+    def _graphics_canvas_item(self) -> GraphicsCanvasItem:
+        return self.__graphics_canvas_item
+
     @property
     def _display_values(self) -> typing.Optional[DisplayItem.DisplayValues]:
         return self.__display_values
@@ -2205,6 +2205,7 @@ class LinePlotDisplaySectionHandler(Declarative.Handler):
         self._left_channel_model = DisplayItemDisplayPropertyCommandModel(document_controller, display_item, "left_channel")
         self._right_channel_model = DisplayItemDisplayPropertyCommandModel(document_controller, display_item, "right_channel")
         self._y_style_model = DisplayItemDisplayPropertyCommandModel(document_controller, display_item, "y_style")
+        self._y_autoscale_model = DisplayItemDisplayPropertyCommandModel(document_controller, display_item, "y_autoscale")
 
         self._float_to_string_converter = BetterFloatToStringConverter(pass_none=True)
 
@@ -2221,6 +2222,17 @@ class LinePlotDisplaySectionHandler(Declarative.Handler):
 
         self._log_checked_to_check_state_converter = LogCheckedToCheckStateConverter()
 
+        class VisibleCheckedToCheckStateConverter(Converter.ConverterLike[str, bool]):
+            """ Convert between bool and visible/unset autoscale strings. """
+
+            def convert(self, value: typing.Optional[str]) -> typing.Optional[bool]:
+                return value == "visible"
+
+            def convert_back(self, value: typing.Optional[bool]) -> typing.Optional[str]:
+                return "visible" if value else None
+
+        self._visible_checked_to_check_state_converter = VisibleCheckedToCheckStateConverter()
+
         u = Declarative.DeclarativeUI()
 
         self.ui_view = u.create_column(
@@ -2240,6 +2252,8 @@ class LinePlotDisplaySectionHandler(Declarative.Handler):
             ),
             u.create_row(
                 u.create_check_box(text=_("Log Scale (Y)"), checked="@binding(_y_style_model.value, converter=_log_checked_to_check_state_converter)", name="log_scale_check_box"),
+                u.create_spacing(8),
+                u.create_check_box(text=_("Autoscale Visible (Y)"), checked="@binding(_y_autoscale_model.value, converter=_visible_checked_to_check_state_converter)", name="autoscale_visible_check_box"),
                 u.create_stretch()
             )
         )
@@ -66,6 +66,11 @@ class DataStyle(typing.Protocol):
     @property
     def style_id(self) -> str: ...
 
+    @property
+    def is_min_max_reducible(self) -> bool:
+        """Return whether the min/max calibrated values depend only on the min/max of the uncalibrated data."""
+        ...
+
     def min_calibrated_value_from_uncalibrated(self, uncalibrated_data: _NDArray, intensity_calibration: Calibration.Calibration) -> float: ...
 
     def max_calibrated_value_from_uncalibrated(self, uncalibrated_data: _NDArray, intensity_calibration: Calibration.Calibration) -> float: ...
@@ -85,6 +90,7 @@ class DataStyle(typing.Protocol):
 
 class _LinearStyle(DataStyle):
     style_id = "linear"
+    is_min_max_reducible = True
 
     def min_calibrated_value_from_uncalibrated(self, uncalibrated_data: _NDArray, intensity_calibration: Calibration.Calibration) -> float:
         value_uncal = numpy.amin(uncalibrated_data)
@@ -130,6 +136,7 @@ class _LinearStyle(DataStyle):
 
 class _LogStyle(DataStyle):
     style_id = "log"
+    is_min_max_reducible = False
 
     def min_calibrated_value_from_uncalibrated(self, uncalibrated_data: _NDArray, intensity_calibration: Calibration.Calibration) -> float:
         origin_uncal = intensity_calibration.convert_from_calibrated_value(0.0)
@@ -182,41 +189,132 @@ def _get_data_style(data_style_id: str | None) -> DataStyle:
     return data_style if data_style else _LinearStyle()
 
 
-def calculate_y_axis(xdata_list: typing.Sequence[typing.Optional[DataAndMetadata.DataAndMetadata]], data_min: typing.Optional[float], data_max: typing.Optional[float], data_style_id: str | None) -> typing.Tuple[float, float, Geometry.Ticker]:
+class MinMaxIndex:
+    """A block index of the minimum and maximum of data along its last axis.
+
+    The data is first reduced to the minimum and maximum over all but the last axis. The values are then divided into
+    blocks along the last axis and a sparse table of the block minimums and maximums answers the range of whole blocks
+    in constant time; the partial blocks at the ends of a range are read directly. Building the index is linear in the
+    size of the data and the range of any channel window costs at most two blocks of reading.
+
+    Like numpy.amin/amax, the range includes nan if any value in the window is nan.
+    """
+
+    def __init__(self, data: _NDArray, block_size: int = 256) -> None:
+        data = numpy.asarray(data)
+        if data.ndim > 1:
+            rows = data.reshape((-1, data.shape[-1]))
+            self.__mins = numpy.amin(rows, axis=0) if rows.shape[0] > 0 else numpy.full((data.shape[-1],), numpy.nan)
+            self.__maxs = numpy.amax(rows, axis=0) if rows.shape[0] > 0 else numpy.full((data.shape[-1],), numpy.nan)
+        else:
+            self.__mins = data
+            self.__maxs = data
+        self.__block_size = block_size
+        self.__min_table: typing.List[_NDArray] = list()
+        self.__max_table: typing.List[_NDArray] = list()
+        length = self.__mins.shape[0]
+        if length >= block_size:
+            block_starts = numpy.arange(0, length - length % block_size, block_size)
+            block_mins = numpy.minimum.reduceat(self.__mins[:block_starts[-1] + block_size], block_starts)
+            block_maxs = numpy.maximum.reduceat(self.__maxs[:block_starts[-1] + block_size], block_starts)
+            # level k of the table is the min/max of the 2**k blocks starting at each block.
+            self.__min_table.append(block_mins)
+            self.__max_table.append(block_maxs)
+            block_count = block_mins.shape[0]
+            span = 1
+            while span * 2 <= block_count:
+                block_mins = numpy.minimum(block_mins[:-span], block_mins[span:])
+                block_maxs = numpy.maximum(block_maxs[:-span], block_maxs[span:])
+                self.__min_table.append(block_mins)
+                self.__max_table.append(block_maxs)
+                span *= 2
+
+    @property
+    def length(self) -> int:
+        return typing.cast(int, self.__mins.shape[0])
+
+    def get_range(self, left: int, right: int) -> typing.Optional[typing.Tuple[float, float]]:
+        """Return the minimum and maximum of channels left up to (not including) right, or None if empty."""
+        left = max(0, int(left))
+        right = min(self.length, int(right))
+        if left >= right:
+            return None
+        block_size = self.__block_size
+        block_left = -(-left // block_size)
+        block_right = min(right // block_size, self.__min_table[0].shape[0] if self.__min_table else 0)
+        if block_left < block_right:
+            level = (block_right - block_left).bit_length() - 1
+            span = 1 << level
+            mins = [self.__min_table[level][block_left], self.__min_table[level][block_right - span]]
+            maxs = [self.__max_table[level][block_left], self.__max_table[level][block_right - span]]
+            if left < block_left * block_size:
+                mins.append(numpy.amin(self.__mins[left:block_left * block_size]))
+                maxs.append(numpy.amax(self.__maxs[left:block_left * block_size]))
+            if block_right * block_size < right:
+                mins.append(numpy.amin(self.__mins[block_right * block_size:right]))
+                maxs.append(numpy.amax(self.__maxs[block_right * block_size:right]))
+            return float(numpy.amin(mins)), float(numpy.amax(maxs))
+        return float(numpy.amin(self.__mins[left:right])), float(numpy.amax(self.__maxs[left:right]))
+
+
+def calculate_y_axis(xdata_list: typing.Sequence[typing.Optional[DataAndMetadata.DataAndMetadata]], data_min: typing.Optional[float], data_max: typing.Optional[float], data_style_id: str | None, *,
+                     calibrated_x_range: typing.Optional[typing.Tuple[float, float]] = None,
+                     min_max_indexes: typing.Optional[typing.Sequence[typing.Optional[MinMaxIndex]]] = None) -> typing.Tuple[float, float, Geometry.Ticker]:
     """Calculate the calibrated min/max and y-axis ticker for list of xdata.
 
     xdata_list is the original calibrated data
     data_min and data_max are calibrated values
+
+    calibrated_x_range optionally limits the min/max to the data within the calibrated x-range of each xdata.
+
+    min_max_indexes optionally provides a min/max index for each xdata, used when the data style allows.
     """
     data_style = _get_data_style(data_style_id)
 
     min_specified = data_min is not None
     max_specified = data_max is not None
 
+    # gather the uncalibrated data (or min/max of the data if the data style allows) within the x-range for each xdata.
+    uncalibrated_data_list: typing.List[typing.Tuple[_NDArray, Calibration.Calibration]] = list()
+    if not min_specified or not max_specified:
+        for index, xdata in enumerate(xdata_list):
+            if xdata and xdata.data_shape[-1] > 0 and xdata.intensity_calibration:
+                left, right = 0, xdata.data_shape[-1]
+                if calibrated_x_range is not None:
+                    x_calibration = xdata.dimensional_calibrations[-1]
+                    x1 = x_calibration.convert_from_calibrated_value(calibrated_x_range[0])
+                    x2 = x_calibration.convert_from_calibrated_value(calibrated_x_range[1])
+                    left = max(0, min(right, int(math.floor(min(x1, x2)))))
+                    right = max(0, min(right, int(math.ceil(max(x1, x2)))))
+                    if left >= right:
+                        continue
+                min_max_index = min_max_indexes[index] if min_max_indexes and index < len(min_max_indexes) else None
+                if data_style.is_min_max_reducible and min_max_index and min_max_index.length == xdata.data_shape[-1]:
+                    data_range = min_max_index.get_range(left, right)
+                    if data_range is not None:
+                        uncalibrated_data_list.append((numpy.array(data_range), xdata.intensity_calibration))
+                else:
+                    data = xdata.data if (left, right) == (0, xdata.data_shape[-1]) else xdata.data[..., left:right]
+                    # force the uncalibrated_data to be float so that numpy.amin with a numpy.inf initial value works.
+                    uncalibrated_data = data if numpy.issubdtype(data.dtype, numpy.floating) else data.astype(float)
+                    uncalibrated_data_list.append((uncalibrated_data, xdata.intensity_calibration))
+
     if min_specified:
         calibrated_min = typing.cast(float, data_min)
     else:
         calibrated_min_opt: typing.Optional[float] = None
-        for xdata in xdata_list:
-            if xdata and xdata.data_shape[-1] > 0:
-                # force the uncalibrated_data to be float so that numpy.amin with a numpy.inf initial value works.
-                uncalibrated_data = xdata.data if numpy.issubdtype(xdata.data.dtype, numpy.floating) else xdata.data.astype(float)
-                if uncalibrated_data is not None and xdata.intensity_calibration:
-                    v = data_style.min_calibrated_value_from_uncalibrated(uncalibrated_data, xdata.intensity_calibration)
-                    calibrated_min_opt = v if calibrated_min_opt is None else min(calibrated_min_opt, v)
+        for uncalibrated_data, intensity_calibration in uncalibrated_data_list:
+            v = data_style.min_calibrated_value_from_uncalibrated(uncalibrated_data, intensity_calibration)
+            calibrated_min_opt = v if calibrated_min_opt is None else min(calibrated_min_opt, v)
         calibrated_min = calibrated_min_opt if (calibrated_min_opt is not None and numpy.isfinite(calibrated_min_opt)) else 0.0
 
     if max_specified:
         calibrated_max = typing.cast(float, data_max)
     else:
         calibrated_max_opt: typing.Optional[float] = None
-        for xdata in xdata_list:
-            if xdata and xdata.data_shape[-1] > 0:
-                # force the uncalibrated_data to be float so that numpy.amin with a numpy.inf initial value works.
-                uncalibrated_data = xdata.data if numpy.issubdtype(xdata.data.dtype, numpy.floating) else xdata.data.astype(float)
-                if uncalibrated_data is not None and xdata.intensity_calibration:
-                    v = data_style.max_calibrated_value_from_uncalibrated(uncalibrated_data, xdata.intensity_calibration)
-                    calibrated_max_opt = v if calibrated_max_opt is None else max(calibrated_max_opt, v)
+        for uncalibrated_data, intensity_calibration in uncalibrated_data_list:
+            v = data_style.max_calibrated_value_from_uncalibrated(uncalibrated_data, intensity_calibration)
+            calibrated_max_opt = v if calibrated_max_opt is None else max(calibrated_max_opt, v)
         calibrated_max = calibrated_max_opt if (calibrated_max_opt is not None and numpy.isfinite(calibrated_max_opt)) else 0.0
 
     calibrated_min, calibrated_max = data_style.adjust_calibrated_limits(calibrated_min, calibrated_max, min_specified, max_specified)
@@ -113,20 +113,52 @@ class LinePlotCanvasItemMapping(Graphics.CoordinateMappingLike):
 MAX_LAYER_COUNT = 16
 
 
+class MinMaxIndexCache:
+    """Keep a min/max index of the data for each display values.
+
+    The indexes are keyed by the display values, which are replaced whenever the data changes, and the data timestamp.
+    Zooming and panning do not change either, so the indexes are reused to calculate the y-axis of the visible range.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.RLock()
+        self.__entries: typing.List[typing.Tuple[typing.Optional[DisplayItem.DisplayValues], typing.Any, typing.Optional[LineGraphCanvasItem.MinMaxIndex]]] = list()
+
+    def get_min_max_indexes(self, display_values_list: typing.Sequence[typing.Optional[DisplayItem.DisplayValues]], xdata_list: typing.Sequence[typing.Optional[DataAndMetadata.DataAndMetadata]]) -> typing.List[typing.Optional[LineGraphCanvasItem.MinMaxIndex]]:
+        with self.__lock:
+            old_entries = self.__entries
+            entries = list()
+            for index, (display_values, xdata) in enumerate(zip(display_values_list, xdata_list)):
+                timestamp = xdata.timestamp if xdata else None
+                old_entry = old_entries[index] if index < len(old_entries) else None
+                if old_entry and old_entry[0] is display_values and old_entry[1] == timestamp:
+                    entries.append(old_entry)
+                else:
+                    min_max_index = None
+                    if xdata and xdata.data_shape[-1] > 0 and not xdata.is_data_rgb_type and numpy.issubdtype(xdata.data_dtype, numpy.number) and not numpy.issubdtype(xdata.data_dtype, numpy.complexfloating):
+                        min_max_index = LineGraphCanvasItem.MinMaxIndex(xdata.data)
+                    entries.append((display_values, timestamp, min_max_index))
+            self.__entries = entries
+            return [entry[2] for entry in entries]
+
+
 class LinePlotDisplayInfo:
-    def __init__(self, display_calibration_info: typing.Optional[DisplayItem.DisplayCalibrationInfo], display_properties: Persistence.PersistentDictType, display_values_list: typing.Sequence[typing.Optional[DisplayItem.DisplayValues]], display_layers: typing.Sequence[DisplayItem.DisplayLayerInfo]) -> None:
+    def __init__(self, display_calibration_info: typing.Optional[DisplayItem.DisplayCalibrationInfo], display_properties: Persistence.PersistentDictType, display_values_list: typing.Sequence[typing.Optional[DisplayItem.DisplayValues]], display_layers: typing.Sequence[DisplayItem.DisplayLayerInfo], min_max_index_cache: typing.Optional[MinMaxIndexCache] = None) -> None:
         self.__display_calibration_info = display_calibration_info
         self.__y_min: float | None = display_properties.get("y_min", None)
         self.__y_max: float | None = display_properties.get("y_max", None)
         self.__y_style: str | None = display_properties.get("y_style", "linear")
+        self.__y_autoscale: str | None = display_properties.get("y_autoscale", None)
         self.__left_channel: int | None = display_properties.get("left_channel", None)
         self.__right_channel: int | None = display_properties.get("right_channel", None)
         self.__legend_position: str | None = display_properties.get("legend_position", None)
         self.__display_values_list = list(display_values_list)
         self.__display_layers = list(display_layers)
+        self.__min_max_index_cache = min_max_index_cache or MinMaxIndexCache()
 
         # cached values
         self.__xdata_list: typing.Optional[typing.List[typing.Optional[DataAndMetadata.DataAndMetadata]]] = None
+        self.__min_max_indexes: typing.Optional[typing.List[typing.Optional[LineGraphCanvasItem.MinMaxIndex]]] = None
         self.__axes: typing.Optional[LineGraphCanvasItem.LineGraphAxes] = None
         self.__line_graph_layers: typing.Optional[typing.List[LineGraphCanvasItem.LineGraphLayer]] = None
         self.__legend_entries: typing.Optional[typing.List[LineGraphCanvasItem.LegendEntry]] = None
@@ -208,6 +240,12 @@ class LinePlotDisplayInfo:
                         self.__xdata_list.append(None)
         return self.__xdata_list or list()
 
+    @property
+    def min_max_indexes(self) -> typing.List[typing.Optional[LineGraphCanvasItem.MinMaxIndex]]:
+        if self.__min_max_indexes is None:
+            self.__min_max_indexes = self.__min_max_index_cache.get_min_max_indexes(self.__display_values_list, self.xdata_list)
+        return self.__min_max_indexes
+
     @property
     def axes(self) -> LineGraphCanvasItem.LineGraphAxes:
         if self.__axes is None:
@@ -234,10 +272,17 @@ class LinePlotDisplayInfo:
                 y_max_calibration = displayed_intensity_calibration.convert_to_calibrated_value(y_max)
             else:
                 y_max_calibration = None
+            # when autoscaling to the visible range, limit the y-axis to the data within the left/right channels.
+            calibrated_x_range: typing.Optional[typing.Tuple[float, float]] = None
+            if self.__y_autoscale == "visible" and (left_channel_opt is not None or right_channel_opt is not None):
+                calibrated_x_range = (displayed_dimensional_calibration.convert_to_calibrated_value(left_channel),
+                                      displayed_dimensional_calibration.convert_to_calibrated_value(right_channel))
             calibrated_data_min, calibrated_data_max, y_ticker = LineGraphCanvasItem.calculate_y_axis(xdata_list,
                                                                                                       y_min_calibrated,
                                                                                                       y_max_calibration,
-                                                                                                      y_style)
+                                                                                                      y_style,
+                                                                                                      calibrated_x_range=calibrated_x_range,
+                                                                                                      min_max_indexes=self.min_max_indexes)
             self.__axes = LineGraphCanvasItem.LineGraphAxes(data_scale, calibrated_data_min, calibrated_data_max,
                                                             left_channel,
                                                             right_channel, displayed_dimensional_calibration,
@@ -447,12 +492,14 @@ class LinePlotCanvasItem(DisplayCanvasItem.DisplayCanvasItem):
         self.__graphic_drag_start_pos: Geometry.IntPoint = Geometry.IntPoint()
         self.__graphic_drag_changed = False
 
-        self.__line_plot_display_info = LinePlotDisplayInfo(None, dict(), list(), list())
+        self.__min_max_index_cache = MinMaxIndexCache()
+        self.__line_plot_display_info = LinePlotDisplayInfo(None, dict(), list(), list(), self.__min_max_index_cache)
 
         self.__axes: typing.Optional[LineGraphCanvasItem.LineGraphAxes] = None
         self.__legend_entries: typing.Optional[typing.List[LineGraphCanvasItem.LegendEntry]] = None
 
         self.__graphics: typing.List[Graphics.Graphic] = list()
+        self.__graphics_hit_test_index = Graphics.GraphicHitTestIndex()
         self.__graphic_selection: typing.Optional[DisplayItem.GraphicSelection] = None
         self.__pending_interval: typing.Optional[Graphics.IntervalGraphic] = None
 
@@ -551,7 +598,7 @@ class LinePlotCanvasItem(DisplayCanvasItem.DisplayCanvasItem):
             if self.__closed:
                 return
 
-            self.__line_plot_display_info = LinePlotDisplayInfo(display_calibration_info, display_properties, self.__display_values_list, display_layers)
+            self.__line_plot_display_info = LinePlotDisplayInfo(display_calibration_info, display_properties, self.__display_values_list, display_layers, self.__min_max_index_cache)
             self.__display_layers = display_layers
 
             if self.__display_values_list:
@@ -612,6 +659,7 @@ class LinePlotCanvasItem(DisplayCanvasItem.DisplayCanvasItem):
         dimensional_scales = display_calibration_info.displayed_dimensional_scales
 
         self.__graphics = copy.copy(list(graphics))
+        self.__graphics_hit_test_index.update(self.__graphics)
         self.__graphic_selection = copy.copy(graphic_selection)
 
         if dimensional_scales is None or len(dimensional_scales) == 0:
@@ -681,7 +729,8 @@ class LinePlotCanvasItem(DisplayCanvasItem.DisplayCanvasItem):
         intensity_calibrated_max = -math.inf
 
         # for each layer, make sure the units match (x-axis and intensity).
-        for layer_xdata in self.__line_plot_display_info.xdata_list:
+        min_max_indexes = self.__line_plot_display_info.min_max_indexes
+        for layer_index, layer_xdata in enumerate(self.__line_plot_display_info.xdata_list):
             if layer_xdata and layer_xdata.dimensional_calibrations[0].units == x_units and layer_xdata.intensity_calibration.units == intensity_units:
                 # calculate left/right for the layer by back converting calibrated left/right using the layer calibration
                 layer_left = int(math.floor(layer_xdata.dimensional_calibrations[0].convert_from_calibrated_value(left_calibrated)))
@@ -691,9 +740,15 @@ class LinePlotCanvasItem(DisplayCanvasItem.DisplayCanvasItem):
                 layer_right = max(0, min(layer_xdata.data_shape[-1], layer_right))
                 if layer_left < layer_right:
                     # if we have data, calculate the min/max and then convert those values to calibrated intensity units.
-                    layer_interval_data = layer_xdata.data[..., layer_left:layer_right]
-                    layer_interval_data_min = numpy.min(layer_interval_data)
-                    layer_interval_data_max = numpy.max(layer_interval_data)
+                    # use the min/max index of the layer if available.
+                    min_max_index = min_max_indexes[layer_index] if layer_index < len(min_max_indexes) else None
+                    layer_interval_range = min_max_index.get_range(layer_left, layer_right) if min_max_index else None
+                    if layer_interval_range is not None:
+                        layer_interval_data_min, layer_interval_data_max = layer_interval_range
+                    else:
+                        layer_interval_data = layer_xdata.data[..., layer_left:layer_right]
+                        layer_interval_data_min = numpy.min(layer_interval_data)
+                        layer_interval_data_max = numpy.max(layer_interval_data)
                     layer_interval_data_calibrated_min = layer_xdata.intensity_calibration.convert_to_calibrated_value(layer_interval_data_min)
                     layer_interval_data_calibrated_max = layer_xdata.intensity_calibration.convert_to_calibrated_value(layer_interval_data_max)
                     # keep track of the min/max for the overall list here.
@@ -806,9 +861,10 @@ class LinePlotCanvasItem(DisplayCanvasItem.DisplayCanvasItem):
                         self.cursor_shape = "hand"
                 elif self.__graphics:
                     graphics = self.__graphics
-                    for graphic_index, graphic in enumerate(graphics):
+                    widget_mapping = self.__get_mouse_mapping()
+                    for graphic_index in sorted(self.__get_graphic_hit_test_candidate_indexes(widget_mapping, pos.to_float_point())):
+                        graphic = graphics[graphic_index]
                         if graphic.has_attribute(Graphics.GraphicAttributeEnum.ONE_DIMENSIONAL):
-                            widget_mapping = self.__get_mouse_mapping()
                             part, specific = graphic.test(widget_mapping, self.__ui_settings, pos.to_float_point(), False)
                             if part in {"start", "end"} and not modifiers.control:
                                 self.cursor_shape = "size_horizontal"
@@ -938,6 +994,16 @@ class LinePlotCanvasItem(DisplayCanvasItem.DisplayCanvasItem):
             self.mouse_position_changed(last_mouse.x, last_mouse.y, key.modifiers)
         return True
 
+    def __get_graphic_hit_test_candidate_indexes(self, widget_mapping: LinePlotCanvasItemMapping, pos: Geometry.FloatPoint) -> typing.Set[int]:
+        # return the indexes of the graphics that may be hit at the widget position, using the hit test index.
+        margin = self.__ui_settings.cursor_tolerance + Graphics.HIT_TEST_WIDGET_MARGIN
+        try:
+            x1 = widget_mapping.map_point_widget_to_channel_norm(pos - Geometry.FloatSize(width=margin, height=0))
+            x2 = widget_mapping.map_point_widget_to_channel_norm(pos + Geometry.FloatSize(width=margin, height=0))
+        except ZeroDivisionError:
+            return set(range(len(self.__graphics)))
+        return self.__graphics_hit_test_index.get_candidate_indexes(Geometry.FloatRect.from_tlbr(0.0, min(x1, x2), 1.0, max(x1, x2)))
+
     def __get_mouse_mapping(self) -> LinePlotCanvasItemMapping:
         line_plot_display_info = self.__line_plot_display_info
         data_scale = line_plot_display_info.data_scale
@@ -962,12 +1028,13 @@ class LinePlotCanvasItem(DisplayCanvasItem.DisplayCanvasItem):
             self.__tracking_selections = True
             graphics = self.__graphics
             selection_indexes = self.__graphic_selection.indexes
-            for graphic_index, graphic in enumerate(graphics):
+            widget_mapping = self.__get_mouse_mapping()
+            for graphic_index in sorted(self.__get_graphic_hit_test_candidate_indexes(widget_mapping, self.__graphic_drag_start_pos.to_float_point())):
+                graphic = graphics[graphic_index]
                 if graphic.has_attribute(Graphics.GraphicAttributeEnum.ONE_DIMENSIONAL):
                     already_selected = graphic_index in selection_indexes
                     multiple_items_selected = len(selection_indexes) > 1
                     move_only = not already_selected or multiple_items_selected
-                    widget_mapping = self.__get_mouse_mapping()
                     part, specific = graphic.test(widget_mapping, self.__ui_settings, self.__graphic_drag_start_pos.to_float_point(), move_only)
                     if part:
                         # select item and prepare for drag
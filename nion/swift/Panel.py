@@ -16,6 +16,7 @@ import weakref
 # None
 
 # local libraries
+from nion.swift.model import PlugInManager
 from nion.swift.model import UISettings
 from nion.swift.model import Utility
 from nion.ui import Application
@@ -759,6 +760,9 @@ class PanelManager(metaclass=Utility.Singleton):
     def create_panel_content(self, document_controller: DocumentController.DocumentController, panel_id: str,
                              title: str, positions: typing.Sequence[str], position: str,
                              properties: typing.Optional[Persistence.PersistentDictType]) -> typing.Optional[Panel]:
+        # the panel may be contributed by a plug-in which has not been loaded yet.
+        if panel_id not in self.__panel_tuples:
+            PlugInManager.load_deferred_plug_ins("panels", panel_id)
         if panel_id in self.__panel_tuples:
             panel_tuple = self.__panel_tuples[panel_id]
             try:
@@ -774,12 +778,22 @@ class PanelManager(metaclass=Utility.Singleton):
         return None
 
     def get_panel_info(self, panel_id: str) -> typing.Tuple[str, typing.Sequence[str], str, typing.Optional[Persistence.PersistentDictType]]:
+        if panel_id not in self.__panel_tuples:
+            # use the panel info declared in the manifest of a deferred plug-in.
+            for contribution in PlugInManager.get_deferred_contributions("panels"):
+                if contribution["id"] == panel_id:
+                    return contribution.get("name", panel_id), contribution.get("positions", ["left", "right"]), contribution.get("position", "right"), contribution.get("properties")
         panel_tuple = self.__panel_tuples[panel_id]
         return panel_tuple.name, panel_tuple.positions, panel_tuple.position, panel_tuple.properties
 
     @property
     def panel_ids(self) -> typing.List[str]:
-        return list(self.__panel_tuples.keys())
+        panel_ids = list(self.__panel_tuples.keys())
+        # include panels declared (with a name) in the manifest of a deferred plug-in.
+        for contribution in PlugInManager.get_deferred_contributions("panels"):
+            if "name" in contribution and contribution["id"] not in panel_ids:
+                panel_ids.append(contribution["id"])
+        return panel_ids
 
     def load(self, d: typing.Sequence[Persistence.PersistentDictType]) -> None:
         for panel_d in d:
@@ -52,6 +52,8 @@ class Recorder:
         self.__recording_error = False
         self.__recording_interval = 1.0
         self.__recording_count = 0
+        self.__recording_data_metadata: typing.Optional[DataAndMetadata.DataMetadata] = None
+        self.__recording_frame_count = 0
 
         self.__last_complete_xdata: typing.Optional[DataAndMetadata.DataAndMetadata] = None
 
@@ -200,22 +202,15 @@ class Recorder:
                     # no first image yet
                     return
                 # now record the new data. it may or may not be a new frame at this point.
-                last_xdata = self.__recording_data_item.xdata
+                # the sequence is reserved for all frames when the first frame arrives; each frame is then written
+                # into its own slot so that the cost per frame does not depend on the number of frames recorded.
+                recording_data_metadata = self.__recording_data_metadata
                 self.__recording_index += 1
-                recording_data_shape = self.__recording_data_item.data_shape
-                if current_xdata and last_xdata and recording_data_shape is not None and current_xdata.data_shape == recording_data_shape[1:]:
-                    # continue, append the new data to existing data and update existing data item
-                    intensity_calibration = last_xdata.intensity_calibration
-                    dimensional_calibrations = last_xdata.dimensional_calibrations
-                    data_descriptor = last_xdata.data_descriptor
-                    stacked_data = numpy.vstack([last_xdata.data, [current_xdata.data]])
-                    sequence_xdata = DataAndMetadata.new_data_and_metadata(
-                        stacked_data,
-                        intensity_calibration=intensity_calibration, dimensional_calibrations=dimensional_calibrations,
-                        data_descriptor=data_descriptor)
-                    self.__recording_data_item.set_xdata(sequence_xdata)
-                elif current_xdata and not last_xdata:
-                    # first acquisition, create the sequence
+                if current_xdata and recording_data_metadata and current_xdata.data_shape == recording_data_metadata.data_shape[1:] and current_xdata.data_dtype == recording_data_metadata.data_dtype:
+                    # continue, write the new data into the next frame of the existing data item
+                    self.__write_recording_frame(current_xdata)
+                elif current_xdata and not recording_data_metadata:
+                    # first acquisition, reserve the sequence and write the first frame
                     intensity_calibration = current_xdata.intensity_calibration
                     dimensional_calibrations = [Calibration.Calibration(scale=self.__recording_interval,
                                                                         units="s")] + list(
@@ -223,12 +218,16 @@ class Recorder:
                     data_descriptor = DataAndMetadata.DataDescriptor(True,
                                                                      current_xdata.data_descriptor.collection_dimension_count,
                                                                      current_xdata.data_descriptor.datum_dimension_count)
-                    new_axis_data = current_xdata.data[numpy.newaxis, ...]
-                    sequence_xdata = DataAndMetadata.new_data_and_metadata(new_axis_data,
-                                                                           intensity_calibration=intensity_calibration,
-                                                                           dimensional_calibrations=dimensional_calibrations,
-                                                                           data_descriptor=data_descriptor)
-                    self.__recording_data_item.set_xdata(sequence_xdata)
+                    data_shape = (max(self.__recording_count, 1),) + tuple(current_xdata.data_shape)
+                    data_dtype = current_xdata.data_dtype
+                    assert data_dtype is not None
+                    self.__recording_data_item.reserve_data(data_shape=data_shape, data_dtype=data_dtype, data_descriptor=data_descriptor)
+                    self.__recording_data_metadata = DataAndMetadata.DataMetadata(data_shape_and_dtype=(data_shape, data_dtype),
+                                                                                  intensity_calibration=intensity_calibration,
+                                                                                  dimensional_calibrations=dimensional_calibrations,
+                                                                                  data_descriptor=data_descriptor)
+                    self.__recording_frame_count = 0
+                    self.__write_recording_frame(current_xdata)
                     self.__recording_transaction = self.__document_model.item_transaction(self.__recording_data_item)
                 else:
                     # something is amiss. stop.
@@ -238,6 +237,19 @@ class Recorder:
             if self.__recording_index >= self.__recording_count:
                 self.__stop_recording()
 
+    def __write_recording_frame(self, xdata: DataAndMetadata.DataAndMetadata) -> None:
+        # write the frame into the next slot of the reserved sequence as a partial update.
+        assert self.__recording_data_item
+        assert self.__recording_data_metadata
+        frame_index = self.__recording_frame_count
+        if frame_index < self.__recording_data_metadata.data_shape[0]:
+            frame_slices = [slice(0, n) for n in xdata.data_shape]
+            frame_xdata = DataAndMetadata.new_data_and_metadata(xdata.data[numpy.newaxis, ...])
+            self.__recording_data_item.set_data_and_metadata_partial(self.__recording_data_metadata, frame_xdata,
+                                                                     [slice(0, 1)] + frame_slices,
+                                                                     [slice(frame_index, frame_index + 1)] + frame_slices)
+            self.__recording_frame_count = frame_index + 1
+
     def start_recording(self, recording_start: float, recording_interval: float, recording_count: int) -> None:
         self.__recording_state = "recording"
         self.__recording_start = recording_start
@@ -257,6 +269,15 @@ class Recorder:
             self.__recording_start = 0.0
             self.__recording_index = 0
             self.__recording_error = False
+            recording_data_item = self.__recording_data_item
+            recording_data_metadata = self.__recording_data_metadata
+            if recording_data_item and recording_data_metadata and recording_data_item in self.__document_model.data_items:
+                # trim the frames reserved but not recorded if the recording stopped early.
+                recording_xdata = recording_data_item.xdata
+                if recording_xdata and 0 < self.__recording_frame_count < recording_data_metadata.data_shape[0]:
+                    recording_data_item.set_xdata(recording_xdata[0:self.__recording_frame_count])
+            self.__recording_data_metadata = None
+            self.__recording_frame_count = 0
             if self.__recording_data_item and self.__recording_transaction:
                 self.__recording_transaction.close()
                 self.__recording_transaction = None
@@ -0,0 +1,164 @@
+"""
+Record an opt-in profile of the application startup.
+
+Set the environment variable NIONSWIFT_STARTUP_PROFILE to a file path to record the time spent importing each module
+and in each phase of the startup. The profile is written to the file when the startup finishes.
+"""
+
+from __future__ import annotations
+
+# standard libraries
+import contextlib
+import importlib.abc
+import importlib.machinery
+import logging
+import os
+import pathlib
+import sys
+import threading
+import time
+import types
+import typing
+
+ENVIRONMENT_VARIABLE = "NIONSWIFT_STARTUP_PROFILE"
+
+
+class StartupProfiler:
+    """Record the import time of each module and the time of each named phase.
+
+    Import times are measured by wrapping the exec_module method of the loader of each module imported while the
+    profiler is installed. The cumulative time includes the imports made while executing the module; the self time
+    excludes them.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+        self.__start_time = time.perf_counter()
+        self.__lock = threading.RLock()
+        self.__local = threading.local()
+        # (module name, self ms, cumulative ms) in import completion order.
+        self.imports: typing.List[typing.Tuple[str, float, float]] = list()
+        # (name, depth, start ms, elapsed ms) in phase start order.
+        self.phases: typing.List[typing.Tuple[str, int, float, float]] = list()
+        self.__phase_depth = 0
+        self.__finder = _ImportTimingFinder(self)
+
+    def install(self) -> None:
+        if self.__finder not in sys.meta_path:
+            sys.meta_path.insert(0, self.__finder)
+
+    def uninstall(self) -> None:
+        if self.__finder in sys.meta_path:
+            sys.meta_path.remove(self.__finder)
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> typing.Iterator[None]:
+        with self.__lock:
+            index = len(self.phases)
+            depth = self.__phase_depth
+            self.__phase_depth += 1
+            start = time.perf_counter()
+            self.phases.append((name, depth, (start - self.__start_time) * 1000, 0.0))
+        try:
+            yield
+        finally:
+            with self.__lock:
+                self.__phase_depth -= 1
+                self.phases[index] = (name, depth, (start - self.__start_time) * 1000, (time.perf_counter() - start) * 1000)
+
+    def _exec_module(self, module_name: str, exec_module: typing.Callable[[types.ModuleType], None], module: types.ModuleType) -> None:
+        # the stack holds the accumulated time of the imports made by each module being executed on this thread.
+        stack = getattr(self.__local, "stack", None)
+        if stack is None:
+            stack = list()
+            self.__local.stack = stack
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            exec_module(module)
+        finally:
+            cumulative_ms = (time.perf_counter() - start) * 1000
+            children_ms = stack.pop()
+            if stack:
+                stack[-1] += cumulative_ms
+            with self.__lock:
+                self.imports.append((module_name, cumulative_ms - children_ms, cumulative_ms))
+
+    def write(self) -> None:
+        with self.__lock:
+            lines = [f"# startup profile; total {(time.perf_counter() - self.__start_time) * 1000:.1f}ms", "", "# phases: start ms, elapsed ms, name"]
+            for name, depth, start_ms, elapsed_ms in self.phases:
+                lines.append(f"{start_ms:10.1f} {elapsed_ms:10.1f} {'  ' * depth}{name}")
+            lines.extend(["", f"# imports ({len(self.imports)} modules, {sum(i[1] for i in self.imports):.1f}ms): self ms, cumulative ms, module"])
+            for module_name, self_ms, cumulative_ms in sorted(self.imports, key=lambda x: x[2], reverse=True):
+                lines.append(f"{self_ms:10.1f} {cumulative_ms:10.1f} {module_name}")
+        self.path.write_text("\n".join(lines) + "\n")
+
+
+class _ImportTimingFinder(importlib.abc.MetaPathFinder):
+    """Find the spec of a module using the other finders and wrap its loader to time the module execution."""
+
+    def __init__(self, profiler: StartupProfiler) -> None:
+        self.__profiler = profiler
+        self.__local = threading.local()
+
+    def find_spec(self, fullname: str, path: typing.Optional[typing.Sequence[str]], target: typing.Optional[types.ModuleType] = None) -> typing.Optional[importlib.machinery.ModuleSpec]:
+        if getattr(self.__local, "finding", False):
+            return None
+        self.__local.finding = True
+        try:
+            spec = None
+            for finder in list(sys.meta_path):
+                find_spec = getattr(finder, "find_spec", None)
+                if finder is not self and callable(find_spec):
+                    spec = find_spec(fullname, path, target)
+                    if spec is not None:
+                        break
+        finally:
+            self.__local.finding = False
+        loader = spec.loader if spec else None
+        # only wrap loader instances; built-in and frozen modules are loaded by classes shared between modules.
+        if loader is not None and not isinstance(loader, type) and callable(getattr(loader, "exec_module", None)):
+            exec_module = loader.exec_module
+            profiler = self.__profiler
+
+            def timed_exec_module(module: types.ModuleType) -> None:
+                profiler._exec_module(fullname, exec_module, module)
+
+            try:
+                setattr(loader, "exec_module", timed_exec_module)
+            except AttributeError:
+                pass
+        return spec
+
+
+_profiler: typing.Optional[StartupProfiler] = None
+
+
+def start(path: typing.Optional[pathlib.Path] = None) -> None:
+    """Start profiling if path is given or the profile environment variable is set."""
+    global _profiler
+    if not _profiler:
+        path_str = str(path) if path else os.environ.get(ENVIRONMENT_VARIABLE)
+        if path_str:
+            _profiler = StartupProfiler(pathlib.Path(path_str))
+            _profiler.install()
+
+
+def phase(name: str) -> typing.ContextManager[None]:
+    """Return a context manager recording the named phase, if profiling."""
+    return _profiler.phase(name) if _profiler else contextlib.nullcontext()
+
+
+def finish() -> None:
+    """Stop profiling and write the profile, if profiling."""
+    global _profiler
+    profiler = _profiler
+    if profiler:
+        _profiler = None
+        profiler.uninstall()
+        try:
+            profiler.write()
+            logging.info(f"Startup profile {profiler.path}")
+        except Exception as e:
+            logging.info(f"Unable to write startup profile {profiler.path} ({e})")
@@ -18,6 +18,7 @@ import numpy.typing
 
 # local libraries
 from nion.swift import DisplayPanel
+from nion.swift.model import Cache
 from nion.swift.model import Utility
 from nion.swift.model import DisplayItem
 from nion.ui import DrawingContext
@@ -33,11 +34,12 @@ class ThumbnailSource:
     """Produce a thumbnail for a display."""
     _executor = concurrent.futures.ThreadPoolExecutor()
 
-    def __init__(self, ui: UserInterface.UserInterface, display_item: DisplayItem.DisplayItem, will_close_fn: typing.Callable[[uuid.UUID], None], *, _suppress_recompute: bool = False) -> None:
+    def __init__(self, ui: UserInterface.UserInterface, display_item: DisplayItem.DisplayItem, will_close_fn: typing.Callable[[uuid.UUID], None], *, cache_loader: typing.Optional[ThumbnailCacheLoader] = None, _suppress_recompute: bool = False) -> None:
         super().__init__()
         self._ui = ui
         self._display_item = display_item
         self.__will_close_fn = will_close_fn
+        self.__cache_loader = cache_loader
         self.__suppress_recompute = _suppress_recompute
 
         self.width = 256
@@ -61,8 +63,11 @@ class ThumbnailSource:
         self.__display_changed_event_listener = display_item.display_changed_event.listen(ReferenceCounting.weak_partial(ThumbnailSource.__thumbnail_changed, self))
         self.__graphics_changed_event_listener = display_item.graphics_changed_event.listen(ReferenceCounting.weak_partial(ThumbnailSource.__graphics_changed, self))
 
-        # initial recompute, if required
-        self.__recompute_on_thread()
+        # initial read of the cache and recompute, if required. the cache loader reads the cache for many sources at once.
+        if self.__cache_loader and not self.__suppress_recompute:
+            self.__cache_loader.add(self)
+        else:
+            self.__recompute_on_thread()
 
         self.__display_will_close_listener = display_item.display_item_will_close_event.listen(ReferenceCounting.weak_partial(ThumbnailSource.__display_item_will_close, self))
 
@@ -73,6 +78,25 @@ class ThumbnailSource:
             self.__cache_properties_known = True
             self.thumbnail_updated_event.fire()
 
+    def _get_cache_entry(self) -> typing.Optional[typing.Tuple[Cache.CacheLike, DisplayItem.DisplayItem]]:
+        # return the cache and target to read by the cache loader, or None if the cache no longer needs to be read.
+        with self.__recompute_lock:
+            if self.__cache_properties_known or not self.__display_item:
+                return None
+            return self.__cache, self.__display_item
+
+    def _set_cache_properties(self, thumbnail_data: typing.Optional[_NDArray], is_dirty: bool) -> None:
+        # called from the cache loader with the values read from the cache.
+        with self.__recompute_lock:
+            if self.__cache_properties_known or not self.__display_item:
+                return
+            self.__cache_thumbnail_data = thumbnail_data
+            self.__cache_is_dirty = is_dirty
+            self.__cache_properties_known = True
+        self.thumbnail_updated_event.fire()
+        if is_dirty:
+            self.__recompute_on_thread()
+
     def __thumbnail_changed(self) -> None:
         self.__cache.set_cached_value_dirty(self.__display_item, self.__cache_property_name)
         self.thumbnail_dirty_event.fire()
@@ -94,6 +118,8 @@ class ThumbnailSource:
         self.__display_item_about_to_close_listener = typing.cast(typing.Any, None)
         self.__display_changed_event_listener = typing.cast(typing.Any, None)
         self.__graphics_changed_event_listener = typing.cast(typing.Any, None)
+        if self.__cache_loader:
+            self.__cache_loader.discard(self)
         # shut down the thread, if any. avoid deadlock.
         # note: the __display_item still has to be valid to shut down the thread, in case it is still running.
         # clear the display item after shutting down the thread.
@@ -163,16 +189,92 @@ class ThumbnailSource:
         return self.__display_item is not None
 
 
+class ThumbnailCacheLoader:
+    """Read the cached thumbnail data for thumbnail sources in batches.
+
+    Each batch is read with a single query of the storage cache instead of a query per thumbnail source. The sources
+    of the display items most recently passed to load are read first so that visible thumbnails appear first when
+    scrolling through many display items.
+    """
+    batch_size = 256
+
+    def __init__(self, executor: typing.Optional[concurrent.futures.Executor] = None) -> None:
+        self.__executor = executor or ThumbnailSource._executor
+        self.__lock = threading.RLock()
+        self.__pending_sources: typing.Dict[uuid.UUID, ThumbnailSource] = dict()
+        self.__priority_uuids: typing.List[uuid.UUID] = list()  # in reverse order, for popping
+        self.__future: typing.Optional[concurrent.futures.Future[typing.Any]] = None
+
+    def add(self, thumbnail_source: ThumbnailSource) -> None:
+        with self.__lock:
+            self.__pending_sources[thumbnail_source._display_item.uuid] = thumbnail_source
+            if not self.__future:
+                self.__future = self.__executor.submit(self.__run)
+
+    def discard(self, thumbnail_source: ThumbnailSource) -> None:
+        with self.__lock:
+            if self.__pending_sources.get(thumbnail_source._display_item.uuid) is thumbnail_source:
+                self.__pending_sources.pop(thumbnail_source._display_item.uuid)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__pending_sources.clear()
+            self.__priority_uuids.clear()
+
+    def load(self, display_items: typing.Sequence[DisplayItem.DisplayItem]) -> None:
+        """Read the display items before the other pending ones, in order. Replaces the previous request."""
+        with self.__lock:
+            self.__priority_uuids = [display_item.uuid for display_item in reversed(display_items) if display_item.uuid in self.__pending_sources]
+
+    @property
+    def _pending_count(self) -> int:
+        with self.__lock:
+            return len(self.__pending_sources)
+
+    def __take_batch(self) -> typing.List[ThumbnailSource]:
+        thumbnail_sources: typing.List[ThumbnailSource] = list()
+        while self.__priority_uuids and len(thumbnail_sources) < self.batch_size:
+            thumbnail_source = self.__pending_sources.pop(self.__priority_uuids.pop(), None)
+            if thumbnail_source:
+                thumbnail_sources.append(thumbnail_source)
+        while self.__pending_sources and len(thumbnail_sources) < self.batch_size:
+            thumbnail_sources.append(self.__pending_sources.pop(next(iter(self.__pending_sources))))
+        return thumbnail_sources
+
+    def __run(self) -> None:
+        while True:
+            with self.__lock:
+                thumbnail_sources = self.__take_batch()
+                if not thumbnail_sources:
+                    self.__future = None
+                    return
+            try:
+                cache_entries = [(thumbnail_source, thumbnail_source._get_cache_entry()) for thumbnail_source in thumbnail_sources]
+                valid_cache_entries = [(thumbnail_source, cache_entry) for thumbnail_source, cache_entry in cache_entries if cache_entry]
+                values = Cache.get_cached_values([cache_entry for _, cache_entry in valid_cache_entries], "thumbnail_data")
+                for (thumbnail_source, _), (thumbnail_data, is_dirty) in zip(valid_cache_entries, values):
+                    thumbnail_source._set_cache_properties(thumbnail_data, is_dirty)
+            except Exception:
+                import traceback
+                traceback.print_exc()
+
+
 class ThumbnailManager(metaclass=Utility.Singleton):
     """Manages thumbnail sources for displays."""
 
     def __init__(self) -> None:
         self.__thumbnail_sources: typing.Dict[uuid.UUID, ThumbnailSource] = dict()
+        self.__cache_loader = ThumbnailCacheLoader()
         self.__lock = threading.RLock()
 
     def reset(self) -> None:
         with self.__lock:
             self.__thumbnail_sources.clear()
+            self.__cache_loader.clear()
+
+    @property
+    def _cache_loader(self) -> ThumbnailCacheLoader:
+        return self.__cache_loader
 
     def thumbnail_source_for_display_item(self, ui: UserInterface.UserInterface, display_item: DisplayItem.DisplayItem, *, _suppress_recompute: bool = False) -> ThumbnailSource:
         """Returned ThumbnailSource must be closed."""
@@ -183,7 +285,7 @@ class ThumbnailManager(metaclass=Utility.Singleton):
                     with self.__lock:
                         del self.__thumbnail_sources[display_item_uuid]
 
-                thumbnail_source = ThumbnailSource(ui, display_item, will_close_fn, _suppress_recompute=_suppress_recompute)
+                thumbnail_source = ThumbnailSource(ui, display_item, will_close_fn, cache_loader=self.__cache_loader, _suppress_recompute=_suppress_recompute)
                 self.__thumbnail_sources[display_item.uuid] = thumbnail_source
             else:
                 assert thumbnail_source._ui == ui
@@ -195,3 +297,7 @@ class ThumbnailManager(metaclass=Utility.Singleton):
             if thumbnail_source:
                 return thumbnail_source.thumbnail_data
             return None
+
+    def load_thumbnails(self, display_items: typing.Sequence[DisplayItem.DisplayItem]) -> None:
+        """Read the cached thumbnails of the display items, such as the visible ones, before the others."""
+        self.__cache_loader.load(display_items)
@@ -3,14 +3,47 @@ from __future__ import annotations
 import abc
 import gettext
 import logging
+import sys
 import typing
 
+from nion.data import DataAndMetadata
+from nion.swift.model import Changes
+
 
 _ = gettext.gettext
 
 commands_logger = logging.getLogger("_commands")
 
 
+def estimate_memory_size(value: typing.Any) -> int:
+    """Estimate the memory in bytes held by an undo snapshot.
+
+    Containers, strings, arrays (anything with nbytes) and data and metadata are counted deeply, including when nested in
+    containers; undelete logs are counted through their entries. Other objects, such as references to items in the
+    document, are counted shallowly since the undo stack does not own them.
+    """
+    visited: typing.Set[int] = set()
+
+    def estimate(value: typing.Any) -> int:
+        if id(value) in visited:
+            return 0
+        visited.add(id(value))
+        if isinstance(value, dict):
+            return sys.getsizeof(value) + sum(estimate(k) + estimate(v) for k, v in value.items())
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return sys.getsizeof(value) + sum(estimate(v) for v in value)
+        if isinstance(value, (Changes.UndeleteLog, Changes.UndeleteBase)):
+            return sys.getsizeof(value) + estimate(vars(value))
+        if isinstance(value, DataAndMetadata.DataAndMetadata):
+            return sys.getsizeof(value) + estimate(value.data) + estimate(value.metadata)
+        n_bytes = getattr(value, "nbytes", None)
+        if isinstance(n_bytes, int):
+            return sys.getsizeof(value) + n_bytes
+        return sys.getsizeof(value)
+
+    return estimate(value)
+
+
 class UndoableCommand(abc.ABC):
 
     def __init__(self, title: str, *, command_id: typing.Optional[str] = None, is_mergeable: bool = False) -> None:
@@ -19,6 +52,7 @@ class UndoableCommand(abc.ABC):
         self.__title = title
         self.__command_id = command_id
         self.__is_mergeable = is_mergeable
+        self.__memory_size: typing.Optional[int] = None
 
     def close(self) -> None:
         self.__old_modified_state = None
@@ -44,6 +78,34 @@ class UndoableCommand(abc.ABC):
     def is_undo_valid(self) -> bool:
         return self._compare_modified_states(self.__new_modified_state, self._get_modified_state())
 
+    @property
+    def memory_size(self) -> int:
+        """Return the estimated memory in bytes held by this command. Updated when the command changes."""
+        if self.__memory_size is None:
+            self.__memory_size = self._get_memory_size()
+        return self.__memory_size
+
+    def _update_memory_size(self) -> None:
+        # call when the snapshots held by the command change. the size is estimated again when next requested.
+        self.__memory_size = None
+
+    def _get_memory_size(self) -> int:
+        # override to provide a better estimate. the default counts the snapshots held in the command attributes.
+        return estimate_memory_size(vars(self))
+
+    def _spill(self, snapshot_store: Changes.UndoSnapshotStore) -> None:
+        # override to move other large snapshots into the snapshot store. the command must load them again when needed.
+        # the default spills the item snapshots of the undelete logs held in the command attributes, directly or in a
+        # list of undelete logs.
+        for value in vars(self).values():
+            for undelete_log in (value if isinstance(value, list) else [value]):
+                if isinstance(undelete_log, Changes.UndeleteLog):
+                    undelete_log.spill(snapshot_store)
+
+    def spill(self, snapshot_store: Changes.UndoSnapshotStore) -> None:
+        self._spill(snapshot_store)
+        self._update_memory_size()
+
     def _compare_modified_states(self, state1: typing.Any, state2: typing.Any) -> bool:
         # override to allow the undo command to track state; but only use part of the state for comparison
         return bool(state1 == state2)
@@ -59,6 +121,7 @@ class UndoableCommand(abc.ABC):
         if not was_merge:
             commands_logger.info(f"# undo commit '{self.title}'")
         self.__new_modified_state = self._get_modified_state()
+        self._update_memory_size()
 
     def perform(self) -> None:
         self._perform()
@@ -68,11 +131,13 @@ class UndoableCommand(abc.ABC):
         self._undo()
         self._set_modified_state(self.__old_modified_state)
         self.__is_mergeable = False
+        self._update_memory_size()
 
     def redo(self) -> None:
         commands_logger.info(f"# redo '{self.title}'")
         self._redo()
         self._set_modified_state(self.__new_modified_state)
+        self._update_memory_size()
 
     def can_merge(self, command: UndoableCommand) -> bool:
         return False
@@ -83,6 +148,7 @@ class UndoableCommand(abc.ABC):
         self.__new_modified_state = self._get_modified_state()
 
     def _merge(self, command: UndoableCommand) -> None:
+        # override to merge the command. call _update_memory_size if the snapshots held by this command change.
         pass
 
     @abc.abstractmethod
@@ -105,14 +171,46 @@ class UndoableCommand(abc.ABC):
 
 
 class UndoStack:
+    """A stack of undoable commands.
+
+    If a memory budget (bytes) is given, the oldest commands are discarded when the estimated memory held by the
+    commands exceeds it; the most recent command is always kept. If a spill size (bytes) is given, commands at least
+    that large move their snapshots into a temporary file store when they are pushed.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, *, memory_budget: typing.Optional[int] = None, spill_size: typing.Optional[int] = None) -> None:
         # undo/redo stack. next item is at the end.
         self.__undo_stack: typing.List[UndoableCommand] = list()
         self.__redo_stack: typing.List[UndoableCommand] = list()
+        self.__memory_budget = memory_budget
+        self.__spill_size = spill_size
+        self.__snapshot_store = Changes.UndoSnapshotStore()
 
     def close(self) -> None:
         self.clear()
+        self.__snapshot_store.close()
+
+    @property
+    def memory_budget(self) -> typing.Optional[int]:
+        return self.__memory_budget
+
+    @memory_budget.setter
+    def memory_budget(self, value: typing.Optional[int]) -> None:
+        self.__memory_budget = value
+        self.__enforce_memory_budget()
+
+    @property
+    def spill_size(self) -> typing.Optional[int]:
+        return self.__spill_size
+
+    @spill_size.setter
+    def spill_size(self, value: typing.Optional[int]) -> None:
+        self.__spill_size = value
+
+    @property
+    def memory_usage(self) -> int:
+        """Return the estimated memory in bytes held by the undo and redo commands."""
+        return sum(command.memory_size for command in self.__undo_stack) + sum(command.memory_size for command in self.__redo_stack)
 
     @property
     def can_redo(self) -> bool:
@@ -164,12 +262,14 @@ class UndoStack:
         undo_command = self.__undo_stack.pop()
         undo_command.undo()
         self.__redo_stack.append(undo_command)
+        self.__enforce_memory_budget()
 
     def redo(self) -> None:
         assert len(self.__redo_stack) > 0
         undo_command = self.__redo_stack.pop()
         undo_command.redo()
         self.__undo_stack.append(undo_command)
+        self.__enforce_memory_budget()
 
     def push(self, undo_command: UndoableCommand) -> None:
         assert undo_command
@@ -180,6 +280,18 @@ class UndoStack:
             undo_command.close()
         else:
             undo_command.commit()
+            if self.__spill_size is not None and undo_command.memory_size >= self.__spill_size:
+                undo_command.spill(self.__snapshot_store)
             self.__undo_stack.append(undo_command)
         while len(self.__redo_stack) > 0:
             self.__redo_stack.pop().close()
+        self.__enforce_memory_budget()
+
+    def __enforce_memory_budget(self) -> None:
+        # discard the oldest commands first, furthest redo commands before undo commands. keep the most recent one.
+        if self.__memory_budget is not None:
+            memory_usage = self.memory_usage
+            while memory_usage > self.__memory_budget and len(self.__undo_stack) + len(self.__redo_stack) > 1:
+                undo_command = self.__redo_stack.pop(0) if self.__redo_stack else self.__undo_stack.pop(0)
+                memory_usage -= undo_command.memory_size
+                undo_command.close()
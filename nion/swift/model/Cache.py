@@ -92,6 +92,10 @@ class SuspendableCache(CacheLike):
     def close(self) -> None:
         pass
 
+    @property
+    def storage_cache(self) -> typing.Optional[CacheLike]:
+        return self.__storage_cache
+
     # the cache system stores values that are expensive to calculate for quick retrieval.
     # an item can be marked dirty in the cache so that callers can determine whether that
     # value needs to be recalculated. marking a value as dirty doesn't affect the current
@@ -197,6 +201,17 @@ class SuspendableCache(CacheLike):
                 _, object_dirty_dict = self.__cache_dirty.setdefault(id(target), (target, dict()))
                 object_dirty_dict[key] = dirty
 
+    # return the value and dirty flag if either is held in the temporary cache; otherwise None, meaning that both can
+    # be read from the storage cache.
+    def _get_local_cached_value(self, target: typing.Any, key: str) -> typing.Optional[typing.Tuple[typing.Any, bool]]:
+        with self.__cache_mutex:
+            _, object_dict = self.__cache.get(id(target), (target, dict()))
+            _, object_list = self.__cache_remove.get(id(target), (target, list()))
+            _, object_dirty_dict = self.__cache_dirty.get(id(target), typing.cast(typing.Tuple[typing.Any, typing.Dict[str, bool]], (target, dict())))
+            if key in object_dict or key in object_list or key in object_dirty_dict or not self.__storage_cache:
+                return self.get_cached_value(target, key), self.is_cached_value_dirty(target, key)
+        return None
+
 
 class ShadowCache(CacheLike):
     """Shadow another cache, allowing cache usage before the other cache is created.
@@ -312,6 +327,14 @@ class ShadowCache(CacheLike):
             with self.__cache_mutex:
                 self.__cache_dirty[key] = dirty
 
+    # return the value and dirty flag if either is held in the temporary cache; otherwise None, meaning that both can
+    # be read from the storage cache.
+    def _get_local_cached_value(self, target: typing.Any, key: str) -> typing.Optional[typing.Tuple[typing.Any, bool]]:
+        with self.__cache_mutex:
+            if key in self.__cache or key in self.__cache_dirty or not self.storage_cache:
+                return self.get_cached_value(target, key), self.is_cached_value_dirty(target, key)
+        return None
+
 
 def db_make_directory_if_needed(directory_path: str) -> None:
     if os.path.exists(directory_path):
@@ -377,6 +400,9 @@ class DictStorageCache(CacheLike):
         cache_dirty = self.__cache_dirty.setdefault(target.uuid, dict())
         cache_dirty[key] = dirty
 
+    def get_cached_values(self, targets: typing.Sequence[typing.Any], key: str) -> typing.List[typing.Tuple[typing.Any, bool]]:
+        return [(self.get_cached_value(target, key), self.is_cached_value_dirty(target, key)) for target in targets]
+
 
 class DbStorageCache(CacheLike):
     count = 0  # useful for detecting leaks in tests
@@ -459,9 +485,11 @@ class DbStorageCache(CacheLike):
             return None
 
     def __set_cached_value(self, target: typing.Any, key: str, value: typing.Any, dirty: bool = False) -> None:
+        # use a binary pickle protocol, which loads arrays much faster than protocol 0. values stored with protocol 0
+        # are still loaded since pickle detects the protocol.
         with self.conn:
             self.execute("INSERT OR REPLACE INTO cache (uuid, key, value, dirty) VALUES (?, ?, ?, ?)",
-                         (str(target.uuid), key, sqlite3.Binary(pickle.dumps(value, 0)), 1 if dirty else 0))
+                         (str(target.uuid), key, sqlite3.Binary(pickle.dumps(value, 4)), 1 if dirty else 0))
 
     def __get_cached_value(self, target: typing.Any, key: str, default_value: typing.Any = None) -> typing.Any:
         last_result = self.execute("SELECT value FROM cache WHERE uuid=? AND key=?", (str(target.uuid), key))
@@ -475,6 +503,17 @@ class DbStorageCache(CacheLike):
         else:
             return default_value
 
+    def __get_cached_values(self, targets: typing.Sequence[typing.Any], key: str) -> typing.List[typing.Tuple[typing.Any, bool]]:
+        uuid_strs = [str(target.uuid) for target in targets]
+        rows: typing.Dict[str, typing.Tuple[typing.Any, bool]] = dict()
+        # stay below the maximum number of host parameters of older versions of sqlite.
+        for i in range(0, len(uuid_strs), 500):
+            chunk = uuid_strs[i:i + 500]
+            last_result = self.execute(f"SELECT uuid, value, dirty FROM cache WHERE key=? AND uuid IN ({','.join('?' * len(chunk))})", [key] + chunk)
+            for uuid_str, value, dirty in last_result.fetchall():
+                rows[uuid_str] = pickle.loads(value, encoding='latin1'), int(dirty) != 0
+        return [rows.get(uuid_str, (None, True)) for uuid_str in uuid_strs]
+
     def __remove_cached_value(self, target: typing.Any, key: str) -> None:
         with self.conn:
             self.execute("DELETE FROM cache WHERE uuid=? AND key=?", (str(target.uuid), key))
@@ -511,6 +550,17 @@ class DbStorageCache(CacheLike):
             event.wait()
         return result[0] if len(result) > 0 else None
 
+    def get_cached_values(self, targets: typing.Sequence[typing.Any], key: str) -> typing.List[typing.Tuple[typing.Any, bool]]:
+        """Return the value and dirty flag for each target using a single query."""
+        event = threading.Event()
+        result: typing.List[typing.Any] = list()
+        with self.__queue_lock:
+            _queue = self.__queue
+        if _queue:
+            _queue.put((functools.partial(self.__get_cached_values, targets, key), result, event, "get_cached_values"))
+            event.wait()
+        return result[0] if len(result) > 0 else [(None, True)] * len(targets)
+
     def remove_cached_value(self, target: typing.Any, key: str) -> None:
         assert target is not None
         event = threading.Event()
@@ -541,6 +591,36 @@ class DbStorageCache(CacheLike):
         # event.wait()
 
 
+def get_cached_values(entries: typing.Sequence[typing.Tuple[CacheLike, typing.Any]], key: str) -> typing.List[typing.Tuple[typing.Any, bool]]:
+    """Return the value and dirty flag for key for each (cache, target) entry.
+
+    Values held by a shadow or suspendable cache are returned directly. The remaining entries are grouped by their
+    storage cache and read with one query per storage cache, if it supports reading many values at once.
+    """
+    results: typing.List[typing.Tuple[typing.Any, bool]] = [(None, True)] * len(entries)
+    storage_entries: typing.Dict[int, typing.Tuple[CacheLike, typing.List[typing.Tuple[int, typing.Any]]]] = dict()
+    for index, (cache, target) in enumerate(entries):
+        storage_cache: typing.Optional[CacheLike] = cache
+        while isinstance(storage_cache, (ShadowCache, SuspendableCache)):
+            local_value = storage_cache._get_local_cached_value(target, key)
+            if local_value is not None:
+                results[index] = local_value
+                storage_cache = None
+            else:
+                storage_cache = storage_cache.storage_cache
+        if storage_cache:
+            storage_entries.setdefault(id(storage_cache), (storage_cache, list()))[1].append((index, target))
+    for storage_cache, index_targets in storage_entries.values():
+        targets = [target for _, target in index_targets]
+        if isinstance(storage_cache, (DbStorageCache, DictStorageCache)):
+            values = storage_cache.get_cached_values(targets, key)
+        else:
+            values = [(storage_cache.get_cached_value(target, key), storage_cache.is_cached_value_dirty(target, key)) for target in targets]
+        for (index, _), value in zip(index_targets, values):
+            results[index] = value
+    return results
+
+
 class DbCacheFactory(CacheFactory):
     def __init__(self, cache_dir_path: pathlib.Path, identifier: str) -> None:
         self.__cache_dir_path = cache_dir_path
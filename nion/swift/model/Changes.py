@@ -1,12 +1,51 @@
 from __future__ import annotations
 
 import abc
+import pathlib
+import pickle
+import shutil
+import tempfile
 import typing
+import uuid
 
 if typing.TYPE_CHECKING:
     from nion.swift.model import DocumentModel
 
 
+class StoredSnapshot:
+    """A snapshot spilled to a file by an UndoSnapshotStore. Load it to use it; close it to delete the file."""
+
+    def __init__(self, file_path: pathlib.Path) -> None:
+        self.__file_path = file_path
+
+    def close(self) -> None:
+        self.__file_path.unlink(missing_ok=True)
+
+    def load(self) -> typing.Any:
+        with self.__file_path.open("rb") as fp:
+            return pickle.load(fp)
+
+
+class UndoSnapshotStore:
+    """Stores large undo snapshots in a temporary directory to release their memory."""
+
+    def __init__(self) -> None:
+        self.__directory: typing.Optional[pathlib.Path] = None
+
+    def close(self) -> None:
+        if self.__directory:
+            shutil.rmtree(self.__directory, ignore_errors=True)
+            self.__directory = None
+
+    def store(self, value: typing.Any) -> StoredSnapshot:
+        if not self.__directory:
+            self.__directory = pathlib.Path(tempfile.mkdtemp(prefix="nionswift-undo-"))
+        file_path = self.__directory / f"{uuid.uuid4()}.pickle"
+        with file_path.open("wb") as fp:
+            pickle.dump(value, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        return StoredSnapshot(file_path)
+
+
 class UndeleteBase(abc.ABC):
 
     @abc.abstractmethod
@@ -15,6 +54,10 @@ class UndeleteBase(abc.ABC):
     @abc.abstractmethod
     def undelete(self, document_model: DocumentModel.DocumentModel) -> None: ...
 
+    def spill(self, snapshot_store: UndoSnapshotStore) -> None:
+        # override to move large snapshots into the snapshot store. the entry must load them again to undelete.
+        pass
+
 
 class UndeleteLog:
     count = 0  # useful for detecting leaks in tests
@@ -32,6 +75,10 @@ class UndeleteLog:
     def append(self, item: UndeleteBase) -> None:
         self.__items.append(item)
 
+    def spill(self, snapshot_store: UndoSnapshotStore) -> None:
+        for item in self.__items:
+            item.spill(snapshot_store)
+
     def undelete_all(self, document_model: DocumentModel.DocumentModel) -> None:
         for entry in reversed(self.__items):
             entry.undelete(document_model)
@@ -5,7 +5,6 @@ See color maps:
     https://datascience.lanl.gov/colormaps.html
 """
 
-import colorsys
 import dataclasses
 import gettext
 import json
@@ -26,6 +25,7 @@ _ = gettext.gettext
 
 _LookupDataArray = numpy.typing.NDArray[typing.Any]
 _RGBA8ImageDataType = numpy.typing.NDArray[typing.Any]
+_RGBA32ImageDataType = numpy.typing.NDArray[numpy.uint32]
 _PointsType = typing.List[typing.Dict[str, typing.Union[float, typing.Tuple[int, int, int]]]]
 
 
@@ -36,19 +36,15 @@ def interpolate_colors(array: _LookupDataArray, x: int) -> _RGBA8ImageDataType:
     :param x: number of colors
     :return: interpolated color map
     """
-    out_array: typing.List[typing.Tuple[int, int, int]] = []
-    for i in range(x):
-        if i % (x / (len(array) - 1)) == 0:
-            index = i / (x / (len(array) - 1))
-            out_array.append(array[int(index)])
-        else:
-            start_marker = array[math.floor(i / (x / (len(array) - 1)))]
-            stop_marker = array[math.ceil(i / (x / (len(array) - 1)))]
-            interp_amount = i % (x / (len(array) - 1)) / (x / (len(array) - 1))
-            interp_color = numpy.rint(start_marker + ((stop_marker - start_marker) * interp_amount))
-            out_array.append(interp_color)
+    array = numpy.asarray(array)
+    step = x / (len(array) - 1)
+    indexes = numpy.arange(x)
+    start_markers = array[numpy.floor(indexes / step).astype(int)]
+    stop_markers = array[numpy.ceil(indexes / step).astype(int)]
+    interp_amounts = (indexes % step / step)[:, numpy.newaxis]
+    out_array = numpy.rint(start_markers + ((stop_markers - start_markers) * interp_amounts))
     out_array[-1] = array[-1]
-    return numpy.array(out_array).astype(numpy.uint8)
+    return out_array.astype(numpy.uint8)
 
 
 def generate_lookup_array_from_points(points: _PointsType, n: int) -> _RGBA8ImageDataType:
@@ -72,23 +68,19 @@ def generate_lookup_array_from_points(points: _PointsType, n: int) -> _RGBA8Imag
         rgb: numpy.typing.NDArray[typing.Any] = numpy.array([b, g, r])
         ix = int(math.floor(x * (n - 1)))
         if last_ix is None:
-            out_array.append(numpy.copy(rgb))
+            out_array.append(numpy.copy(rgb)[numpy.newaxis, :])
         elif ix > last_ix:
             amount = (rgb - last_rgb) / (ix - last_ix)
-            for x in range(ix - last_ix):
-                out_array.append(numpy.rint(last_rgb + amount * (x + 1)))
+            out_array.append(numpy.rint(last_rgb + amount * numpy.arange(1, ix - last_ix + 1)[:, numpy.newaxis]))
         else:
             assert ix >= last_ix
         last_ix = ix
         last_rgb = numpy.copy(rgb)
-    return numpy.array(out_array).astype(numpy.uint8)
+    return numpy.concatenate(out_array).astype(numpy.uint8)
 
 
 def generate_lookup_array_grayscale() -> _RGBA8ImageDataType:
-    out_list = []
-    for i in range(256):
-        out_list.append([i, i, i])
-    return numpy.array(out_list).astype(numpy.uint8)
+    return numpy.repeat(numpy.arange(256, dtype=numpy.uint8)[:, numpy.newaxis], 3, axis=1)
 
 lookup_arrays = {
     'magma':     [[0, 0, 0],
@@ -117,11 +109,31 @@ def generate_lookup_array(color_map_id: str) -> _RGBA8ImageDataType:
     return interpolate_colors(numpy.array(lookup_arrays[color_map_id]), 256)
 
 def generate_lookup_array_hsv() -> _RGBA8ImageDataType:
-    result_array = []
-    for lookup_value in range(256):
-        color_values = [x * 255 for x in colorsys.hsv_to_rgb(lookup_value / 300, 1.0, 1.0)]
-        result_array.append(color_values)
-    return numpy.array(result_array).astype(numpy.uint8)
+    # vectorized colorsys.hsv_to_rgb(lookup_value / 300, 1.0, 1.0), following its arithmetic exactly.
+    h = numpy.arange(256) / 300
+    i = (h * 6.0).astype(int)
+    f = (h * 6.0) - i
+    p = numpy.zeros_like(f)
+    q = 1.0 - f
+    t = 1.0 - (1.0 - f)
+    v = numpy.ones_like(f)
+    i = i % 6
+    conditions = [i == 0, i == 1, i == 2, i == 3, i == 4, i == 5]
+    r = numpy.select(conditions, [v, q, p, p, t, v])
+    g = numpy.select(conditions, [t, v, v, q, p, p])
+    b = numpy.select(conditions, [p, p, t, v, v, q])
+    return (numpy.stack([r, g, b], axis=-1) * 255).astype(numpy.uint8)
+
+
+def generate_packed_rgba(data: _RGBA8ImageDataType) -> _RGBA32ImageDataType:
+    """Return the color map data (n x 3 uint8) as packed uint32 RGBA values with opaque alpha.
+
+    The bytes are packed in the same order as the color map data, the layout used for uint32 bitmaps.
+    """
+    rgba = numpy.empty(data.shape[:-1] + (4,), numpy.uint8)
+    rgba[..., 0:3] = data
+    rgba[..., 3] = 255
+    return rgba.view(numpy.uint32).reshape(rgba.shape[:-1])
 
 
 @dataclasses.dataclass
@@ -129,6 +141,12 @@ class ColorMap:
     color_map_id: str
     name: str
     data: _RGBA8ImageDataType
+    rgba: _RGBA32ImageDataType = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # the packed table is computed once and shared read-only by all displays using this color map.
+        self.rgba = generate_packed_rgba(self.data)
+        self.rgba.flags.writeable = False
 
 
 color_maps: typing.Dict[str, ColorMap] = dict()
@@ -233,6 +251,23 @@ def get_color_map_data_by_id(color_map_id: str) -> _RGBA8ImageDataType:
     return color_maps.get(color_map_id, color_maps["grayscale"]).data
 
 
+def get_color_map_rgba_by_id(color_map_id: str) -> _RGBA32ImageDataType:
+    return color_maps.get(color_map_id, color_maps["grayscale"]).rgba
+
+
+def get_color_map_rgba(color_map_data: typing.Optional[_RGBA8ImageDataType]) -> _RGBA32ImageDataType:
+    """Return the packed uint32 RGBA table for the color map data; grayscale if None.
+
+    The shared read-only table is returned if the data belongs to a registered color map; otherwise a table is generated.
+    """
+    if color_map_data is None:
+        return color_maps["grayscale"].rgba
+    for color_map in color_maps.values():
+        if color_map.data is color_map_data:
+            return color_map.rgba
+    return generate_packed_rgba(color_map_data)
+
+
 class ColorMapProtocol(typing.Protocol):
     color_map_id: str
     name: str
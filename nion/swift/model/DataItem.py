@@ -43,6 +43,8 @@ from nion.data.DataAndMetadata import _ImageDataType
 
 _ = gettext.gettext
 
+DataRegionType = typing.Tuple[slice, ...]
+
 UNTITLED_STR = _("Untitled")
 
 
@@ -251,6 +253,10 @@ class DataItem(Persistence.PersistentObject):
         self.__pending_xdata_lock = threading.RLock()
         self.__pending_xdata: typing.Optional[DataAndMetadata.DataAndMetadata] = None
         self.__pending_queue: typing.List[typing.Tuple[DataAndMetadata.DataAndMetadata, typing.Sequence[slice], typing.Sequence[slice], DataAndMetadata.DataMetadata]] = list()
+        self.__pending_written_metadata: typing.Optional[DataAndMetadata.DataMetadata] = None
+        self.__pending_written_slices: typing.List[typing.Sequence[slice]] = list()
+        self.__data_changed_region: typing.Optional[DataRegionType] = None
+        self.__change_data_region_changed = False
         self.__content_changed = False
         self.__display_data_channel_refs = set[weakref.ReferenceType["DisplayItem.DisplayDataChannel"]]()
         if data is not None:
@@ -860,6 +866,7 @@ class DataItem(Persistence.PersistentObject):
         with self.__change_count_lock:
             if self.__change_count == 0:
                 self.__change_thread = threading.current_thread()
+                self.__change_data_region_changed = False
             else:
                 if self.__change_thread != threading.current_thread():
                     warnings.warn('begin changes from different threads', RuntimeWarning, stacklevel=2)
@@ -921,22 +928,57 @@ class DataItem(Persistence.PersistentObject):
 
     def queue_partial_update(self, partial_xdata: DataAndMetadata.DataAndMetadata, *, src_slice: typing.Sequence[slice],
                              dst_slice: typing.Sequence[slice], metadata: DataAndMetadata.DataMetadata) -> None:
+        """Queue a partial update of the data. May be called from any thread.
+
+        When the data is resident and matches the metadata, the partial data is written directly into the data on the
+        calling thread; the main thread is left to update the metadata and notify listeners of the changed region.
+        Otherwise, the partial data is copied on the main thread in update_to_pending_xdata.
+
+        Data written directly holds a data reference until the main thread has handled it so that the data cannot be
+        unloaded (and the written data lost) in the meantime.
+        """
         if self._closed:
             raise Exception(_("Cannot update deleted data item"))
         with self.__pending_xdata_lock:
-            self.__pending_queue.append((partial_xdata, src_slice, dst_slice, metadata))
+            # the data ref count mutex is held while checking and writing so that the data cannot be unloaded between.
+            with self.__data_ref_count_mutex:
+                data = self.__data
+                data_metadata = self.__data_metadata
+                if (not self.__pending_queue and self.__pending_xdata is None and self.__data_ref_count > 0 and
+                        isinstance(data, numpy.ndarray) and data_metadata and
+                        data.shape == metadata.data_shape == data_metadata.data_shape and
+                        data.dtype == metadata.data_dtype == data_metadata.data_dtype == partial_xdata.data_dtype):
+                    data[tuple(dst_slice)] = partial_xdata._data_ex[tuple(src_slice)]
+                    if self.__pending_written_metadata is None:
+                        self.increment_data_ref_count()  # released in update_to_pending_xdata
+                    self.__pending_written_metadata = metadata
+                    self.__pending_written_slices.append(dst_slice)
+                else:
+                    self.__pending_queue.append((partial_xdata, src_slice, dst_slice, metadata))
 
     def update_to_pending_xdata(self) -> None:
         with self.__pending_xdata_lock:
             pending_xdata = self.__pending_xdata
             pending_queue = self.__pending_queue
+            pending_written_metadata = self.__pending_written_metadata
+            pending_written_slices = self.__pending_written_slices
             self.__pending_xdata = None
             self.__pending_queue = list()
-        if pending_xdata or pending_queue:
+            self.__pending_written_metadata = None
+            self.__pending_written_slices = list()
+        if pending_xdata or pending_queue or pending_written_metadata:
             assert threading.current_thread() == threading.main_thread()
             with self.data_item_changes():
                 # it is an error to have both pending xdata and a pending queue
                 assert not pending_xdata or not pending_queue
+                if pending_written_metadata:
+                    # data written directly on the producer thread precedes anything in the queue. release the data
+                    # reference taken by the producer thread once the written data has been handled.
+                    try:
+                        self.__set_data_metadata_partial(pending_written_metadata, pending_written_metadata.timestamp,
+                                                         get_bounding_region(pending_written_slices))
+                    finally:
+                        self.decrement_data_ref_count()
                 if pending_xdata:
                     self.set_xdata(pending_xdata, data_modified=pending_xdata.timestamp)
                 for partial_xdata, partial_src_slice, partial_dst_slice, partial_metadata in pending_queue:
@@ -1182,6 +1224,11 @@ class DataItem(Persistence.PersistentObject):
     def is_data_loaded(self) -> bool:
         return self.__data is not None
 
+    @property
+    def data_changed_region(self) -> typing.Optional[DataRegionType]:
+        """Return the region of the data changed by the most recent partial update, or None if all data changed."""
+        return self.__data_changed_region
+
     @property
     def data_metadata(self) -> typing.Optional[DataAndMetadata.DataMetadata]:
         return self.__data_metadata
@@ -1238,6 +1285,8 @@ class DataItem(Persistence.PersistentObject):
                                        data_modified: typing.Optional[datetime.datetime] = None) -> None:
         assert self.__data_ref_count > 0
         self.__data = data_and_metadata.data if data_and_metadata else None
+        self.__data_changed_region = None
+        self.__change_data_region_changed = True
         if data_and_metadata:
             self.__set_data_metadata_direct(data_and_metadata.data_metadata, data_modified)
         self.__change_changed = True
@@ -1294,6 +1343,54 @@ class DataItem(Persistence.PersistentObject):
         finally:
             self.decrement_data_ref_count()
 
+    def append_data(self, data_and_metadata: DataAndMetadata.DataAndMetadata, data_modified: typing.Optional[datetime.datetime] = None) -> None:
+        """Appends the data of data_and_metadata along the first axis of the existing data.
+
+        The data must match the existing data shape except for the first axis and the existing data dtype. The
+        calibrations and metadata of the existing data are kept. If there is no existing data, the data and metadata are
+        set instead. Unless writing is delayed, only the appended data is written to storage; storage handlers that
+        support it grow the stored data in place.
+        """
+        data_metadata = self.__data_metadata
+        if not data_metadata:
+            self.set_data_and_metadata(data_and_metadata, data_modified)
+            return
+        data = data_and_metadata.data
+        assert data is not None
+        if tuple(data.shape[1:]) != tuple(data_metadata.data_shape[1:]) or data.dtype != data_metadata.data_dtype:
+            raise ValueError(f"Cannot append data {data.shape} {data.dtype} to data {data_metadata.data_shape} {data_metadata.data_dtype}.")
+        with self.data_source_changes():
+            self.increment_data_ref_count()
+            try:
+                data_shape = (data_metadata.data_shape[0] + data.shape[0],) + tuple(data_metadata.data_shape[1:])
+                data_descriptor = data_metadata.data_descriptor
+                if self.persistent_object_context and not self.is_write_delayed:
+                    self.append_external_data("data", data, (data_descriptor.is_sequence, data_descriptor.collection_dimension_count, data_descriptor.datum_dimension_count))
+                    self.__data = typing.cast(typing.Optional[_ImageDataType], self.read_external_data("data"))
+                    self.__data_and_metadata_unloadable = True
+                else:
+                    assert self.__data is not None
+                    self.__data = numpy.concatenate([self.__data, data])
+                new_data_metadata = DataAndMetadata.DataMetadata(data_shape_and_dtype=(data_shape, data_metadata.data_dtype),
+                                                                 intensity_calibration=data_metadata.intensity_calibration,
+                                                                 dimensional_calibrations=data_metadata.dimensional_calibrations,
+                                                                 metadata=data_metadata.metadata,
+                                                                 timestamp=data_metadata.timestamp,
+                                                                 data_descriptor=data_descriptor,
+                                                                 timezone=data_metadata.timezone,
+                                                                 timezone_offset=data_metadata.timezone_offset)
+                # the data shape changes, so listeners treat this as a change of all data.
+                self.__data_changed_region = None
+                self.__change_data_region_changed = True
+                self.__set_data_metadata_direct(new_data_metadata, data_modified)
+                self.__change_changed = True
+                self.__change_data_changed = True
+                if self._session_manager:
+                    session_id = self._session_manager.current_session_id
+                    self.session_id = session_id
+            finally:
+                self.decrement_data_ref_count()
+
     def set_data_and_metadata_partial(self, data_metadata: DataAndMetadata.DataMetadata,
                                       data_and_metadata: DataAndMetadata.DataAndMetadata, src: typing.Sequence[slice],
                                       dst: typing.Sequence[slice], update_metadata: bool = False,
@@ -1325,26 +1422,56 @@ class DataItem(Persistence.PersistentObject):
                 if self.__data is not None:
                     date_modified = data_metadata.timestamp if self.__data_and_metadata_first_update_after_reserve else self.__data_metadata.timestamp if self.__data_metadata else None
                     self.__data_and_metadata_first_update_after_reserve = False
+                    self.__set_data_changed_region(tuple(dst))
                     if update_metadata or date_modified:
                         self.__set_data_metadata_direct(data_metadata, date_modified)
                     assert self.data_shape == data_metadata.data_shape
                     assert self.data_dtype == data_metadata.data_dtype
                     assert self.data_dtype == data_and_metadata.data_dtype, f"{self.data_dtype=} == {data_and_metadata.data_dtype=}"
                     self.__data[tuple(dst)] = data_and_metadata._data_ex[tuple(src)]
-                    # mark changes and update session
-                    self.__change_changed = True
-                    self.__change_data_changed = True
-                    if self._session_manager:
-                        session_id = self._session_manager.current_session_id
-                        self.session_id = session_id
-                    # set data_shape as a way to update 'modified' property
-                    self._set_persistent_property_value("data_shape", self.data_shape)
-                    if self.persistent_object_context and not self.is_write_delayed:
-                        self.write_external_data("data", self.__data)
-                        self.__data_and_metadata_unloadable = True
+                    self.__partial_data_changed()
             finally:
                 self.decrement_data_ref_count()
 
+    def __set_data_metadata_partial(self, data_metadata: DataAndMetadata.DataMetadata,
+                                    data_modified: typing.Optional[datetime.datetime],
+                                    region: DataRegionType) -> None:
+        # the partial data has already been written into the data. update the metadata and notify listeners.
+        with self.data_source_changes():
+            self.increment_data_ref_count()
+            try:
+                if self.__data is not None:
+                    date_modified = data_modified if self.__data_and_metadata_first_update_after_reserve else self.__data_metadata.timestamp if self.__data_metadata else None
+                    self.__data_and_metadata_first_update_after_reserve = False
+                    self.__set_data_changed_region(region)
+                    self.__set_data_metadata_direct(data_metadata, date_modified)
+                    self.__partial_data_changed()
+            finally:
+                self.decrement_data_ref_count()
+
+    def __set_data_changed_region(self, region: DataRegionType) -> None:
+        # the changed region accumulates until listeners are notified at the end of the change block. a full data
+        # change earlier in the same change block (region is None) stays a full data change. the region is set before
+        # any other change so that listeners triggered by the metadata change see the region.
+        if self.__change_data_region_changed:
+            self.__data_changed_region = get_bounding_region([self.__data_changed_region, region]) if self.__data_changed_region is not None else None
+        else:
+            self.__data_changed_region = region
+        self.__change_data_region_changed = True
+
+    def __partial_data_changed(self) -> None:
+        # mark changes and update session
+        self.__change_changed = True
+        self.__change_data_changed = True
+        if self._session_manager:
+            session_id = self._session_manager.current_session_id
+            self.session_id = session_id
+        # set data_shape as a way to update 'modified' property
+        self._set_persistent_property_value("data_shape", self.data_shape)
+        if self.persistent_object_context and not self.is_write_delayed:
+            self.write_external_data("data", self.__data)
+            self.__data_and_metadata_unloadable = True
+
     @property
     def data_shape(self) -> typing.Optional[DataAndMetadata.ShapeType]:
         return self.__data_metadata.data_shape if self.__data_metadata else None
@@ -1493,6 +1620,17 @@ class DataItem(Persistence.PersistentObject):
         Metadata.delete_metadata_value(self, key)
 
 
+def get_bounding_region(regions: typing.Sequence[typing.Sequence[slice]]) -> DataRegionType:
+    """Return the smallest region containing all of the regions. Regions are sequences of slices with unit step."""
+    bounding_region = list(regions[0])
+    for region in regions[1:]:
+        for i, (s1, s2) in enumerate(zip(bounding_region, region)):
+            start = min(s1.start or 0, s2.start or 0)
+            stop = max(s1.stop, s2.stop) if s1.stop is not None and s2.stop is not None else None
+            bounding_region[i] = slice(start, stop)
+    return tuple(bounding_region)
+
+
 def new_data_item(data_and_metadata_in: typing.Optional[DataAndMetadata._DataAndMetadataLike] = None) -> DataItem:
     data_and_metadata = DataAndMetadata.promote_ndarray(data_and_metadata_in) if data_and_metadata_in is not None else None
     data_item = DataItem(large_format=len(data_and_metadata.dimensional_shape) > 2 if data_and_metadata else False)
@@ -9,12 +9,15 @@ import dataclasses
 import datetime
 import functools
 import gettext
+import json
 import math
 import numbers
 import weakref
 
 import numpy
+import numpy.typing
 import operator
+import os
 import threading
 import types
 import typing
@@ -342,12 +345,17 @@ class CalibratedSizeFloatToStringConverter(Converter.ConverterLike[float, str]):
 
 
 class AdjustmentType(typing.Protocol):
+    # pointwise adjustments map each value independently of the other values and may be tabulated.
+    is_pointwise: bool
+
     def transform(self, data: _ImageDataType, display_limits: typing.Tuple[float, float]) -> _ImageDataType: ...
 
 
 def adjustment_factory(adjustment_d: Persistence.PersistentDictType) -> typing.Optional[AdjustmentType]:
     if adjustment_d.get("type", None) == "gamma":
         class AdjustGamma:
+            is_pointwise = True
+
             def __init__(self, gamma: float) -> None:
                 self.__gamma = gamma
 
@@ -357,6 +365,8 @@ def adjustment_factory(adjustment_d: Persistence.PersistentDictType) -> typing.O
         return AdjustGamma(adjustment_d.get("gamma", 1.0))
     elif adjustment_d.get("type", None) == "log":
         class AdjustLog:
+            is_pointwise = True
+
             def transform(self, data: _ImageDataType, display_limits: typing.Tuple[float, float]) -> _ImageDataType:
                 range = display_limits[1] - display_limits[0]
                 c = 1.0 / (numpy.log2(1 + range))
@@ -365,19 +375,161 @@ def adjustment_factory(adjustment_d: Persistence.PersistentDictType) -> typing.O
         return AdjustLog()
     elif adjustment_d.get("type", None) == "equalized":
         class AdjustEqualized:
+            is_pointwise = False
+
             def transform(self, data: _ImageDataType, display_limits: typing.Tuple[float, float]) -> _ImageDataType:
                 data = numpy.clip(data, 0.0, 1.0)
-                histogram, bins = numpy.histogram(data.flatten(), 256, density=True)
+                histogram, bins = numpy.histogram(data.ravel(), 256, density=True)
                 histogram_cdf = histogram.cumsum()
                 histogram_cdf = histogram_cdf / histogram_cdf[-1]
-                equalized = numpy.interp(data.flatten(), bins[:-1], histogram_cdf)
-                return numpy.reshape(equalized, data.shape)
+                return typing.cast(_ImageDataType, numpy.interp(data, bins[:-1], histogram_cdf))
 
         return AdjustEqualized()
     else:
         return None
 
 
+ADJUSTMENT_LUT_SIZE = 65536
+
+# the largest step between adjacent lookup table entries. a value is looked up in the nearest entry, so the error is at
+# most half of this step; this keeps the error within half of an 8-bit display level.
+ADJUSTMENT_LUT_MAX_STEP = 1.0 / 256
+
+
+@functools.lru_cache(maxsize=16)
+def _get_adjustment_lut_cached(adjustments_key: str, display_range: typing.Tuple[float, float]) -> typing.Optional[_ImageDataType]:
+    adjustments = [adjustment_factory(adjustment_d) for adjustment_d in json.loads(adjustments_key)]
+    if not adjustments or not all(adjustment and adjustment.is_pointwise for adjustment in adjustments):
+        return None
+    lut = numpy.linspace(0.0, 1.0, ADJUSTMENT_LUT_SIZE, dtype=numpy.float32)
+    for adjustment in adjustments:
+        assert adjustment
+        lut = adjustment.transform(lut, display_range)
+    lut = numpy.asarray(lut, dtype=numpy.float32)
+    if not numpy.all(numpy.isfinite(lut)) or numpy.amax(numpy.abs(numpy.diff(lut))) > ADJUSTMENT_LUT_MAX_STEP:
+        return None
+    lut.flags.writeable = False
+    return lut
+
+
+def get_adjustment_lut(adjustments: typing.Sequence[Persistence.PersistentDictType], display_range: typing.Tuple[float, float]) -> typing.Optional[_ImageDataType]:
+    """Return a lookup table of the adjustments applied to normalized data, or None if not tabulated.
+
+    The table maps normalized data in [0, 1] sampled at ADJUSTMENT_LUT_SIZE points to the adjusted data. Only
+    pointwise adjustments that are smooth enough to be looked up within the display precision are tabulated.
+    """
+    adjustments_key = json.dumps([{k: v for k, v in adjustment_d.items() if k != "uuid"} for adjustment_d in adjustments], sort_keys=True)
+    return _get_adjustment_lut_cached(adjustments_key, (float(display_range[0]), float(display_range[1])))
+
+
+def _get_index_dtype(dtype: numpy.typing.DTypeLike) -> numpy.typing.DTypeLike:
+    # small integer and float32 data is indexed in float32; wider data is indexed in float64 to keep precision for
+    # narrow display ranges far from zero.
+    dtype = numpy.dtype(dtype)
+    return numpy.float32 if dtype.itemsize <= 2 or dtype == numpy.float32 else numpy.float64
+
+
+def apply_adjustment_lut(data: _ImageDataType, display_range: typing.Tuple[float, float], lut: _ImageDataType) -> _ImageDataType:
+    """Normalize the data to the display range and look up the adjusted values in the table in a single pass.
+
+    NaN values remain NaN, matching the result of applying the adjustments directly.
+    """
+    display_limit_low, display_limit_high = display_range
+    lut_size = lut.shape[0]
+    scale = (lut_size - 1) / (display_limit_high - display_limit_low) if display_limit_high != display_limit_low else 0.0
+    indexes = numpy.subtract(data, display_limit_low, dtype=_get_index_dtype(data.dtype))
+    indexes *= scale
+    indexes += 0.5
+    is_floating = numpy.issubdtype(data.dtype, numpy.floating)
+    nan_mask = numpy.isnan(indexes) if is_floating else None
+    numpy.clip(indexes, 0, lut_size - 1, out=indexes)
+    if nan_mask is not None:
+        indexes[nan_mask] = 0
+    adjusted_data = lut[indexes.astype(numpy.uint16 if lut_size <= 65536 else numpy.intp)]
+    if nan_mask is not None and numpy.any(nan_mask):
+        adjusted_data[nan_mask] = numpy.nan
+    return typing.cast(_ImageDataType, adjusted_data)
+
+
+@dataclasses.dataclass(frozen=True)
+class DisplayRGBALookupTable:
+    """A table mapping display data to packed uint32 RGBA values.
+
+    A display data value d is looked up at index (d - offset) * scale, rounded if rounded or truncated otherwise, and
+    clipped to the table.
+    """
+    table: numpy.typing.NDArray[numpy.uint32]
+    offset: float
+    scale: float
+    rounded: bool
+
+
+def get_display_rgba_lut(adjustments: typing.Sequence[Persistence.PersistentDictType],
+                         display_range: typing.Optional[typing.Tuple[float, float]],
+                         transformed_display_range: typing.Tuple[float, float],
+                         color_map_data: typing.Optional[_ImageDataType]) -> typing.Optional[DisplayRGBALookupTable]:
+    """Return the table fusing normalization, adjustments, brightness/contrast and color map, or None if not tabulated.
+
+    Without adjustments, the display data is scaled by the transformed display range onto the color map. With pointwise
+    adjustments, the display data is normalized by the display range onto the adjustment lookup table, which has been
+    scaled by the transformed display range onto the color map.
+    """
+    color_map_rgba = ColorMaps.get_color_map_rgba(color_map_data)
+    color_count = color_map_rgba.shape[0]
+    transformed_low, transformed_high = transformed_display_range
+    m = (color_count - 1) / (transformed_high - transformed_low) if transformed_high != transformed_low else 1.0
+    if not adjustments:
+        return DisplayRGBALookupTable(color_map_rgba, transformed_low, m, False)
+    if display_range is None:
+        return None
+    adjustment_lut = get_adjustment_lut(adjustments, display_range)
+    if adjustment_lut is None:
+        return None
+    color_indexes = numpy.clip((m * (adjustment_lut - transformed_low)).astype(int), 0, color_count - 1)
+    display_low, display_high = display_range
+    scale = (adjustment_lut.shape[0] - 1) / (display_high - display_low) if display_high != display_low else 0.0
+    return DisplayRGBALookupTable(color_map_rgba[color_indexes], display_low, scale, True)
+
+
+DISPLAY_RGBA_CHUNK_SIZE = 256 * 1024  # elements per chunk; small enough for the intermediate to stay in cache.
+DISPLAY_RGBA_PARALLEL_SIZE = 1024 * 1024  # elements above which chunks are processed by the executor.
+
+_display_rgba_executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4), thread_name_prefix="display_rgba")
+
+
+def _calculate_display_rgba_chunk(data: _ImageDataType, display_rgba: numpy.typing.NDArray[numpy.uint32], lut: DisplayRGBALookupTable) -> None:
+    # a single intermediate (the indexes) is produced per chunk.
+    indexes = numpy.subtract(data, lut.offset, dtype=_get_index_dtype(data.dtype))
+    indexes *= lut.scale
+    if lut.rounded:
+        indexes += 0.5
+    # fmax/fmin map NaN to the low end of the table.
+    numpy.fmax(indexes, 0, out=indexes)
+    numpy.fmin(indexes, lut.table.shape[0] - 1, out=indexes)
+    numpy.take(lut.table, indexes.astype(numpy.intp), out=display_rgba)
+
+
+def calculate_display_rgba(data: _ImageDataType, lut: DisplayRGBALookupTable, *, use_executor: bool = True) -> numpy.typing.NDArray[numpy.uint32]:
+    """Return the packed uint32 RGBA for the 2D data, processing the data in chunks of rows.
+
+    Large data is processed in parallel on a shared executor; numpy releases the GIL for each of the steps.
+    """
+    assert data.ndim == 2
+    display_rgba = numpy.empty(data.shape, numpy.uint32)
+    if data.size == 0:
+        return display_rgba
+    rows_per_chunk = max(1, DISPLAY_RGBA_CHUNK_SIZE // max(1, data.shape[1]))
+    row_slices = [slice(row, min(row + rows_per_chunk, data.shape[0])) for row in range(0, data.shape[0], rows_per_chunk)]
+    if use_executor and data.size >= DISPLAY_RGBA_PARALLEL_SIZE and len(row_slices) > 1:
+        futures = [_display_rgba_executor.submit(_calculate_display_rgba_chunk, data[row_slice], display_rgba[row_slice], lut) for row_slice in row_slices]
+        for future in futures:
+            future.result()
+    else:
+        for row_slice in row_slices:
+            _calculate_display_rgba_chunk(data[row_slice], display_rgba[row_slice], lut)
+    return display_rgba
+
+
 @typing.runtime_checkable
 class ProcessorLike(typing.Protocol):
     """A processor like object that can be used to process data and metadata.
@@ -478,6 +630,11 @@ class ProcessorBase(ProcessorLike):
             self.execute()
             return self.__results.get(key, None)
 
+    def get_cached_result(self, key: str) -> typing.Any:
+        # return the result only if it has already been computed. never computes the result.
+        with self.__lock:
+            return self.__results.get(key, None) if not self.__dirty else None
+
     def set_result(self, key: str, value: typing.Any) -> None:
         with self.__lock:
             self.__results[key] = value
@@ -487,15 +644,121 @@ class ProcessorBase(ProcessorLike):
         return DataAndMetadata.promote_ndarray(input_data_and_metadata) if input_data_and_metadata is not None else None
 
 
+class SliceSumCache:
+    """Cache the cumulative sum along the signal axis of a collection of 1d data.
+
+    With the cumulative sum, the sum over any slice of the signal axis is the difference of two planes, independent of
+    the slice width. The cumulative sum is built in the background on the first slice sum request and is used once it
+    is available; until then, slice sums are calculated directly. The cache is invalidated when the data changes.
+
+    To limit the memory, the cumulative sum may only be kept every few planes (the stride); the planes between the
+    slice bounds and the nearest kept planes are then summed directly, which is still independent of the slice width.
+    """
+    _executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="slice_sum_cache")
+
+    # the largest cumulative sum to keep and the largest stride to keep it with; other data is summed directly.
+    max_bytes = 256 * 1024 * 1024
+    max_stride = 16
+
+    def __init__(self) -> None:
+        self.__lock = threading.RLock()
+        self.__generation = 0
+        self.__key: typing.Optional[typing.Tuple[typing.Any, ...]] = None
+        self.__cumulative_sum: typing.Optional[_ImageDataType] = None
+
+    def invalidate(self) -> None:
+        with self.__lock:
+            self.__generation += 1
+            self.__key = None
+            self.__cumulative_sum = None
+
+    @classmethod
+    def _get_cumulative_sum_layout(cls, shape: DataAndMetadata.ShapeType, dtype: numpy.typing.DTypeLike) -> typing.Optional[typing.Tuple[numpy.typing.DTypeLike, int]]:
+        """Return the dtype and stride of the cumulative sum of data, or None if it is not cached.
+
+        Integer data is accumulated in the narrowest integer type that holds the sum over the whole signal axis exactly;
+        floating point data is accumulated in float64.
+        """
+        sum_dtype = numpy.zeros((1,), dtype=dtype).sum().dtype
+        if not numpy.issubdtype(sum_dtype, numpy.number) or numpy.issubdtype(sum_dtype, numpy.complexfloating):
+            return None
+        cumulative_sum_dtype: numpy.typing.DTypeLike = sum_dtype
+        if numpy.issubdtype(sum_dtype, numpy.floating):
+            cumulative_sum_dtype = numpy.float64
+        elif numpy.issubdtype(dtype, numpy.integer):
+            dtype_info = numpy.iinfo(dtype)
+            if max(-int(dtype_info.min), int(dtype_info.max)) * shape[-1] <= numpy.iinfo(numpy.int32).max:
+                cumulative_sum_dtype = numpy.int32
+        plane_bytes = int(numpy.prod(shape[:-1])) * numpy.dtype(cumulative_sum_dtype).itemsize
+        stride = 1
+        while plane_bytes * (shape[-1] // stride + 1) > cls.max_bytes:
+            stride *= 2
+            if stride > cls.max_stride:
+                return None
+        return cumulative_sum_dtype, stride
+
+    def get_slice_sum(self, data: _ImageDataType, data_key: typing.Any, slice_center: int, slice_width: int) -> typing.Optional[_ImageDataType]:
+        """Return the sum over the slice of the last axis of data, or None if the cumulative sum is not available.
+
+        The data key identifies the data within the current generation (for instance the sequence index).
+        """
+        layout = self._get_cumulative_sum_layout(data.shape, data.dtype)
+        if not layout:
+            return None
+        cumulative_sum_dtype, stride = layout
+        with self.__lock:
+            key = (self.__generation, data_key, data.shape, data.dtype)
+            cumulative_sum = self.__cumulative_sum if self.__key == key else None
+            if self.__key != key:
+                self.__key = key
+                self.__cumulative_sum = None
+                SliceSumCache._executor.submit(self.__build_cumulative_sum, data, key, cumulative_sum_dtype, stride)
+        if cumulative_sum is None:
+            return None
+        # same slice bounds as Core.function_slice_sum.
+        slice_start = max(int(slice_center - slice_width * 0.5 + 0.5), 0)
+        slice_end = max(min(data.shape[-1], slice_start + slice_width), slice_start)
+        # the kept planes within the slice; the planes outside of them are summed directly.
+        kept_start = -(-slice_start // stride)
+        kept_end = slice_end // stride
+        if kept_start <= kept_end:
+            slice_sum = cumulative_sum[..., kept_end] - cumulative_sum[..., kept_start]
+            if slice_start < kept_start * stride:
+                slice_sum += numpy.sum(data[..., slice_start:kept_start * stride], axis=-1, dtype=cumulative_sum_dtype)
+            if kept_end * stride < slice_end:
+                slice_sum += numpy.sum(data[..., kept_end * stride:slice_end], axis=-1, dtype=cumulative_sum_dtype)
+        else:
+            slice_sum = numpy.sum(data[..., slice_start:slice_end], axis=-1, dtype=cumulative_sum_dtype)
+        sum_dtype = numpy.zeros((1,), dtype=data.dtype).sum().dtype
+        return typing.cast(_ImageDataType, slice_sum.astype(sum_dtype, copy=False))
+
+    def __build_cumulative_sum(self, data: _ImageDataType, key: typing.Tuple[typing.Any, ...], dtype: numpy.typing.DTypeLike, stride: int) -> None:
+        with self.__lock:
+            if self.__key != key:
+                return
+        plane_count = data.shape[-1] // stride
+        cumulative_sum = numpy.zeros(data.shape[:-1] + (plane_count + 1,), dtype=dtype)
+        if stride == 1:
+            numpy.cumsum(data, axis=-1, dtype=dtype, out=cumulative_sum[..., 1:])
+        else:
+            for plane_index in range(plane_count):
+                numpy.sum(data[..., plane_index * stride:(plane_index + 1) * stride], axis=-1, dtype=dtype, out=cumulative_sum[..., plane_index + 1])
+                cumulative_sum[..., plane_index + 1] += cumulative_sum[..., plane_index]
+        with self.__lock:
+            if self.__key == key:
+                self.__cumulative_sum = cumulative_sum
+
+
 class ElementDataProcessor(ProcessorBase):
     def __init__(self, *,
                     data: typing.Union[typing.Optional[DataAndMetadata._DataAndMetadataLike], ProcessorConnection] = None,
                     sequence_index: typing.Union[typing.Optional[int], ProcessorConnection] = None,
                     collection_index: typing.Union[typing.Optional[DataAndMetadata.PositionType], ProcessorConnection] = None,
                     slice_center: typing.Union[typing.Optional[int], ProcessorConnection] = None,
-                    slice_width: typing.Union[typing.Optional[int], ProcessorConnection] = None) -> None:
+                    slice_width: typing.Union[typing.Optional[int], ProcessorConnection] = None,
+                    slice_sum_cache: typing.Optional[SliceSumCache] = None) -> None:
         super().__init__(data=data, sequence_index=sequence_index, collection_index=collection_index,
-                         slice_center=slice_center, slice_width=slice_width)
+                         slice_center=slice_center, slice_width=slice_width, slice_sum_cache=slice_sum_cache)
 
     def _execute(self) -> None:
         input_data_and_metadata = self._get_data_and_metadata_like("data")
@@ -503,16 +766,39 @@ class ElementDataProcessor(ProcessorBase):
         collection_index = typing.cast(typing.Optional[DataAndMetadata.PositionType], self._get_parameter("collection_index"))
         slice_center = self._get_int("slice_center")
         slice_width = self._get_int("slice_width")
+        slice_sum_cache = typing.cast(typing.Optional[SliceSumCache], self._get_parameter("slice_sum_cache"))
         data_and_metadata: typing.Optional[DataAndMetadata.DataAndMetadata] = None
         if input_data_and_metadata:
-            data_and_metadata, modified = Core.function_element_data_no_copy(input_data_and_metadata,
-                                                                             sequence_index,
-                                                                             collection_index,
-                                                                             slice_center,
-                                                                             slice_width,
-                                                                             flag16=False)
+            if slice_sum_cache and input_data_and_metadata.collection_dimension_count == 2 and input_data_and_metadata.datum_dimension_count == 1:
+                data_and_metadata = self.__get_cached_slice_sum(input_data_and_metadata, sequence_index, slice_center, slice_width, slice_sum_cache)
+            if not data_and_metadata:
+                data_and_metadata, modified = Core.function_element_data_no_copy(input_data_and_metadata,
+                                                                                 sequence_index,
+                                                                                 collection_index,
+                                                                                 slice_center,
+                                                                                 slice_width,
+                                                                                 flag16=False)
         self.set_result("data", data_and_metadata)
 
+    def __get_cached_slice_sum(self, data_and_metadata: DataAndMetadata.DataAndMetadata, sequence_index: int,
+                               slice_center: int, slice_width: int, slice_sum_cache: SliceSumCache) -> typing.Optional[DataAndMetadata.DataAndMetadata]:
+        # the slice sum of the collection (at the sequence index), matching Core.function_element_data_no_copy.
+        data = data_and_metadata.data
+        if not isinstance(data, numpy.ndarray):
+            return None
+        if data_and_metadata.is_sequence:
+            sequence_index = min(max(sequence_index, 0), data.shape[0] - 1)
+            data = data[sequence_index]
+        slice_sum = slice_sum_cache.get_slice_sum(data, (sequence_index, data_and_metadata.timestamp), slice_center, slice_width)
+        if slice_sum is None or slice_sum.size == 0:
+            return None
+        return DataAndMetadata.new_data_and_metadata(data=slice_sum,
+                                                     intensity_calibration=data_and_metadata.intensity_calibration,
+                                                     dimensional_calibrations=data_and_metadata.dimensional_calibrations[-3:-1],
+                                                     timestamp=data_and_metadata.timestamp,
+                                                     timezone=data_and_metadata.timezone,
+                                                     timezone_offset=data_and_metadata.timezone_offset)
+
 
 class DisplayDataProcessor(ProcessorBase):
     def __init__(self, *,
@@ -529,29 +815,107 @@ class DisplayDataProcessor(ProcessorBase):
         self.set_result("data", data_and_metadata)
 
 
+@dataclasses.dataclass(frozen=True)
+class DataRowStatistics:
+    """The finite range and the count of non-finite values of each row (first index) of the display data.
+
+    A row with no finite values has a minimum of +inf and a maximum of -inf.
+    """
+    mins: _ImageDataType
+    maxs: _ImageDataType
+    nan_counts: numpy.typing.NDArray[numpy.int64]
+    inf_counts: numpy.typing.NDArray[numpy.int64]
+
+    def copy(self) -> DataRowStatistics:
+        return DataRowStatistics(numpy.copy(self.mins), numpy.copy(self.maxs), numpy.copy(self.nan_counts), numpy.copy(self.inf_counts))
+
+
+def calculate_data_row_statistics(rows: _ImageDataType) -> DataRowStatistics:
+    """Calculate the finite range and non-finite counts of each row of the 2d array rows.
+
+    The min and max are calculated in the usual two passes. NaN or Inf values propagate into the min or max of their
+    row, so only those rows are reduced again, with array operations, to exclude and count the non-finite values. NaN
+    values are skipped by fmin/fmax; the rarer rows containing Inf values are then reduced over their finite values.
+    """
+    mins = numpy.amin(rows, axis=1)
+    maxs = numpy.amax(rows, axis=1)
+    nan_counts = numpy.zeros(rows.shape[0], dtype=numpy.int64)
+    inf_counts = numpy.zeros(rows.shape[0], dtype=numpy.int64)
+    if numpy.issubdtype(rows.dtype, numpy.floating):
+        bad_rows = numpy.flatnonzero(~(numpy.isfinite(mins) & numpy.isfinite(maxs)))
+        if bad_rows.size > 0:
+            bad_row_data = rows[bad_rows] if bad_rows.size < rows.shape[0] else rows
+            nan_counts[bad_rows] = numpy.count_nonzero(numpy.isnan(bad_row_data), axis=1)
+            bad_mins = numpy.fmin.reduce(bad_row_data, axis=1)
+            bad_maxs = numpy.fmax.reduce(bad_row_data, axis=1)
+            inf_rows = numpy.flatnonzero(numpy.isinf(bad_mins) | numpy.isinf(bad_maxs))
+            if inf_rows.size > 0:
+                inf_row_data = bad_row_data[inf_rows]
+                finite_mask = numpy.isfinite(inf_row_data)
+                inf_counts[bad_rows[inf_rows]] = numpy.count_nonzero(numpy.isinf(inf_row_data), axis=1)
+                bad_mins[inf_rows] = numpy.amin(inf_row_data, axis=1, where=finite_mask, initial=numpy.inf)
+                bad_maxs[inf_rows] = numpy.amax(inf_row_data, axis=1, where=finite_mask, initial=-numpy.inf)
+            # a row with no finite values has an empty range.
+            mins[bad_rows] = numpy.where(numpy.isnan(bad_mins), numpy.inf, bad_mins)
+            maxs[bad_rows] = numpy.where(numpy.isnan(bad_maxs), -numpy.inf, bad_maxs)
+    return DataRowStatistics(mins, maxs, nan_counts, inf_counts)
+
+
 class DataRangeProcessor(ProcessorBase):
     def __init__(self, *,
                  data_metadata: DataAndMetadata.DataMetadata | ProcessorConnection | None = None,
-                 display_data: typing.Union[typing.Optional[DataAndMetadata._DataAndMetadataLike], ProcessorConnection] = None) -> None:
-        super().__init__(data_metadata=data_metadata, display_data=display_data)
+                 display_data: typing.Union[typing.Optional[DataAndMetadata._DataAndMetadataLike], ProcessorConnection] = None,
+                 previous_row_statistics: typing.Optional[DataRowStatistics] = None,
+                 dirty_region: typing.Optional[DataItem.DataRegionType] = None) -> None:
+        super().__init__(data_metadata=data_metadata, display_data=display_data,
+                         previous_row_statistics=previous_row_statistics, dirty_region=dirty_region)
 
     def _execute(self) -> None:
         data_metadata = typing.cast(DataAndMetadata.DataMetadata | None, self._get_parameter("data_metadata"))
         display_data_and_metadata = self._get_data_and_metadata_like("display_data")
         display_data = display_data_and_metadata.data if display_data_and_metadata else None
+        previous_row_statistics = typing.cast(typing.Optional[DataRowStatistics], self._get_parameter("previous_row_statistics"))
+        dirty_region = typing.cast(typing.Optional[DataItem.DataRegionType], self._get_parameter("dirty_region"))
         data_range: typing.Optional[typing.Tuple[float, float]]
+        row_statistics: typing.Optional[DataRowStatistics] = None
+        nan_count = 0
+        inf_count = 0
         if display_data is not None and display_data.shape and data_metadata:
             data_shape = data_metadata.data_shape
             data_dtype = data_metadata.data_dtype
             if Image.is_shape_and_dtype_rgb_type(data_shape, data_dtype):
                 data_range = (0, 255)
-            elif Image.is_shape_and_dtype_complex_type(data_shape, data_dtype):
-                data_range = (numpy.amin(display_data), numpy.amax(display_data))
             else:
-                data_range = (numpy.amin(display_data), numpy.amax(display_data))
+                # for partial updates of 2d or higher data, the statistics are tracked per row (first index) so that
+                # the next partial update only needs to examine the rows in the dirty region. the overall range is the
+                # range of the row ranges. otherwise the whole array is reduced at once, which is faster.
+                track_rows = dirty_region is not None and len(display_data.shape) > 1
+                rows = display_data.reshape(display_data.shape[0] if track_rows else 1, -1)
+                if (track_rows and previous_row_statistics is not None and dirty_region is not None and
+                        previous_row_statistics.mins.shape == (display_data.shape[0],) and
+                        previous_row_statistics.mins.dtype == display_data.dtype):
+                    row_slice = dirty_region[0]
+                    row_statistics = previous_row_statistics.copy()
+                    if rows[row_slice].size > 0:
+                        dirty_row_statistics = calculate_data_row_statistics(rows[row_slice])
+                        row_statistics.mins[row_slice] = dirty_row_statistics.mins
+                        row_statistics.maxs[row_slice] = dirty_row_statistics.maxs
+                        row_statistics.nan_counts[row_slice] = dirty_row_statistics.nan_counts
+                        row_statistics.inf_counts[row_slice] = dirty_row_statistics.inf_counts
+                elif rows.size > 0:
+                    row_statistics = calculate_data_row_statistics(rows)
+                if row_statistics is not None:
+                    data_range = (numpy.amin(row_statistics.mins), numpy.amax(row_statistics.maxs))
+                    nan_count = int(numpy.sum(row_statistics.nan_counts))
+                    inf_count = int(numpy.sum(row_statistics.inf_counts))
+                else:
+                    data_range = None
+                if not track_rows:
+                    row_statistics = None
         else:
             data_range = None
         if data_range is not None:
+            # non-finite values are excluded from the range; it is only non-finite if there are no finite values.
             if math.isnan(data_range[0]) or math.isnan(data_range[1]) or math.isinf(
                     data_range[0]) or math.isinf(data_range[1]):
                 data_range = (0.0, 0.0)
@@ -560,6 +924,9 @@ class DataRangeProcessor(ProcessorBase):
             if numpy.issubdtype(type(data_range[1]), numpy.bool_):
                 data_range = (data_range[0], int(data_range[1]))
         self.set_result("data_range", data_range)
+        self.set_result("row_statistics", row_statistics)
+        self.set_result("nan_count", nan_count)
+        self.set_result("inf_count", inf_count)
 
 
 class DisplayRangeProcessor(ProcessorBase):
@@ -590,20 +957,55 @@ class DisplayRGBProcessor(ProcessorBase):
                  adjusted_data: typing.Union[typing.Optional[DataAndMetadata._DataAndMetadataLike], ProcessorConnection] = None,
                  data_range: typing.Union[typing.Optional[typing.Tuple[float, float]], ProcessorConnection] = None,
                  display_range: typing.Union[typing.Optional[typing.Tuple[float, float]], ProcessorConnection] = None,
-                 color_map_data: typing.Union[typing.Optional[_ImageDataType], ProcessorConnection] = None) -> None:
-        super().__init__(adjusted_data=adjusted_data, data_range=data_range, display_range=display_range, color_map_data=color_map_data)
+                 color_map_data: typing.Union[typing.Optional[_ImageDataType], ProcessorConnection] = None,
+                 display_data: typing.Union[typing.Optional[DataAndMetadata._DataAndMetadataLike], ProcessorConnection] = None,
+                 untransformed_display_range: typing.Union[typing.Optional[typing.Tuple[float, float]], ProcessorConnection] = None,
+                 adjustments: typing.Optional[typing.Sequence[Persistence.PersistentDictType]] = None,
+                 previous_display_rgba: typing.Optional[_ImageDataType] = None,
+                 previous_display_range: typing.Optional[typing.Tuple[float, float]] = None,
+                 previous_untransformed_display_range: typing.Optional[typing.Tuple[float, float]] = None,
+                 dirty_region: typing.Optional[DataItem.DataRegionType] = None) -> None:
+        super().__init__(adjusted_data=adjusted_data, data_range=data_range, display_range=display_range, color_map_data=color_map_data,
+                         display_data=display_data, untransformed_display_range=untransformed_display_range, adjustments=adjustments,
+                         previous_display_rgba=previous_display_rgba, previous_display_range=previous_display_range,
+                         previous_untransformed_display_range=previous_untransformed_display_range,
+                         dirty_region=dirty_region)
 
     def _execute(self) -> None:
-        adjusted_data_and_metadata = self._get_data_and_metadata_like("adjusted_data")
         data_range = typing.cast(typing.Optional[typing.Tuple[float, float]], self._get_parameter("data_range"))
         display_range = typing.cast(typing.Optional[typing.Tuple[float, float]], self._get_parameter("display_range"))
         color_map_data = typing.cast(typing.Optional[_ImageDataType], self._get_parameter("color_map_data"))
+        adjustments = typing.cast(typing.Optional[typing.Sequence[Persistence.PersistentDictType]], self._get_parameter("adjustments")) or list()
+        previous_display_rgba = typing.cast(typing.Optional[_ImageDataType], self._get_parameter("previous_display_rgba"))
+        previous_display_range = typing.cast(typing.Optional[typing.Tuple[float, float]], self._get_parameter("previous_display_range"))
+        previous_untransformed_display_range = typing.cast(typing.Optional[typing.Tuple[float, float]], self._get_parameter("previous_untransformed_display_range"))
+        dirty_region = typing.cast(typing.Optional[DataItem.DataRegionType], self._get_parameter("dirty_region"))
         display_rgba_data: typing.Optional[_ImageDataType] = None
-        if adjusted_data_and_metadata:
-            if data_range is not None:  # workaround until validating and retrieving data stats is an atomic operation
-                # display_range is just display_limits but calculated if display_limits is None
-                display_rgba = Core.function_display_rgba(adjusted_data_and_metadata, display_range, color_map_data)
-                display_rgba_data = display_rgba.data if display_rgba else None
+        if data_range is not None and display_range is not None:  # workaround until validating and retrieving data stats is an atomic operation
+            # when the adjustments can be tabulated, go from the display data to the display rgba in a single pass
+            # without producing the normalized and adjusted data.
+            display_data_and_metadata = self._get_data_and_metadata_like("display_data")
+            display_data = display_data_and_metadata.data if display_data_and_metadata else None
+            untransformed_display_range = typing.cast(typing.Optional[typing.Tuple[float, float]], self._get_parameter("untransformed_display_range")) if adjustments else None
+            display_rgba_lut = get_display_rgba_lut(adjustments, untransformed_display_range, display_range, color_map_data)
+            if (display_data_and_metadata and isinstance(display_data, numpy.ndarray) and display_rgba_lut and
+                    display_data.ndim in (1, 2) and not display_data_and_metadata.is_data_rgb_type and not numpy.iscomplexobj(display_data)):
+                display_data_2d = display_data.reshape(1, *display_data.shape) if display_data.ndim == 1 else display_data
+                if (previous_display_rgba is not None and dirty_region is not None and len(dirty_region) == display_data.ndim and
+                        display_range == previous_display_range and untransformed_display_range == previous_untransformed_display_range and
+                        previous_display_rgba.shape == display_data_2d.shape):
+                    # only the dirty region changed and the display ranges are unchanged; color map the dirty region.
+                    dirty_region_2d = (slice(None),) + tuple(dirty_region) if display_data.ndim == 1 else tuple(dirty_region)
+                    display_rgba_data = numpy.copy(previous_display_rgba)
+                    display_rgba_data[dirty_region_2d] = calculate_display_rgba(display_data_2d[dirty_region_2d], display_rgba_lut)
+                else:
+                    display_rgba_data = calculate_display_rgba(display_data_2d, display_rgba_lut)
+            else:
+                adjusted_data_and_metadata = self._get_data_and_metadata_like("adjusted_data")
+                if adjusted_data_and_metadata:
+                    # display_range is just display_limits but calculated if display_limits is None
+                    display_rgba = Core.function_display_rgba(adjusted_data_and_metadata, display_range, color_map_data)
+                    display_rgba_data = display_rgba.data if display_rgba else None
         self.set_result("display_rgba", display_rgba_data)
 
 
@@ -643,7 +1045,17 @@ class AdjustedDataProcessor(ProcessorBase):
         display_range = typing.cast(typing.Optional[typing.Tuple[float, float]], self._get_parameter("display_range"))
         adjustments = typing.cast(typing.Optional[typing.Sequence[Persistence.PersistentDictType]], self._get_parameter("adjustments"))
         adjusted_data_and_metadata: typing.Optional[DataAndMetadata.DataAndMetadata] = display_data_and_metadata
-        if adjustments:
+        display_data = display_data_and_metadata.data if display_data_and_metadata else None
+        lut = get_adjustment_lut(adjustments, display_range) if adjustments and display_range is not None else None
+        if display_data_and_metadata and display_data is not None and display_range is not None and lut is not None and not numpy.iscomplexobj(display_data):
+            # pointwise adjustments are applied with a lookup table which also normalizes the data.
+            adjusted_data_and_metadata = DataAndMetadata.new_data_and_metadata(
+                apply_adjustment_lut(display_data, display_range, lut),
+                dimensional_calibrations=display_data_and_metadata.dimensional_calibrations,
+                timestamp=display_data_and_metadata.timestamp,
+                timezone=display_data_and_metadata.timezone,
+                timezone_offset=display_data_and_metadata.timezone_offset)
+        elif adjustments:
             # only request normalized data and metadata if required
             normalized_data_and_metadata = self._get_data_and_metadata_like("normalized_data")
             adjusted_data_and_metadata = normalized_data_and_metadata
@@ -740,19 +1152,48 @@ class DisplayValues:
                  display_limits: DisplayLimitsType,
                  complex_display_type: typing.Optional[str],
                  color_map_data: typing.Optional[_RGBA32Type], brightness: float, contrast: float,
-                 adjustments: typing.Sequence[Persistence.PersistentDictType]) -> None:
+                 adjustments: typing.Sequence[Persistence.PersistentDictType], *,
+                 previous_display_values: typing.Optional[DisplayValues] = None,
+                 dirty_region: typing.Optional[DataItem.DataRegionType] = None,
+                 slice_sum_cache: typing.Optional[SliceSumCache] = None) -> None:
         DisplayValues._count += 1
 
         self.__data_and_metadata = data_and_metadata
         self.__color_map_data = color_map_data
+        self.__parameters = (sequence_index, collection_index, slice_center, slice_width, display_limits,
+                             complex_display_type, brightness, contrast, list(adjustments))
 
         data_metadata = data_and_metadata.data_metadata if data_and_metadata else None
 
+        # if only a region of the data changed since the previous display values, and the display parameters are
+        # unchanged, the data range and display rgba are updated from the previous results for that region only. the
+        # data is shared with the previous display values, so the results are reused only if they were computed.
+        previous_row_statistics: typing.Optional[DataRowStatistics] = None
+        previous_display_range: typing.Optional[typing.Tuple[float, float]] = None
+        previous_untransformed_display_range: typing.Optional[typing.Tuple[float, float]] = None
+        previous_display_rgba: typing.Optional[_ImageDataType] = None
+        if (dirty_region is not None and previous_display_values and data_metadata and
+                previous_display_values.__parameters == self.__parameters and
+                previous_display_values.__color_map_data is color_map_data and
+                previous_display_values.data_metadata and
+                previous_display_values.data_metadata.data_shape_and_dtype == data_metadata.data_shape_and_dtype and
+                not data_metadata.is_sequence and not data_metadata.is_collection and
+                len(dirty_region) == len(data_metadata.data_shape)):
+            previous_row_statistics = typing.cast(typing.Optional[DataRowStatistics], previous_display_values.__data_range_processor.get_cached_result("row_statistics"))
+            if not any(adjustment_d.get("type", None) == "equalized" for adjustment_d in adjustments):
+                previous_display_range = previous_display_values.__transformed_display_range_processor.get_cached_result("display_range")
+                previous_untransformed_display_range = previous_display_values.__display_range_processor.get_cached_result("display_range") if adjustments else None
+                previous_display_rgba = previous_display_values.__display_rgb_processor.get_cached_result("display_rgba")
+        else:
+            dirty_region = None
+        self.__dirty_region = dirty_region
+
         self.__element_data_processor = ElementDataProcessor(data=data_and_metadata,
                                                              sequence_index=sequence_index,
                                                              collection_index=collection_index,
                                                              slice_center=slice_center,
-                                                             slice_width=slice_width)
+                                                             slice_width=slice_width,
+                                                             slice_sum_cache=slice_sum_cache)
 
         self.__display_data_processor = DisplayDataProcessor(
             element_data=ProcessorConnection(self.__element_data_processor, "data", "element_data"),
@@ -761,6 +1202,8 @@ class DisplayValues:
         self.__data_range_processor = DataRangeProcessor(
             data_metadata=data_metadata,
             display_data=ProcessorConnection(self.__display_data_processor, "data", "display_data"),
+            previous_row_statistics=previous_row_statistics,
+            dirty_region=dirty_region,
         )
 
         self.__display_range_processor = DisplayRangeProcessor(
@@ -796,7 +1239,14 @@ class DisplayValues:
             adjusted_data=ProcessorConnection(self.__adjusted_data_processor, "data", "adjusted_data"),
             data_range=ProcessorConnection(self.__data_range_processor, "data_range"),
             display_range=ProcessorConnection(self.__transformed_display_range_processor, "display_range"),
-            color_map_data=color_map_data
+            color_map_data=color_map_data,
+            display_data=ProcessorConnection(self.__display_data_processor, "data", "display_data"),
+            untransformed_display_range=ProcessorConnection(self.__display_range_processor, "display_range", "untransformed_display_range"),
+            adjustments=adjustments,
+            previous_display_rgba=previous_display_rgba,
+            previous_display_range=previous_display_range,
+            previous_untransformed_display_range=previous_untransformed_display_range,
+            dirty_region=dirty_region,
         )
 
         self.__transformed_data_processor = TransformedDataProcessor(
@@ -817,6 +1267,11 @@ class DisplayValues:
     def data_metadata(self) -> DataAndMetadata.DataMetadata | None:
         return self.__data_and_metadata.data_metadata if self.__data_and_metadata else None
 
+    @property
+    def dirty_region(self) -> typing.Optional[DataItem.DataRegionType]:
+        """Return the region of data changed since the previous display values, or None if all data changed."""
+        return self.__dirty_region
+
     @property
     def display_rgba_timestamp(self) -> typing.Optional[datetime.datetime]:
         data_metadata = self.data_metadata
@@ -834,6 +1289,16 @@ class DisplayValues:
     def data_range(self) -> typing.Optional[typing.Tuple[float, float]]:
         return typing.cast(typing.Optional[typing.Tuple[float, float]], self.__data_range_processor.get_result("data_range"))
 
+    @property
+    def data_nan_count(self) -> int:
+        """Return the number of NaN values in the display data. They are excluded from the data range."""
+        return typing.cast(int, self.__data_range_processor.get_result("nan_count"))
+
+    @property
+    def data_inf_count(self) -> int:
+        """Return the number of infinite values in the display data. They are excluded from the data range."""
+        return typing.cast(int, self.__data_range_processor.get_result("inf_count"))
+
     @property
     def display_range(self) -> typing.Optional[typing.Tuple[float, float]]:
         return typing.cast(typing.Optional[typing.Tuple[float, float]], self.__display_range_processor.get_result("display_range"))
@@ -909,6 +1374,7 @@ class DisplayDataChannel(Persistence.PersistentObject):
         self.__old_data_shape: typing.Optional[DataAndMetadata.ShapeType] = None
 
         self.__color_map_data: typing.Optional[_RGBA32Type] = None
+        self.__slice_sum_cache = SliceSumCache()
         self.modified_state = 0
 
         self.data_item_proxy_changed_event = Event.Event()
@@ -944,6 +1410,7 @@ class DisplayDataChannel(Persistence.PersistentObject):
         def connect_data_item(data_item_: typing.Optional[Persistence.PersistentObject]) -> None:
             data_item = typing.cast(DataItem.DataItem, data_item_)
             self.__disconnect_data_item_events()
+            self.__slice_sum_cache.invalidate()
             if self.__last_data_item:
                 for _ in range(self.__display_ref_count):
                     self.__last_data_item.decrement_data_ref_count()
@@ -1000,6 +1467,7 @@ class DisplayDataChannel(Persistence.PersistentObject):
         self.__computed_display_values_stream = typing.cast(typing.Any, None)
         # continue close.
         self.__disconnect_data_item_events()
+        self.__slice_sum_cache.invalidate()
         self.__current_data_item = None
         super().close()
 
@@ -1188,6 +1656,7 @@ class DisplayDataChannel(Persistence.PersistentObject):
             self.modified_state += 1
 
         def data_changed() -> None:
+            self.__slice_sum_cache.invalidate()
             data_metadata = self._get_data_metadata()
             new_data_shape = data_metadata.data_shape if data_metadata else None
             if new_data_shape != self.__old_data_shape:
@@ -1569,7 +2038,10 @@ class DisplayDataChannel(Persistence.PersistentObject):
                                                self.display_limits,
                                                self.complex_display_type,
                                                self.__color_map_data, self.brightness,
-                                               self.contrast, self.adjustments)
+                                               self.contrast, self.adjustments,
+                                               previous_display_values=self.__display_values_stream.value,
+                                               dirty_region=self.__data_item.data_changed_region,
+                                               slice_sum_cache=self.__slice_sum_cache)
                 self.__has_pending_display_values = True
                 self.__display_values_stream.send_value(display_values)
                 return display_values
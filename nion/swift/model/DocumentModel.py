@@ -11,7 +11,9 @@ import datetime
 import functools
 import gettext
 import logging
+import os
 import threading
+import time
 import types
 import typing
 import uuid
@@ -233,6 +235,46 @@ class TransactionManager:
                 self.__close_transaction_items(old_items)
 
 
+class ComputationScheduler:
+    """Determine when a computation may be evaluated again.
+
+    The delay between evaluations of a computation is derived from its last execution time and the fraction of a core
+    (the budget) the computation may use while its inputs keep changing. Computations feeding a visible display item
+    get a larger budget than computations that do not. Requests arriving slower than the delay run immediately, so a
+    fast computation follows the rate of its inputs.
+
+    This class is only used from the main thread.
+    """
+
+    minimum_delay = 0.005
+    maximum_delay = 1.0
+    visible_budget = 0.75
+    hidden_budget = 0.25
+
+    def __init__(self, is_visible_fn: typing.Callable[[Symbolic.Computation], bool]) -> None:
+        self.__is_visible_fn = is_visible_fn
+        self.__last_finish_times = weakref.WeakKeyDictionary[Symbolic.Computation, float]()
+        self.__last_execution_times = weakref.WeakKeyDictionary[Symbolic.Computation, float]()
+
+    @staticmethod
+    def get_worker_count() -> int:
+        return max(2, os.cpu_count() or 8)
+
+    def get_delay(self, computation: Symbolic.Computation) -> float:
+        """Return the time to wait before evaluating the computation."""
+        last_finish_time = self.__last_finish_times.get(computation)
+        if last_finish_time is None:
+            return 0.0
+        budget = self.visible_budget if self.__is_visible_fn(computation) else self.hidden_budget
+        execution_time = self.__last_execution_times.get(computation, 0.0)
+        interval = min(max(execution_time * (1.0 - budget) / budget, self.minimum_delay), self.maximum_delay)
+        return max(0.0, last_finish_time + interval - time.perf_counter())
+
+    def computation_evaluated(self, computation: Symbolic.Computation, execution_time: float) -> None:
+        self.__last_finish_times[computation] = time.perf_counter()
+        self.__last_execution_times[computation] = execution_time
+
+
 class UndeleteObjectSpecifier(Changes.UndeleteBase):
 
     def __init__(self, document_model: DocumentModel, computation: Symbolic.Computation, index: int, variable_index: int, object_specifier: Symbolic.Specifier) -> None:
@@ -294,17 +336,23 @@ class UndeleteDisplayItem(Changes.UndeleteBase):
     def __init__(self, document_model: DocumentModel, display_item: DisplayItem.DisplayItem) -> None:
         project = display_item.project
         index = project.display_items.index(display_item)
-        self.item_dict = display_item.write_to_dict()
+        self.item_dict: typing.Union[Persistence.PersistentDictType, Changes.StoredSnapshot] = display_item.write_to_dict()
         self.index = index
         self.order = save_item_order(typing.cast(typing.List[Persistence.PersistentObject], document_model.display_items))  # cast required for mypy bug?
 
     def close(self) -> None:
-        pass
+        if isinstance(self.item_dict, Changes.StoredSnapshot):
+            self.item_dict.close()
+
+    def spill(self, snapshot_store: Changes.UndoSnapshotStore) -> None:
+        if not isinstance(self.item_dict, Changes.StoredSnapshot):
+            self.item_dict = snapshot_store.store(self.item_dict)
 
     def undelete(self, document_model: DocumentModel) -> None:
+        item_dict = self.item_dict.load() if isinstance(self.item_dict, Changes.StoredSnapshot) else self.item_dict
         display_item = DisplayItem.DisplayItem()
         display_item.begin_reading()
-        display_item.read_from_dict(self.item_dict)
+        display_item.read_from_dict(item_dict)
         display_item.finish_reading()
         document_model.insert_display_item(self.index, display_item, update_session=False)
         document_model.restore_items_order("display_items", self.order)
@@ -498,7 +546,7 @@ class UndeleteItem(Changes.UndeleteBase):
         self.container_properties: typing.Optional[DisplayItem.DisplayItemSaveProperties] = None
         if hasattr(container, "save_properties"):
             self.container_properties = typing.cast(typing.Callable[[], DisplayItem.DisplayItemSaveProperties], getattr(container, "save_properties"))()
-        self.item_dict = self.__items_controller.write_to_dict(item)
+        self.item_dict: typing.Union[Persistence.PersistentDictType, Changes.StoredSnapshot] = self.__items_controller.write_to_dict(item)
         self.index = index
         self.order = self.__items_controller.save_item_order()
 
@@ -506,11 +554,18 @@ class UndeleteItem(Changes.UndeleteBase):
         if self.container_item_proxy:
             self.container_item_proxy.close()
             self.container_item_proxy = None
+        if isinstance(self.item_dict, Changes.StoredSnapshot):
+            self.item_dict.close()
+
+    def spill(self, snapshot_store: Changes.UndoSnapshotStore) -> None:
+        if not isinstance(self.item_dict, Changes.StoredSnapshot):
+            self.item_dict = snapshot_store.store(self.item_dict)
 
     def undelete(self, document_model: DocumentModel) -> None:
         container = typing.cast(Persistence.PersistentObject, self.container_item_proxy.item) if self.container_item_proxy else None
         container_properties = self.container_properties
-        self.__items_controller.restore_from_dict(self.item_dict, self.index, container, container_properties, self.order)
+        item_dict = self.item_dict.load() if isinstance(self.item_dict, Changes.StoredSnapshot) else self.item_dict
+        self.__items_controller.restore_from_dict(item_dict, self.index, container, container_properties, self.order)
 
 
 class AbstractImplicitDependency(abc.ABC):
@@ -598,7 +653,8 @@ class DocumentModel(Observable.Observable, ReferenceCounting.ReferenceCounted, D
         self.computation_updated_event = Event.Event()
         self.project_loaded_event = Event.Event()
 
-        self.__computation_thread_pool_executor = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+        self.__computation_scheduler = ComputationScheduler(self.__is_computation_visible)
+        self.__computation_thread_pool_executor = concurrent.futures.ThreadPoolExecutor(max_workers=ComputationScheduler.get_worker_count())
 
         self.__project = project
         self.__is_loading = False
@@ -646,6 +702,9 @@ class DocumentModel(Observable.Observable, ReferenceCounting.ReferenceCounted, D
 
         self.__computation_tasks = set[asyncio.Task[typing.Any]]()
 
+        # computations waiting for an upstream computation to finish, in the order they were requested.
+        self.__deferred_computations = list[Symbolic.Computation]()
+
         self.__call_soon_queue: typing.List[typing.Callable[[], None]] = list()
         self.__call_soon_queue_lock = threading.RLock()
 
@@ -729,6 +788,7 @@ class DocumentModel(Observable.Observable, ReferenceCounting.ReferenceCounted, D
             for computation_task in self.__computation_tasks:
                 computation_task.cancel()
             self.__computation_tasks.clear()
+            self.__deferred_computations.clear()
         if self.event_loop:
             self.event_loop.stop()
             self.event_loop.run_forever()
@@ -1622,15 +1682,23 @@ class DocumentModel(Observable.Observable, ReferenceCounting.ReferenceCounted, D
         # this is only called on the main thread, so state can be managed without locks.
         # assumes self.__computation_queue_lock is held.
 
-        async def run_computation(event_loop: asyncio.AbstractEventLoop, computation_thread_pool_executor: concurrent.futures.ThreadPoolExecutor, computation_queue_lock: threading.RLock, computation: Symbolic.Computation) -> None:
+        async def run_computation(event_loop: asyncio.AbstractEventLoop, computation_thread_pool_executor: concurrent.futures.ThreadPoolExecutor, computation_queue_lock: threading.RLock, computation_scheduler: ComputationScheduler, computation: Symbolic.Computation) -> None:
             # this runs on the main thread
             # run the computation execute on a thread by calling computation.async_evaluate
             # then commit the result in the same thread as this function is called (the main thread).
             while event_loop and not computation._closed:
+                # wait until the scheduler allows the computation to run again. requests arriving during the wait are
+                # coalesced into this evaluation since is_pending is already set.
+                delay = computation_scheduler.get_delay(computation)
+                if delay > 0.0:
+                    await asyncio.sleep(delay)
+                    if computation._closed:
+                        break
                 computation.is_running = True
                 computation.is_pending = False
                 computation_executor = await computation.async_evaluate(event_loop, computation_thread_pool_executor)
                 if not computation._closed and computation_executor:
+                    computation_scheduler.computation_evaluated(computation, computation_executor.last_execution_time)
                     try:
                         computation_executor.commit()
                     except Exception as e:
@@ -1639,9 +1707,6 @@ class DocumentModel(Observable.Observable, ReferenceCounting.ReferenceCounted, D
                     finally:
                         computation_executor.mark_initial_computation_complete()
                         computation_executor.close()
-                # by putting this before the break from the loop, we ensure that the computation is not run too often.
-                # otherwise the computation may run, finish, and be requested again faster than the sleep time.
-                await asyncio.sleep(0.1)
                 # check for exit conditions.
                 with computation_queue_lock:
                     if computation._closed or not computation.is_pending:
@@ -1653,7 +1718,7 @@ class DocumentModel(Observable.Observable, ReferenceCounting.ReferenceCounted, D
         if not computation.is_running and not computation.is_pending:
             # only start another computation if one is not already running or pending.
             # schedule the computation to be run via run_computation on the main thread via the event loop.
-            computation_task = self.event_loop.create_task(run_computation(self.event_loop, self.__computation_thread_pool_executor, self.__computation_queue_lock, computation))
+            computation_task = self.event_loop.create_task(run_computation(self.event_loop, self.__computation_thread_pool_executor, self.__computation_queue_lock, self.__computation_scheduler, computation))
             computation.is_pending = True
             self.__computation_tasks.add(computation_task)
 
@@ -1662,6 +1727,8 @@ class DocumentModel(Observable.Observable, ReferenceCounting.ReferenceCounted, D
                 if document_model:
                     with computation_queue_lock:
                         document_model.__computation_tasks.discard(computation_task)
+                        if not computation_task.cancelled():
+                            document_model.__start_deferred_computations()
 
             # when the task is finished, remove it from the set of computation tasks.
             computation_task.add_done_callback(functools.partial(discard_task, weakref.ref(self), self.__computation_queue_lock))
@@ -1669,9 +1736,64 @@ class DocumentModel(Observable.Observable, ReferenceCounting.ReferenceCounted, D
             # this will cause the computation to be restarted when the current run finishes.
             computation.is_pending = True
 
+    def __is_computation_visible(self, computation: Symbolic.Computation) -> bool:
+        # a computation is visible if any of its outputs, or any item depending on its outputs, is being displayed.
+        item_set: typing.Set[Persistence.PersistentObject] = set()
+        for output_item in computation.output_items:
+            self.__get_deep_dependent_item_set(output_item, item_set)
+        for item in item_set:
+            if isinstance(item, DataItem.DataItem):
+                for display_data_channel in item.display_data_channels:
+                    display_item = display_data_channel.display_item
+                    if display_item and display_item._display_ref_count > 0:
+                        return True
+        return False
+
+    def __has_pending_upstream_computation(self, computation: Symbolic.Computation) -> bool:
+        # return whether any computation producing an input of this computation, directly or indirectly, is waiting,
+        # pending, or running. in that case the inputs are stale and the computation should wait for it to finish.
+        # assumes self.__computation_queue_lock is held.
+        if not self.__computation_tasks and not self.__deferred_computations:
+            return False
+        output_to_computation_map: typing.Dict[Persistence.PersistentObject, Symbolic.Computation] = dict()
+        for computation_ in self.__computations:
+            for output in computation_._outputs:
+                output_to_computation_map[output] = computation_
+        visited_computations = {computation}
+        items = list(computation._inputs)
+        while items:
+            upstream_computation = output_to_computation_map.get(items.pop())
+            if upstream_computation and upstream_computation not in visited_computations:
+                if upstream_computation.is_pending or upstream_computation.is_running or upstream_computation in self.__deferred_computations:
+                    return True
+                visited_computations.add(upstream_computation)
+                items.extend(upstream_computation._inputs)
+        return False
+
+    def __start_deferred_computations(self) -> None:
+        # start deferred computations whose upstream computations have all finished. downstream computations are
+        # deferred again since their upstream computations are now pending; this evaluates the dependency tree in
+        # order, running each computation once per upstream change.
+        # assumes self.__computation_queue_lock is held.
+        deferred_computations = list(self.__deferred_computations)
+        for computation in deferred_computations:
+            self.__deferred_computations.remove(computation)
+            if not computation._closed:
+                self.__computation_needs_update(computation)
+        if self.__deferred_computations and not self.__computation_tasks:
+            # nothing is running to start the remaining computations, which only happens with cyclic dependencies.
+            self.__start_computation(self.__deferred_computations.pop(0))
+
     def __computation_needs_update(self, computation: Symbolic.Computation) -> None:
         # when a computation needs an update due to changing parameters, this function will be called.
         with self.__computation_queue_lock:
+            if computation in self.__deferred_computations:
+                # already waiting; it will run once its upstream computations finish.
+                return
+            if not computation.is_running and not computation.is_pending and self.__has_pending_upstream_computation(computation):
+                # an upstream computation will change the inputs again; wait for it instead of running on stale inputs.
+                self.__deferred_computations.append(computation)
+                return
             self.__start_computation(computation)
 
     async def compute_immediate(self, event_loop: asyncio.AbstractEventLoop, computation: Symbolic.Computation, timeout: typing.Optional[float] = None) -> None:
@@ -1868,8 +1990,24 @@ class DocumentModel(Observable.Observable, ReferenceCounting.ReferenceCounted, D
                 assert data_metadata
                 assert data_item.data_shape == data_metadata.data_shape, f"{data_item.data_shape=} == {data_metadata.data_shape=}"
                 assert data_item.data_dtype == data_metadata.data_dtype
+                # the partial data may be written into the data item on this thread; only the notification is
+                # deferred to the main thread.
                 data_item.queue_partial_update(data_and_metadata, src_slice=src_slice, dst_slice=dst_slice, metadata=data_metadata)
-                self.__pending_data_item_updates.append(data_item)
+                if data_item not in self.__pending_data_item_updates:
+                    self.__pending_data_item_updates.append(data_item)
+
+    def append_data_item_data(self, data_item: DataItem.DataItem, data_and_metadata: DataAndMetadata.DataAndMetadata) -> None:
+        """Append the data along the first axis of the data item data, growing the stored data when possible.
+
+        Must be called on the main thread. Pending updates to the data item are performed first so that the data is
+        appended to the latest data.
+        """
+        assert threading.current_thread() == threading.main_thread()
+        with self.__pending_data_item_updates_lock:
+            has_pending_update = data_item in self.__pending_data_item_updates
+        if has_pending_update:
+            self.perform_data_item_updates()
+        data_item.append_data(data_and_metadata)
 
     def perform_data_item_updates(self) -> None:
         assert threading.current_thread() == threading.main_thread()
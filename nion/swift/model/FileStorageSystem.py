@@ -26,6 +26,7 @@ from nion.swift.model import NDataHandler
 from nion.swift.model import Persistence
 from nion.swift.model import StorageHandler
 from nion.swift.model import Utility
+from nion.utils import DateTime
 from nion.utils import Event
 
 
@@ -90,6 +91,10 @@ class DataItemStorageAdapter:
         file_datetime = getattr(item, "created_local")
         self.__storage_handler.reserve_data(data_shape, data_dtype, data_descriptor, file_datetime)
 
+    def append_data(self, item: Persistence.PersistentObject, data: _NDArray, data_descriptor: DataAndMetadata.DataDescriptor) -> None:
+        file_datetime = getattr(item, "created_local")
+        self.__storage_handler.append_data(data, data_descriptor, file_datetime)
+
     def load_data(self, item: Persistence.PersistentObject) -> typing.Optional[_NDArray]:
         return self.__storage_handler.read_data()
 
@@ -453,6 +458,9 @@ class PersistentStorageSystem(Persistence.PersistentStorageInterface):
     def reserve_external_data(self, item: Persistence.PersistentObject, name: str, data_shape: typing.Tuple[int, ...], data_dtype: numpy.typing.DTypeLike, data_descriptor: tuple[bool, int, int]) -> None:
         pass
 
+    def append_external_data(self, item: Persistence.PersistentObject, name: str, value: _NDArray, data_descriptor: tuple[bool, int, int]) -> None:
+        pass
+
     def enter_write_delay(self, object: Persistence.PersistentObject) -> None:
         count = self.__write_delay_counts.setdefault(object, 0)
         self.__write_delay_counts[object] = count + 1
@@ -576,7 +584,7 @@ class ProjectStorageSystem(PersistentStorageSystem):
     def _find_storage_handlers(self) -> typing.Sequence[StorageHandler.StorageHandler]: ...
 
     @abc.abstractmethod
-    def _remove_storage_handler(self, storage_handler: StorageHandler.StorageHandler, *, safe: bool = False) -> None: ...
+    def _remove_storage_handler(self, storage_handler: StorageHandler.StorageHandler, *, safe: bool = False, properties: typing.Optional[PersistentDictType] = None) -> None: ...
 
     @abc.abstractmethod
     def _replace_storage_handler(self, storage_handler: StorageHandler.StorageHandler, storage_handler_attributes: StorageHandler.StorageHandlerAttributes) -> StorageHandler.StorageHandler: ...
@@ -731,7 +739,7 @@ class ProjectStorageSystem(PersistentStorageSystem):
             assert item.uuid in self.__storage_adapter_map
             storage = self.__storage_adapter_map.get(item.uuid)
             assert storage
-            self._remove_storage_handler(storage.storage_handler, safe=True)
+            self._remove_storage_handler(storage.storage_handler, safe=True, properties=storage.properties)
             self.__storage_adapter_map.pop(item.uuid).close()
         else:
             super()._remove_item(parent, name, index, item)
@@ -762,6 +770,13 @@ class ProjectStorageSystem(PersistentStorageSystem):
         else:
             super().reserve_external_data(item, name, data_shape, data_dtype, data_descriptor)
 
+    # override
+    def append_external_data(self, item: Persistence.PersistentObject, name: str, value: _NDArray, data_descriptor: tuple[bool, int, int]) -> None:
+        if isinstance(item, DataItem.DataItem) and name == "data":
+            self.__append_data_item_data(item, value, DataAndMetadata.DataDescriptor(data_descriptor[0], data_descriptor[1], data_descriptor[2]))
+        else:
+            super().append_external_data(item, name, value, data_descriptor)
+
     # override
     def rewrite_item(self, item: Persistence.PersistentObject) -> None:
         if isinstance(item, DataItem.DataItem):
@@ -826,6 +841,25 @@ class ProjectStorageSystem(PersistentStorageSystem):
         storage_adapter = self.__ensure_valid_storage_adapter(data_item, n_bytes, False)
         storage_adapter.reserve_data(data_item, data_shape, data_dtype, data_descriptor)
 
+    def __append_data_item_data(self, data_item: DataItem.DataItem, data: _NDArray, data_descriptor: DataAndMetadata.DataDescriptor) -> None:
+        # the data item data shape and dtype describe the data before appending.
+        storage_adapter = self.__storage_adapter_map.get(data_item.uuid)
+        assert storage_adapter
+        data_shape = data_item.data_shape
+        data_dtype = data_item.data_dtype
+        existing_n_bytes = typing.cast(int, numpy.prod(data_shape, dtype=numpy.int64)) * numpy.dtype(data_dtype).itemsize if data_shape and data_dtype else 0
+        n_bytes = existing_n_bytes + data.nbytes
+        storage_handler_attributes = make_storage_handler_attributes(data_item, n_bytes)
+        storage_handler_type = self._get_storage_handler_factory(storage_handler_attributes).get_storage_handler_type()
+        if storage_handler_type != storage_adapter.storage_handler.storage_handler_type:
+            # the appended data no longer fits the storage handler type; write all of the data to the new one.
+            existing_data = storage_adapter.load_data(data_item) if existing_n_bytes else None
+            all_data = numpy.concatenate([numpy.asarray(existing_data), data]) if existing_data is not None else data
+            storage_adapter = self.__ensure_valid_storage_adapter(data_item, n_bytes, False)
+            storage_adapter.update_data(data_item, all_data, data_descriptor)
+        else:
+            storage_adapter.append_data(data_item, data, data_descriptor)
+
     def __rewrite_data_item_properties(self, data_item: DataItem.DataItem) -> None:
         if not self.is_write_delayed(data_item):
             storage_adapter = self.__storage_adapter_map.get(data_item.uuid)
@@ -847,6 +881,14 @@ class FileProjectStorageSystem(ProjectStorageSystem):
 
     _file_handler_factories: typing.List[StorageHandler.StorageHandlerFactoryLike] = [NDataHandler.NDataHandlerFactory(), HDF5Handler.HDF5HandlerFactory()]
 
+    # items in the trash younger than this are retained when pruning. zero prunes everything.
+    _trash_max_age = datetime.timedelta()
+
+    # each item in the trash has its own entry file, named by the data item uuid, holding the file name in the trash,
+    # the time it was trashed, and a snapshot of the properties. the entries avoid reading every file in the trash to
+    # restore or prune items, and trashing or restoring an item only writes or removes its own entry.
+    _trash_entry_suffix = ".trash.json"
+
     def __init__(self, project_path: pathlib.Path, project_data_path: typing.Optional[pathlib.Path] = None) -> None:
         super().__init__()
         self.__project_path = project_path
@@ -930,17 +972,28 @@ class FileProjectStorageSystem(ProjectStorageSystem):
     def _is_storage_handler_large_format(self, storage_handler: StorageHandler.StorageHandler) -> bool:
         return isinstance(storage_handler, HDF5Handler.HDF5Handler)
 
-    def _remove_storage_handler(self, storage_handler: StorageHandler.StorageHandler, *, safe: bool = False) -> None:
+    def _remove_storage_handler(self, storage_handler: StorageHandler.StorageHandler, *, safe: bool = False, properties: typing.Optional[PersistentDictType] = None) -> None:
         assert self.__project_data_path is not None
         file_path = pathlib.Path(storage_handler.reference)
         file_name = file_path.parts[-1]
         trash_dir = self.__project_data_path / "trash"
         new_file_path = trash_dir / file_name
+        # the properties are needed before the move so that the trash entry can be written without reopening the file.
+        # they are only read if the caller does not pass them.
+        if properties is None and safe and not os.path.exists(new_file_path):
+            properties = storage_handler.read_properties()
         storage_handler.prepare_move()  # moving files in the storage handler requires it to be closed.
         # TODO: move this functionality to the storage handler.
         if safe and not os.path.exists(new_file_path):
             trash_dir.mkdir(exist_ok=True)
             shutil.move(str(file_path), new_file_path)
+            data_item_uuid_str = properties.get("uuid", None) if properties else None
+            if data_item_uuid_str:
+                self.__write_trash_entry(data_item_uuid_str, {
+                    "file_name": file_name,
+                    "trashed": DateTime.utcnow().isoformat(),
+                    "properties": properties,
+                })
         storage_handler.remove()
 
     def _replace_storage_handler(self, storage_handler: StorageHandler.StorageHandler, storage_handler_attributes: StorageHandler.StorageHandlerAttributes) -> StorageHandler.StorageHandler:
@@ -952,6 +1005,22 @@ class FileProjectStorageSystem(ProjectStorageSystem):
         assert self.__project_data_path is not None
         data_item_uuid_str = str(data_item_uuid)
         trash_dir = self.__project_data_path / "trash"
+        # look up the file in its trash entry first. the trash is only scanned for files trashed without an entry, for
+        # instance by an earlier version.
+        trash_entry = self.__read_trash_entry(data_item_uuid_str)
+        if trash_entry is not None:
+            self.__remove_trash_entry(data_item_uuid_str)
+            file_path = trash_dir / trash_entry["file_name"]
+            file_handler_factory = self.__get_file_handler_factory_for_file(str(file_path))
+            if file_path.exists() and file_handler_factory:
+                storage_handler_properties = trash_entry.get("properties", None)
+                if storage_handler_properties is None:
+                    storage_handler = file_handler_factory.make(file_path)
+                    with contextlib.closing(storage_handler):
+                        storage_handler_properties = storage_handler.read_properties()
+                properties = Migration.transform_to_latest(storage_handler_properties)
+                if properties.get("uuid", None) == data_item_uuid_str:
+                    return self.__restore_trash_file(data_item_uuid, properties, file_path, file_handler_factory)
         storage_handlers = self.__find_storage_handlers(trash_dir, skip_trash=False)
         try:
             for storage_handler in storage_handlers:
@@ -959,39 +1028,78 @@ class FileProjectStorageSystem(ProjectStorageSystem):
                 assert storage_handler_properties is not None
                 properties = Migration.transform_to_latest(storage_handler_properties)
                 if properties.get("uuid", None) == data_item_uuid_str:
-                    data_item = DataItem.DataItem(item_uuid=data_item_uuid)
-                    with contextlib.closing(data_item):
-                        data_item.begin_reading()
-                        data_item.read_from_dict(properties)
-                        data_item.finish_reading()
-                        old_file_path = storage_handler.reference
-                        new_file_path = storage_handler.factory.make_path(self.__project_data_path / self.__get_base_path(make_storage_handler_attributes(data_item)))
-                        if not os.path.exists(new_file_path):
-                            os.makedirs(os.path.dirname(new_file_path), exist_ok=True)
-                            shutil.move(old_file_path, new_file_path)
-                        self._make_storage_handler(make_storage_handler_attributes(data_item)).close()  # what's this line for?
-                        properties["__large_format"] = isinstance(storage_handler, HDF5Handler.HDF5Handler)
-                        return properties
+                    return self.__restore_trash_file(data_item_uuid, properties, pathlib.Path(storage_handler.reference), storage_handler.factory)
         finally:
             for storage_handler in storage_handlers:
                 storage_handler.close()
         return None
 
+    def __restore_trash_file(self, data_item_uuid: uuid.UUID, properties: PersistentDictType, file_path: pathlib.Path,
+                             file_handler_factory: StorageHandler.StorageHandlerFactoryLike) -> PersistentDictType:
+        assert self.__project_data_path is not None
+        data_item = DataItem.DataItem(item_uuid=data_item_uuid)
+        with contextlib.closing(data_item):
+            data_item.begin_reading()
+            data_item.read_from_dict(properties)
+            data_item.finish_reading()
+            new_file_path = file_handler_factory.make_path(self.__project_data_path / self.__get_base_path(make_storage_handler_attributes(data_item)))
+            if not os.path.exists(new_file_path):
+                os.makedirs(os.path.dirname(new_file_path), exist_ok=True)
+                shutil.move(str(file_path), new_file_path)
+            self._make_storage_handler(make_storage_handler_attributes(data_item)).close()  # what's this line for?
+            properties["__large_format"] = isinstance(file_handler_factory, HDF5Handler.HDF5HandlerFactory)
+            return properties
+
     def _prune(self) -> None:
         if self.__project_data_path:
             trash_dir = self.__project_data_path / "trash"
+            # items with a trash entry are kept until they are older than the maximum trash age. files in the trash
+            # without an entry have no reliable age (the file date is unreliable since a user may trash an old
+            # file) and are always deleted. the default maximum age is zero, so everything in the trash is deleted at
+            # startup.
+            now = DateTime.utcnow()
+            retained_file_names: typing.Set[str] = set()
+            if self._trash_max_age:
+                for trash_entry_path in trash_dir.glob("*" + self._trash_entry_suffix):
+                    trash_entry = self.__read_trash_entry(trash_entry_path.name[:-len(self._trash_entry_suffix)])
+                    if trash_entry is None:
+                        continue
+                    try:
+                        trashed = datetime.datetime.fromisoformat(trash_entry["trashed"])
+                    except (KeyError, TypeError, ValueError):
+                        continue
+                    if now - trashed < self._trash_max_age and (trash_dir / trash_entry["file_name"]).exists():
+                        retained_file_names.update({trash_entry["file_name"], trash_entry_path.name})
             for file_path in trash_dir.rglob("*"):
-                # the date is not a reliable way of determining the age since a user may trash an old file. for now,
-                # we just delete anything in the trash at startup. future version may have an index file for
-                # tracking items in the trash. when items are again retained in the trash, update the disabled
-                # test_delete_and_undelete_from_file_storage_system_restores_data_item_after_reload
-                file_path.unlink()
+                if file_path.name not in retained_file_names:
+                    file_path.unlink()
 
     @property
     def _trash_dir(self) -> pathlib.Path:
         assert self.__project_data_path is not None
         return self.__project_data_path / "trash"
 
+    def __get_trash_entry_path(self, data_item_uuid_str: str) -> pathlib.Path:
+        return self._trash_dir / (data_item_uuid_str + self._trash_entry_suffix)
+
+    def __read_trash_entry(self, data_item_uuid_str: str) -> typing.Optional[PersistentDictType]:
+        trash_entry_path = self.__get_trash_entry_path(data_item_uuid_str)
+        if trash_entry_path.exists():
+            try:
+                with trash_entry_path.open("r") as fp:
+                    return typing.cast(PersistentDictType, json.load(fp))
+            except Exception as e:
+                logging.error("Exception reading trash entry: %s", trash_entry_path)
+                logging.error(str(e))
+        return None
+
+    def __write_trash_entry(self, data_item_uuid_str: str, trash_entry: PersistentDictType) -> None:
+        with Utility.AtomicFileWriter(self.__get_trash_entry_path(data_item_uuid_str)) as fp:
+            json.dump(trash_entry, fp)
+
+    def __remove_trash_entry(self, data_item_uuid_str: str) -> None:
+        self.__get_trash_entry_path(data_item_uuid_str).unlink(missing_ok=True)
+
     def _migrate_data_item(self, reader_info: ReaderInfo, index: int, count: int) -> typing.Optional[ReaderInfo]:
         storage_handler = reader_info.storage_handler
         properties = reader_info.properties
@@ -1161,6 +1269,10 @@ class MemoryStorageHandler(StorageHandler.StorageHandler):
     def reserve_data(self, data_shape: typing.Tuple[int, ...], data_dtype: numpy.typing.DTypeLike, data_descriptor: DataAndMetadata.DataDescriptor, file_datetime: datetime.datetime) -> None:
         self.__data_map[self.__uuid] = numpy.zeros(data_shape, data_dtype)
 
+    def append_data(self, data: _NDArray, data_descriptor: DataAndMetadata.DataDescriptor, file_datetime: datetime.datetime) -> None:
+        existing_data = self.__data_map.get(self.__uuid)
+        self.__data_map[self.__uuid] = numpy.concatenate([existing_data, data]) if existing_data is not None else numpy.copy(data)
+
     def prepare_move(self) -> None:
         pass
 
@@ -1229,13 +1341,14 @@ class MemoryProjectStorageSystem(ProjectStorageSystem):
     def _is_storage_handler_large_format(self, storage_handler: StorageHandler.StorageHandler) -> bool:
         return False
 
-    def _remove_storage_handler(self, storage_handler: StorageHandler.StorageHandler, *, safe: bool = False) -> None:
+    def _remove_storage_handler(self, storage_handler: StorageHandler.StorageHandler, *, safe: bool = False, properties: typing.Optional[PersistentDictType] = None) -> None:
         storage_handler_reference = storage_handler.reference
+        # the properties argument is not needed here; the stored properties are moved to the trash directly.
         data = self.__data_map.pop(storage_handler_reference, None)
-        properties = self.__data_properties_map.pop(storage_handler_reference)
+        stored_properties = self.__data_properties_map.pop(storage_handler_reference)
         if safe:
             assert storage_handler_reference not in self.__trash_map
-            self.__trash_map[storage_handler_reference] = {"data": data, "properties": properties}
+            self.__trash_map[storage_handler_reference] = {"data": data, "properties": stored_properties}
         storage_handler.close()  # moving files in the storage handler requires it to be closed.
 
     def _replace_storage_handler(self, storage_handler: StorageHandler.StorageHandler, storage_handler_attributes: StorageHandler.StorageHandlerAttributes) -> StorageHandler.StorageHandler:
@@ -949,6 +949,19 @@ class Graphic(Persistence.PersistentObject):
     def get_attributes(self) -> set[GraphicAttributeEnum]:
         return set()
 
+    def get_hit_test_bounds(self) -> typing.Optional[Geometry.FloatRect]:
+        """Return a rectangle containing every point at which test may hit this graphic, or None if unknown.
+
+        The rectangle is in normalized image coordinates for two dimensional graphics and has the normalized channel
+        coordinates as its x-range and a height from 0 to 1 for one dimensional graphics. It does not include the
+        cursor tolerance and handles, which are specified in widget coordinates and limited to HIT_TEST_WIDGET_MARGIN.
+        Labels may be anywhere, so labeled graphics have no hit test bounds.
+        """
+        return self._get_hit_test_bounds() if not self.label else None
+
+    def _get_hit_test_bounds(self) -> typing.Optional[Geometry.FloatRect]:
+        return None
+
     def begin_drag(self) -> DragPartData:
         raise NotImplementedError()
 
@@ -1167,6 +1180,14 @@ class RectangleTypeGraphic(Graphic):
     def get_attributes(self) -> set[GraphicAttributeEnum]:
         return {GraphicAttributeEnum.TWO_DIMENSIONAL}
 
+    def _get_hit_test_bounds(self) -> typing.Optional[Geometry.FloatRect]:
+        bounds = Geometry.FloatRect.make(self.bounds)
+        if self.rotation:
+            # the rotated rectangle is contained in the circle around the center through the corners.
+            radius = math.sqrt(bounds.width * bounds.width + bounds.height * bounds.height) * 0.5
+            return Geometry.FloatRect.from_center_and_size(bounds.center, Geometry.FloatSize(2 * radius, 2 * radius))
+        return Geometry.FloatRect.from_tlbr(min(bounds.top, bounds.bottom), min(bounds.left, bounds.right), max(bounds.top, bounds.bottom), max(bounds.left, bounds.right))
+
     def get_mask_item(self) -> MaskItem:
         return RectangleMaskItem(self.bounds, self.rotation)
 
@@ -1498,6 +1519,10 @@ class LineTypeGraphic(Graphic):
     def get_attributes(self) -> set[GraphicAttributeEnum]:
         return {GraphicAttributeEnum.TWO_DIMENSIONAL}
 
+    def _get_hit_test_bounds(self) -> typing.Optional[Geometry.FloatRect]:
+        start, end = self.start, self.end
+        return Geometry.FloatRect.from_tlbr(min(start.y, end.y), min(start.x, end.x), max(start.y, end.y), max(start.x, end.x))
+
     def get_mask_item(self) -> MaskItem:
         return LineMaskItem(self.start, self.end)
 
@@ -1790,6 +1815,9 @@ class PointTypeGraphic(Graphic):
     def get_attributes(self) -> set[GraphicAttributeEnum]:
         return {GraphicAttributeEnum.TWO_DIMENSIONAL}
 
+    def _get_hit_test_bounds(self) -> typing.Optional[Geometry.FloatRect]:
+        return Geometry.FloatRect(self.position, Geometry.FloatSize())
+
     def get_mask_item(self) -> MaskItem:
         return PointMaskItem(self.position)
 
@@ -1952,6 +1980,9 @@ class IntervalGraphic(Graphic):
     def get_attributes(self) -> set[GraphicAttributeEnum]:
         return {GraphicAttributeEnum.ONE_DIMENSIONAL}
 
+    def _get_hit_test_bounds(self) -> typing.Optional[Geometry.FloatRect]:
+        return Geometry.FloatRect.from_tlbr(0.0, min(self.start, self.end), 1.0, max(self.start, self.end))
+
     @property
     def start(self) -> float:
         return self.interval[0]
@@ -2070,6 +2101,9 @@ class ChannelGraphic(Graphic):
     def get_attributes(self) -> set[GraphicAttributeEnum]:
         return {GraphicAttributeEnum.ONE_DIMENSIONAL}
 
+    def _get_hit_test_bounds(self) -> typing.Optional[Geometry.FloatRect]:
+        return Geometry.FloatRect.from_tlbr(0.0, self.position, 1.0, self.position)
+
     def get_region(self) -> ChannelRegion:
         return ChannelRegion(self.position)
 
@@ -3088,6 +3122,81 @@ def create_mask_data(graphics: typing.Sequence[Graphic], shape: DataAndMetadata.
     return mask
 
 
+# the widget distance beyond the hit test bounds at which a graphic test may still hit (handles, tolerance).
+HIT_TEST_WIDGET_MARGIN = 16
+
+
+class GraphicHitTestIndex:
+    """A grid of graphic hit test bounds to find the graphics that may be hit near a point.
+
+    The grid covers the normalized unit square; bounds and queries outside of it are clamped to the edge cells. Graphics
+    without hit test bounds are candidates for every query. Update with the graphics whenever they change; only the
+    graphics whose modified count changed are moved within the grid if the list of graphics is otherwise the same.
+    """
+
+    def __init__(self, grid_size: int = 32) -> None:
+        self.__grid_size = grid_size
+        self.__graphic_keys: typing.List[typing.Tuple[uuid.UUID, int]] = list()
+        self.__graphic_cell_ranges: typing.List[typing.Optional[typing.Tuple[int, int, int, int]]] = list()
+        self.__cells: typing.Dict[typing.Tuple[int, int], typing.Set[int]] = dict()
+        self.__unbounded_indexes: typing.Set[int] = set()
+
+    def __get_cell_range(self, rect: Geometry.FloatRect) -> typing.Tuple[int, int, int, int]:
+        grid_size = self.__grid_size
+
+        def cell(v: float) -> int:
+            return min(max(int(math.floor(v * grid_size)), 0), grid_size - 1) if math.isfinite(v) else (0 if v < 0 else grid_size - 1)
+
+        return cell(rect.top), cell(rect.left), cell(rect.bottom), cell(rect.right)
+
+    def __insert(self, index: int, graphic: Graphic) -> None:
+        bounds = graphic.get_hit_test_bounds()
+        cell_range = self.__get_cell_range(bounds) if bounds is not None else None
+        self.__graphic_cell_ranges[index] = cell_range
+        if cell_range is not None:
+            top, left, bottom, right = cell_range
+            for row in range(top, bottom + 1):
+                for column in range(left, right + 1):
+                    self.__cells.setdefault((row, column), set()).add(index)
+        else:
+            self.__unbounded_indexes.add(index)
+
+    def __remove(self, index: int) -> None:
+        cell_range = self.__graphic_cell_ranges[index]
+        if cell_range is not None:
+            top, left, bottom, right = cell_range
+            for row in range(top, bottom + 1):
+                for column in range(left, right + 1):
+                    self.__cells[(row, column)].discard(index)
+        else:
+            self.__unbounded_indexes.discard(index)
+        self.__graphic_cell_ranges[index] = None
+
+    def update(self, graphics: typing.Sequence[Graphic]) -> None:
+        graphic_keys = [(graphic.uuid, graphic.modified_count) for graphic in graphics]
+        if len(graphic_keys) == len(self.__graphic_keys) and all(k[0] == o[0] for k, o in zip(graphic_keys, self.__graphic_keys)):
+            for index, (graphic_key, old_graphic_key) in enumerate(zip(graphic_keys, self.__graphic_keys)):
+                if graphic_key != old_graphic_key:
+                    self.__remove(index)
+                    self.__insert(index, graphics[index])
+        else:
+            self.__cells = dict()
+            self.__unbounded_indexes = set()
+            self.__graphic_cell_ranges = [None] * len(graphics)
+            for index, graphic in enumerate(graphics):
+                self.__insert(index, graphic)
+        self.__graphic_keys = graphic_keys
+
+    def get_candidate_indexes(self, rect: Geometry.FloatRect) -> typing.Set[int]:
+        """Return the indexes of the graphics whose hit test bounds may intersect rect."""
+        top, left, bottom, right = self.__get_cell_range(rect)
+        candidate_indexes = set(self.__unbounded_indexes)
+        for row in range(top, bottom + 1):
+            for column in range(left, right + 1):
+                candidate_indexes.update(self.__cells.get((row, column), set()))
+        return candidate_indexes
+
+
 class MaskItem:
     def get_mask_data(self, data_shape: DataAndMetadata.ShapeType, calibrated_origin: CalibratedOriginType | None = None) -> DataAndMetadata._ImageDataType:
         raise NotImplementedError("get_mask")
@@ -12,7 +12,6 @@ import threading
 import typing
 import uuid
 
-import h5py
 import numpy
 import numpy.typing
 
@@ -23,7 +22,9 @@ from nion.utils import DateTime
 from nion.utils import Geometry
 from nion.utils import Registry
 
+# h5py is slow to import; it is imported where first used.
 if typing.TYPE_CHECKING:
+    import h5py
     from nion.data import DataAndMetadata
 
 
@@ -79,6 +80,18 @@ def get_write_chunk_shape_for_data(data_shape: DataAndMetadata.ShapeType, data_d
     return tuple(chunk_shape)
 
 
+def get_append_chunk_shape_for_data(data_shape: DataAndMetadata.ShapeType, data_dtype: numpy.typing.DTypeLike) -> DataAndMetadata.ShapeType:
+    """
+    Calculate an appropriate chunk shape for data which is appended along its first axis.
+
+    Datasets resizable along the first axis must be chunked. The chunk shape is calculated as the write chunk shape for
+    a long first axis so that the chunk size does not depend on the current length of the first axis. If the data shape
+    is not suitable for chunking, use chunks of one item along the first axis.
+    """
+    chunk_shape = get_write_chunk_shape_for_data((1 << 20,) + tuple(data_shape[1:]), data_dtype)
+    return chunk_shape if chunk_shape else (1,) + tuple(max(n, 1) for n in data_shape[1:])
+
+
 _HDF5FilePointer = typing.Any
 
 
@@ -100,6 +113,7 @@ class HDF5FileEntry:
         with self.__lock:
             if not self.__fp:
                 self.__path.parent.mkdir(parents=True, exist_ok=True)
+                import h5py
                 self.__fp = h5py.File(self.__path, "a")
 
     def close(self) -> None:
@@ -226,7 +240,10 @@ class HDF5Handler(StorageHandler.StorageHandler):
             else:
                 if self.__dataset is None:
                     self.__dataset = self.__file.fp["data"]
-                if self.__dataset.shape != data.shape or self.__dataset.dtype != data.dtype:
+                if self.__is_appendable_to(data.shape, data.dtype) and self.__dataset.shape != data.shape:
+                    # case 3, but resize a dataset which is resizable along the first axis
+                    self.__dataset.resize(data.shape[0], axis=0)
+                elif self.__dataset.shape != data.shape or self.__dataset.dtype != data.dtype:
                     # case 2
                     json_properties = self.__dataset.attrs.get("properties", "")
                     self.__close_fp()
@@ -257,6 +274,51 @@ class HDF5Handler(StorageHandler.StorageHandler):
                 self.__dataset.attrs["properties"] = json_properties
             self.__file.fp.flush()
 
+    def append_data(self, data: _NDArray, data_descriptor: DataAndMetadata.DataDescriptor, file_datetime: datetime.datetime) -> None:
+        # append data along the first axis. the dataset is made resizable along the first axis the first time data is
+        # appended; after that, appending resizes the dataset and writes only the appended data.
+        with self.__lock:
+            assert data is not None
+            self.__ensure_dataset()
+            if not self.__is_appendable_to(data.shape, data.dtype):
+                existing_data: typing.Optional[_NDArray] = None
+                if self.__dataset.shape != (0,):
+                    existing_data = numpy.asarray(self.__dataset)
+                    if existing_data.shape[1:] != data.shape[1:] or existing_data.dtype != data.dtype:
+                        raise ValueError(f"Cannot append data {data.shape} {data.dtype} to data {existing_data.shape} {existing_data.dtype}.")
+                self.__make_appendable_dataset(data.shape, data.dtype)
+                if existing_data is not None:
+                    self.__dataset.resize(existing_data.shape[0], axis=0)
+                    self.__dataset[:] = existing_data
+            length = self.__dataset.shape[0]
+            self.__dataset.resize(length + data.shape[0], axis=0)
+            self.__dataset[length:] = data
+            self._write_count += 1
+            self.__file.fp.flush()
+
+    def __is_appendable_to(self, data_shape: DataAndMetadata.ShapeType, data_dtype: numpy.typing.DTypeLike) -> bool:
+        # return whether the dataset is resizable along the first axis and matches the shape and dtype otherwise.
+        dataset = self.__dataset
+        return (dataset is not None and dataset.maxshape is not None and len(dataset.maxshape) == len(data_shape) and
+                dataset.maxshape[0] is None and dataset.shape[1:] == tuple(data_shape[1:]) and
+                dataset.dtype == numpy.dtype(data_dtype))
+
+    def __make_appendable_dataset(self, data_shape: DataAndMetadata.ShapeType, data_dtype: numpy.typing.DTypeLike) -> None:
+        # replace the dataset with an empty dataset resizable along the first axis, preserving the properties.
+        json_properties = None
+        if "data" in self.__file.fp:
+            if self.__dataset is None:
+                self.__dataset = self.__file.fp["data"]
+            json_properties = self.__dataset.attrs.get("properties", "")
+            self.__close_fp()
+            os.remove(self.__file_path)
+            self.__file.open()
+        item_shape = tuple(data_shape[1:])
+        chunks = get_append_chunk_shape_for_data(data_shape, data_dtype)
+        self.__dataset = self.__file.fp.require_dataset("data", shape=(0,) + item_shape, maxshape=(None,) + item_shape, dtype=data_dtype, chunks=chunks)
+        if json_properties is not None:
+            self.__dataset.attrs["properties"] = json_properties
+
     def __copy_data(self, data: _NDArray) -> None:
         if id(data) != id(self.__dataset):
             self.__dataset[:] = data
@@ -319,6 +381,7 @@ class HDFImportExportDriver:
         storage_handlers = list[StorageHandler.StorageHandler]()
         uuid_map = dict[uuid.UUID, uuid.UUID]()
         items = list[PersistentDictType]()
+        import h5py
         fp = h5py.File(file_path, "r")
         if "data" in fp:
             data_group = fp["data"]
@@ -354,6 +417,7 @@ class HDFImportExportDriver:
 
     def write_display_item(self, path: pathlib.Path, items: typing.Sequence[StorageHandler.StorageHandlerExportItem]) -> None:
         path.unlink(missing_ok=True)
+        import h5py
         fp = h5py.File(path, "a")
         index_group = fp.create_group("index")
         data_group = fp.create_group("data")
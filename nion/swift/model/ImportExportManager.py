@@ -14,7 +14,6 @@ import zipfile
 import itertools
 
 # third party libraries
-import imageio.v3 as imageio
 import numpy
 
 # local libraries
@@ -24,6 +23,7 @@ from nion.data import Image
 from nion.swift.model import DataItem
 from nion.swift.model import DisplayItem
 from nion.swift.model import FileStorageSystem
+from nion.swift.model import PlugInManager
 from nion.swift.model import StorageHandler
 from nion.swift.model import Utility
 from nion.utils import DateTime
@@ -139,6 +139,12 @@ class ImportExportManager(metaclass=Utility.Singleton):
         # load_func, save_func, keyed by name.
         self.__io_handlers: typing.List[ImportExportHandler] = []
 
+    @property
+    def __loaded_io_handlers(self) -> typing.Sequence[ImportExportHandler]:
+        # import/export handlers may be contributed by plug-ins which have not been loaded yet.
+        PlugInManager.load_deferred_plug_ins("io_handlers")
+        return list(self.__io_handlers)
+
     def register_io_handler(self, io_handler: ImportExportHandler) -> None:
         self.__io_handlers.append(io_handler)
 
@@ -147,34 +153,34 @@ class ImportExportManager(metaclass=Utility.Singleton):
 
     def get_readers(self) -> typing.Sequence[ImportExportHandler]:
         readers = []
-        for io_handler in self.__io_handlers:
+        for io_handler in self.__loaded_io_handlers:
             if io_handler.can_read():
                 readers.append(io_handler)
         return readers
 
     def get_writers(self) -> typing.Sequence[ImportExportHandler]:
         writers = []
-        for io_handler in self.__io_handlers:
+        for io_handler in self.__loaded_io_handlers:
             if io_handler.can_read():
                 writers.append(io_handler)
         return writers
 
     def get_writer_by_id(self, io_handler_id: str) -> typing.Optional[ImportExportHandler]:
-        for io_handler in self.__io_handlers:
+        for io_handler in self.__loaded_io_handlers:
             if io_handler.io_handler_id == io_handler_id:
                 return io_handler
         return None
 
     def get_writers_for_display_item(self, display_item: DisplayItem.DisplayItem) -> typing.Sequence[ImportExportHandler]:
         writers = []
-        for io_handler in self.__io_handlers:
+        for io_handler in self.__loaded_io_handlers:
             for extension in io_handler.extensions:
                 if io_handler.can_write_display_item(display_item, extension.lower()):
                     writers.append(io_handler)
         return writers
 
     def __find_io_handler_for_extension(self, extension: str) -> typing.Optional[ImportExportHandler]:
-        for io_handler in self.__io_handlers:
+        for io_handler in self.__loaded_io_handlers:
             if extension and extension in io_handler.extensions:
                 return io_handler
         return None
@@ -209,7 +215,7 @@ class ImportExportManager(metaclass=Utility.Singleton):
         extension = path.suffix
         if extension:
             extension = extension[1:].lower()  # remove the leading "."
-            for io_handler in self.__io_handlers:
+            for io_handler in self.__loaded_io_handlers:
                 if extension in io_handler.extensions and io_handler.can_write_display_item(display_item, extension):
                     io_handler.write_display_item(display_item, path, extension)
 
@@ -538,6 +544,7 @@ def read_image_from_file(filename: pathlib.Path) -> _DataArrayType:
     if str(filename).startswith(":"):
         return numpy.zeros((20, 20, 4), numpy.uint8)
     # TODO: fix typing when imageio gets their numpy typing correct.
+    import imageio.v3 as imageio  # slow to import; import on first use.
     image = imageio.imread(filename, index=0)
     if image is not None:
         image_u8 = convert_to_uint8(image)
@@ -600,6 +607,7 @@ class StandardImportExportHandler(ImportExportHandler):
         assert display_values
         data = display_values.display_rgba  # export the display rather than the data for these types
         assert data is not None
+        import imageio.v3 as imageio
         imageio.imwrite(path, numpy.flip(Image.get_rgb_view(data), 2), extension="." + extension)
 
 
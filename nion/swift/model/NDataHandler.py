@@ -439,6 +439,19 @@ class NDataHandler(StorageHandler.StorageHandler):
     def reserve_data(self, data_shape: typing.Tuple[int, ...], data_dtype: numpy.typing.DTypeLike, data_descriptor: DataAndMetadata.DataDescriptor, file_datetime: datetime.datetime) -> None:
         self.write_data(numpy.zeros(data_shape, data_dtype), data_descriptor, file_datetime)
 
+    def append_data(self, data: _NDArray, data_descriptor: DataAndMetadata.DataDescriptor, file_datetime: datetime.datetime) -> None:
+        """
+            Append data along the first axis of the data in the ndata file specified by reference.
+
+            ndata files cannot be resized in place, so the existing data is read and written again with the data appended.
+
+            :param data: the numpy array data to append
+            :param file_datetime: the datetime for the file
+        """
+        with self.__lock:
+            existing_data = self.read_data() if os.path.exists(self.__file_path) else None
+            self.write_data(numpy.concatenate([existing_data, data]) if existing_data is not None else data, data_descriptor, file_datetime)
+
     def write_properties(self, properties: PersistentDictType, file_datetime: datetime.datetime) -> None:
         """
             Write properties to the ndata file specified by reference.
@@ -612,39 +612,48 @@ class FilteredItemSequence(AbstractItemSequenceSource):
 
     def __init__(self, item_sequence_source: AbstractItemSequenceSource, predicate: typing.Callable[[ItemValue], bool]) -> None:
         self.__item_sequence_source = item_sequence_source
-        self.__list_model = ListModel.ListModel[ItemValue](key="items")
-        self.__filtered_list_model = ListModel.FilteredListModel(container=self.__list_model, items_key="items")
-        self.__filtered_list_model.filter = ListModel.PredicateFilter(lambda x: predicate(x.value))
         self.__item_inserted_event = Event.Event()
         self.__item_removed_event = Event.Event()
         self.__item_mutated_event = Event.Event()
+        # the items of the source sequence and whether each one passes the predicate. the index of an item in this
+        # sequence is the number of passing items before it in the source sequence.
+        self.__items: typing.List[ItemValue] = list()
+        self.__passes: typing.List[bool] = list()
 
-        class Wrapper:  # used to wrap values so that they are all unique
-            def __init__(self, value: ItemValue) -> None: self.value = value
+        def filtered_index(index: int) -> int:
+            return sum(self.__passes[:index])
 
         def item_inserted(item: ItemValue, index: int) -> None:
-            self.__list_model.insert_item(index, Wrapper(item))
+            passes = bool(predicate(item))
+            self.__items.insert(index, item)
+            self.__passes.insert(index, passes)
+            if passes:
+                self.__item_inserted_event.fire(item, filtered_index(index))
 
         def item_removed(item: ItemValue, index: int) -> None:
-            self.__list_model.remove_item(index)
+            old_item = self.__items.pop(index)
+            if self.__passes.pop(index):
+                self.__item_removed_event.fire(old_item, filtered_index(index))
 
         def item_mutated(item: ItemValue, index: int) -> None:
-            self.__list_model.remove_item(index)
-            self.__list_model.insert_item(index, Wrapper(item))
+            # only the predicate of the mutated item is evaluated. if it stays in this sequence, the mutation is passed
+            # along; otherwise it is inserted or removed.
+            old_item = self.__items[index]
+            passed = self.__passes[index]
+            passes = bool(predicate(item))
+            self.__items[index] = item
+            self.__passes[index] = passes
+            if passed and passes:
+                self.__item_mutated_event.fire(item, filtered_index(index))
+            elif passed:
+                self.__item_removed_event.fire(old_item, filtered_index(index))
+            elif passes:
+                self.__item_inserted_event.fire(item, filtered_index(index))
 
         self.__item_inserted_listener = self.__item_sequence_source.item_inserted_event.listen(item_inserted)
         self.__item_removed_listener = self.__item_sequence_source.item_removed_event.listen(item_removed)
         self.__item_mutated_listener = self.__item_sequence_source.item_mutated_event.listen(item_mutated)
 
-        def filtered_item_inserted(key: str, item: ItemValue, index: int) -> None:
-            self.__item_inserted_event.fire(typing.cast(Wrapper, item).value, index)
-
-        def filtered_item_removed(key: str, item: ItemValue, index: int) -> None:
-            self.__item_removed_event.fire(typing.cast(Wrapper, item).value, index)
-
-        self.__filtered_item_inserted_listener = self.__filtered_list_model.item_inserted_event.listen(filtered_item_inserted)
-        self.__filtered_item_removed_listener = self.__filtered_list_model.item_removed_event.listen(filtered_item_removed)
-
         for index, item in enumerate(self.__item_sequence_source.items):
             item_inserted(item, index)
 
@@ -655,14 +664,8 @@ class FilteredItemSequence(AbstractItemSequenceSource):
         self.__item_removed_listener = typing.cast(typing.Any, None)
         self.__item_mutated_listener.close()
         self.__item_mutated_listener = typing.cast(typing.Any, None)
-        self.__filtered_item_inserted_listener.close()
-        self.__filtered_item_inserted_listener = typing.cast(typing.Any, None)
-        self.__filtered_item_removed_listener.close()
-        self.__filtered_item_removed_listener = typing.cast(typing.Any, None)
-        self.__filtered_list_model.close()
-        self.__filtered_list_model = typing.cast(typing.Any, None)
-        self.__list_model.close()
-        self.__list_model = typing.cast(typing.Any, None)
+        self.__items = typing.cast(typing.Any, None)
+        self.__passes = typing.cast(typing.Any, None)
         self.__item_sequence_source.close()
         self.__item_sequence_source = typing.cast(typing.Any, None)
 
@@ -680,7 +683,7 @@ class FilteredItemSequence(AbstractItemSequenceSource):
 
     @property
     def items(self) -> typing.Sequence[ItemValue]:
-        return [item.value for item in self.__filtered_list_model.items]
+        return [item for item, passes in zip(self.__items, self.__passes) if passes]
 
 
 class MappedItemSequence(AbstractItemSequenceSource):
@@ -770,17 +773,18 @@ class ItemSequenceAction:
 
     def __init__(self, item_sequence_source: AbstractItemSequenceSource, action: typing.Callable[[AbstractItemSource], AbstractAction]):
         self.__item_sequence_source = item_sequence_source
-        self.__item_actions: typing.Dict[ItemValue, AbstractAction] = dict()
+        # the actions are stored by index since a mutated item may be a different value.
+        self.__item_actions: typing.List[AbstractAction] = list()
 
         def item_inserted(item: ItemValue, index: int) -> None:
-            self.__item_actions[item] = action(ItemSource(item))
+            self.__item_actions.insert(index, action(ItemSource(item)))
 
         def item_removed(item: ItemValue, index: int) -> None:
-            self.__item_actions.pop(item).close()
+            self.__item_actions.pop(index).close()
 
         def item_mutated(item: ItemValue, index: int) -> None:
-            self.__item_actions[item].close()
-            self.__item_actions[item] = action(ItemSource(item))
+            self.__item_actions[index].close()
+            self.__item_actions[index] = action(ItemSource(item))
 
         self.__item_inserted_listener = self.__item_sequence_source.item_inserted_event.listen(item_inserted)
         self.__item_removed_listener = self.__item_sequence_source.item_removed_event.listen(item_removed)
@@ -796,7 +800,7 @@ class ItemSequenceAction:
         self.__item_removed_listener = typing.cast(typing.Any, None)
         self.__item_mutated_listener.close()
         self.__item_mutated_listener = typing.cast(typing.Any, None)
-        for item, item_action in self.__item_actions.items():
+        for item_action in self.__item_actions:
             item_action.close()
         self.__item_actions = typing.cast(typing.Any, None)
         self.__item_sequence_source.close()
@@ -818,8 +822,17 @@ class ItemSequenceTrampoline:
             self.__items.pop(index)
             target.notify_remove_item(key, item, index)
 
+        def item_mutated(item: ItemValue, index: int) -> None:
+            # the target only needs to know about a mutation if the item at the index is a different item.
+            old_item = self.__items[index]
+            if item is not old_item:
+                self.__items[index] = item
+                target.notify_remove_item(key, old_item, index)
+                target.notify_insert_item(key, item, index)
+
         self.__item_inserted_listener = self.__item_sequence_source.item_inserted_event.listen(item_inserted)
         self.__item_removed_listener = self.__item_sequence_source.item_removed_event.listen(item_removed)
+        self.__item_mutated_listener = self.__item_sequence_source.item_mutated_event.listen(item_mutated)
 
         for index, item in enumerate(self.__item_sequence_source.items):
             item_inserted(item, index)
@@ -829,6 +842,8 @@ class ItemSequenceTrampoline:
         self.__item_inserted_listener = typing.cast(typing.Any, None)
         self.__item_removed_listener.close()
         self.__item_removed_listener = typing.cast(typing.Any, None)
+        self.__item_mutated_listener.close()
+        self.__item_mutated_listener = typing.cast(typing.Any, None)
         self.__items = typing.cast(typing.Any, None)
         self.__item_sequence_source.close()
         self.__item_sequence_source = typing.cast(typing.Any, None)
@@ -316,6 +316,9 @@ class PersistentStorageInterface(typing.Protocol):
     @abc.abstractmethod
     def reserve_external_data(self, item: PersistentObject, name: str, data_shape: typing.Tuple[int, ...], data_dtype: numpy.typing.DTypeLike, data_descriptor: tuple[bool, int, int]) -> None: ...
 
+    @abc.abstractmethod
+    def append_external_data(self, item: PersistentObject, name: str, value: _NDArray, data_descriptor: tuple[bool, int, int]) -> None: ...
+
     @abc.abstractmethod
     def enter_write_delay(self, object: PersistentObject) -> None: ...
 
@@ -622,6 +625,41 @@ class PersistentObjectParent:
 
 
 
+class PersistentPropertyChangeCapture:
+    """Capture the stored value of each persistent property of an object before its first change.
+
+    This records the state needed to undo a change for only the properties that actually change, rather than writing
+    the whole object to a dict. The captured values are stored per property name as the dict written by the property.
+    """
+
+    def __init__(self, item: PersistentObject) -> None:
+        self.__item: typing.Optional[PersistentObject] = item
+        self.__properties: typing.Dict[str, PersistentDictType] = dict()
+        item._add_property_change_capture(self)
+
+    def close(self) -> None:
+        if self.__item:
+            self.__item._remove_property_change_capture(self)
+            self.__item = None
+
+    @property
+    def properties(self) -> typing.Mapping[str, PersistentDictType]:
+        return self.__properties
+
+    def _capture(self, property: PersistentProperty) -> None:
+        if property.name not in self.__properties:
+            self.__properties[property.name] = _write_property_change_to_dict(property)
+
+
+def _write_property_change_to_dict(property: PersistentProperty) -> PersistentDictType:
+    # unlike write_to_dict, an unset value is written as None so that reading it back resets the property.
+    properties: PersistentDictType = dict()
+    property.write_to_dict(properties)
+    if not properties and not property.writer:
+        properties[property.key] = None
+    return properties
+
+
 class PersistentObject(Observable.Observable):
     """
         Base class for objects being stored in a PersistentObjectContext.
@@ -689,6 +727,7 @@ class PersistentObject(Observable.Observable):
         # ghost properties can be used to temporarily mark properties so that changes
         # to those properties do not trigger writes to disk, usually for performance reasons.
         self.ghost_properties = typing.Counter[str]()
+        self.__property_change_captures: typing.List[PersistentPropertyChangeCapture] = list()
 
     def close(self) -> None:
         if self.persistent_storage:
@@ -1071,6 +1110,8 @@ class PersistentObject(Observable.Observable):
          Normally the update is not written to disk unless the value changes. force_update overrides this behavior.
          """
         property = self.__properties[name]
+        for property_change_capture in self.__property_change_captures:
+            property_change_capture._capture(property)
         # in order to send out the change message after the modification date/count is updated,
         # split the set value into _set_value and _set_value_call_changed. this is consistent
         # with the other modification methods.
@@ -1081,6 +1122,19 @@ class PersistentObject(Observable.Observable):
             if did_change:
                 property._set_value_call_changed(value)
 
+    def _add_property_change_capture(self, property_change_capture: PersistentPropertyChangeCapture) -> None:
+        self.__property_change_captures.append(property_change_capture)
+
+    def _remove_property_change_capture(self, property_change_capture: PersistentPropertyChangeCapture) -> None:
+        self.__property_change_captures.remove(property_change_capture)
+
+    def write_properties_to_dict(self, names: typing.Iterable[str]) -> typing.Dict[str, PersistentDictType]:
+        """Write the named properties to a dict of stored values per property name. Unset values are written as None."""
+        properties_by_name: typing.Dict[str, PersistentDictType] = dict()
+        for name in names:
+            properties_by_name[name] = _write_property_change_to_dict(self.__properties[name])
+        return properties_by_name
+
     def _update_persistent_property(self, name: str, value: typing.Any) -> None:
         """ Subclasses can call this to notify that a custom property was updated. """
         self.__update_modified(DateTime.utcnow())
@@ -1257,6 +1311,11 @@ class PersistentObject(Observable.Observable):
         assert self.persistent_storage
         self.persistent_storage.reserve_external_data(self, name, data_shape, numpy.dtype(data_dtype), data_descriptor)
 
+    def append_external_data(self, name: str, value: typing.Any, data_descriptor: tuple[bool, int, int]) -> None:
+        """ Call this to notify append external data value along the first axis with name to an item in persistent storage. """
+        assert self.persistent_storage
+        self.persistent_storage.append_external_data(self, name, value, data_descriptor)
+
     def enter_write_delay(self) -> None:
         """ Call this to notify this context that the object should be write delayed. """
         assert self.persistent_storage
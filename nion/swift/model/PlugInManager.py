@@ -3,6 +3,7 @@ from __future__ import annotations
 # standard libraries
 import collections
 import copy
+import dataclasses
 import importlib
 import importlib.util
 import inspect
@@ -12,6 +13,7 @@ import os
 import pkgutil
 import re
 import sys
+import threading
 import time
 import traceback
 import types
@@ -68,11 +70,52 @@ class APIBroker:
 extensions: typing.List[typing.Any] = list()
 
 
+@dataclasses.dataclass
+class PlugInLoadInfo:
+    """The load status and the import/initialization times (in milliseconds) of a plug-in."""
+    module_name: str
+    module_path: str
+    status: str = "not loaded"
+    import_ms: float = 0.0
+    init_ms: float = 0.0
+
+
+__load_infos: typing.Dict[str, PlugInLoadInfo] = dict()
+
+
+def _get_load_info(module_path: str, module_name: str) -> PlugInLoadInfo:
+    load_info = __load_infos.get(module_name)
+    if not load_info:
+        load_info = PlugInLoadInfo(module_name, module_path)
+        __load_infos[module_name] = load_info
+    return load_info
+
+
+def get_load_report() -> typing.Sequence[PlugInLoadInfo]:
+    """Return the load info for each plug-in, in the order the plug-ins were encountered."""
+    return list(__load_infos.values())
+
+
+def log_load_report() -> None:
+    load_infos = get_load_report()
+    loaded_count = sum(1 for load_info in load_infos if load_info.status == "loaded")
+    deferred_count = sum(1 for load_info in load_infos if load_info.status == "deferred")
+    import_ms = sum(load_info.import_ms for load_info in load_infos)
+    init_ms = sum(load_info.init_ms for load_info in load_infos)
+    log_message(f"Plug-in startup report: {loaded_count} loaded, {deferred_count} deferred, "
+                f"{len(load_infos) - loaded_count - deferred_count} not loaded ({import_ms:.1f}ms import, {init_ms:.1f}ms init).")
+    for load_info in sorted(load_infos, key=lambda x: x.import_ms + x.init_ms, reverse=True):
+        logger.info(f"  {load_info.module_name:<48} {load_info.status:<12} {load_info.import_ms:>10.1f}ms import {load_info.init_ms:>10.1f}ms init")
+
+
 def load_plug_in(module_path: str, module_name: str) -> typing.Optional[types.ModuleType]:
+    load_info = _get_load_info(module_path, module_name)
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         # First load the module.
         module = importlib.import_module(module_name)
+        load_info.import_ms = (time.perf_counter() - start_time) * 1000
+        start_time = time.perf_counter()
         # Now scan through the module and look for extensions and tests.
         tests = []
         for member in inspect.getmembers(module):
@@ -98,8 +141,9 @@ def load_plug_in(module_path: str, module_name: str) -> typing.Optional[types.Mo
                 extension_id = getattr(cls, "extension_id", None)
                 if extension_id:
                     extensions.append(cls(APIBroker()))
-        elapsed_s = int(time.time() - start_time)
-        plugin_loaded_str = f"Plug-in '{module_name}' loaded ({module_path}) ({elapsed_s}s)."
+        load_info.init_ms = (time.perf_counter() - start_time) * 1000
+        load_info.status = "loaded"
+        plugin_loaded_str = f"Plug-in '{module_name}' loaded ({module_path}) ({load_info.import_ms:.1f}ms import, {load_info.init_ms:.1f}ms extensions)."
         list_of_tests_str = " Tests: " + ",".join(tests) if len(tests) > 0 else ""
         log_message(plugin_loaded_str + list_of_tests_str)
         return module
@@ -179,6 +223,105 @@ class ApplicationLike(typing.Protocol):
     pass
 
 
+# the contribution types a plug-in can declare in the 'contributes' section of its manifest. a plug-in declaring its
+# contributions is not imported at startup, but when one of its contributions is first used.
+#   processing: computation processing ids, loaded when a computation with the processing id is looked up.
+#   panels: panel ids, loaded when the panel is created. may be a dict with id, name, positions, position.
+#   io_handlers: import/export handler ids, loaded when the import/export handlers are first used.
+CONTRIBUTION_TYPES = ("processing", "panels", "io_handlers")
+
+
+class DeferredPlugIn:
+    def __init__(self, plugin_adapter: _AdapterProtocol, contributions: typing.Mapping[str, typing.Sequence[PersistentDictType]]) -> None:
+        self.plugin_adapter = plugin_adapter
+        self.identifier = plugin_adapter.manifest.get("identifier", plugin_adapter.module_name)
+        self.contributions = contributions
+
+    def get_contribution_ids(self, contribution_type: str) -> typing.Sequence[str]:
+        return [contribution["id"] for contribution in self.contributions.get(contribution_type, list())]
+
+
+__deferred_plug_ins: typing.List[DeferredPlugIn] = list()
+__deferred_plug_ins_lock = threading.RLock()
+
+
+def _get_manifest_contributions(contributes: typing.Any) -> typing.Optional[typing.Mapping[str, typing.Sequence[PersistentDictType]]]:
+    # return the normalized contributions (each contribution a dict with an id) or None if invalid.
+    if not isinstance(contributes, dict):
+        return None
+    contributions: typing.Dict[str, typing.List[PersistentDictType]] = dict()
+    for contribution_type, contribution_list in contributes.items():
+        if contribution_type not in CONTRIBUTION_TYPES or not isinstance(contribution_list, list):
+            return None
+        for contribution in contribution_list:
+            if isinstance(contribution, str):
+                contribution = {"id": contribution}
+            if not isinstance(contribution, dict) or not isinstance(contribution.get("id"), str):
+                return None
+            contributions.setdefault(contribution_type, list()).append(dict(contribution))
+    return contributions
+
+
+def _run_plug_in(plugin_adapter: _AdapterProtocol) -> None:
+    module = plugin_adapter.loaded_module
+    assert module
+    for member in inspect.getmembers(module):
+        if inspect.isfunction(member[1]) and member[0] == "run":
+            try:
+                start_time = time.perf_counter()
+                member[1]()
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
+                _get_load_info(plugin_adapter.module_path, plugin_adapter.module_name).init_ms += elapsed_ms
+                log_message(f"Plug-in '{plugin_adapter.module_name}' initialized ({elapsed_ms:.1f}ms)")
+            except Exception as e:
+                log_message(f"Plug-in '" + str(module) + "' exception during 'run'.")
+                logger.info(traceback.format_exc())
+                logger.info("--------")
+
+
+def _load_deferred_requirements(manifest: PersistentDictType) -> None:
+    # a plug-in being loaded may import the modules of the plug-ins it requires; load any deferred ones first.
+    identifiers = [requirement.split()[0] for requirement in manifest.get("requires", list()) if requirement.split()]
+    with __deferred_plug_ins_lock:
+        for deferred_plug_in in list(__deferred_plug_ins):
+            if deferred_plug_in.identifier in identifiers:
+                _load_deferred_plug_in(deferred_plug_in)
+
+
+def _load_deferred_plug_in(deferred_plug_in: DeferredPlugIn) -> None:
+    with __deferred_plug_ins_lock:
+        if deferred_plug_in not in __deferred_plug_ins:
+            return
+        __deferred_plug_ins.remove(deferred_plug_in)
+        plugin_adapter = deferred_plug_in.plugin_adapter
+        _load_deferred_requirements(plugin_adapter.manifest)
+        plugin_adapter.load()
+        if plugin_adapter.loaded_module:
+            __modules.append(plugin_adapter.loaded_module)
+            _run_plug_in(plugin_adapter)
+
+
+def load_deferred_plug_ins(contribution_type: str, contribution_id: typing.Optional[str] = None) -> bool:
+    """Load the deferred plug-ins contributing contribution_id (or any contribution, if None) of contribution_type.
+
+    Return whether any plug-in was loaded.
+    """
+    loaded = False
+    with __deferred_plug_ins_lock:
+        for deferred_plug_in in list(__deferred_plug_ins):
+            contribution_ids = deferred_plug_in.get_contribution_ids(contribution_type)
+            if contribution_ids and (contribution_id is None or contribution_id in contribution_ids):
+                _load_deferred_plug_in(deferred_plug_in)
+                loaded = True
+    return loaded
+
+
+def get_deferred_contributions(contribution_type: str) -> typing.Sequence[PersistentDictType]:
+    """Return the contributions of contribution_type declared by plug-ins which have not been loaded yet."""
+    with __deferred_plug_ins_lock:
+        return [contribution for deferred_plug_in in __deferred_plug_ins for contribution in deferred_plug_in.contributions.get(contribution_type, list())]
+
+
 def load_plug_ins(document_location: str, data_location: str, root_dir: typing.Optional[str]) -> None:
     """Load plug-ins."""
     global extensions
@@ -232,9 +375,6 @@ def load_plug_ins(document_location: str, data_location: str, root_dir: typing.O
         else:
             logger.info("NOT Loading plug-ins from %s (missing)", plugins_dir)
 
-    version_map: PersistentDictType = dict()
-    module_exists_map: typing.Dict[str, bool] = dict()
-
     plugin_adapters = list[_AdapterProtocol]()
 
     def case_insensitive_name(item: typing.Any) -> str:
@@ -248,8 +388,17 @@ def load_plug_ins(document_location: str, data_location: str, root_dir: typing.O
     for directory, relative_path in plugin_dirs:
         plugin_adapters.append(PlugInAdapter(directory, relative_path))
 
+    _load_plug_in_adapters(plugin_adapters)
+
+
+def _load_plug_in_adapters(adapters: typing.Sequence[_AdapterProtocol]) -> None:
+    # load the plug-ins in dependency order, deferring the ones that declare their contributions.
+    version_map: PersistentDictType = dict()
+    module_exists_map: typing.Dict[str, bool] = dict()
+
     ordered_module_adapters = list[_AdapterProtocol]()
 
+    plugin_adapters = list(adapters)
     progress = True
     while progress:
         progress = False
@@ -275,6 +424,9 @@ def load_plug_ins(document_location: str, data_location: str, root_dir: typing.O
                 if "requires" in manifest and not isinstance(manifest["requires"], list):
                     logger.info("Invalid manifest ('requires' not a list): %s", manifest_path)
                     manifest_valid = False
+                if "contributes" in manifest and _get_manifest_contributions(manifest["contributes"]) is None:
+                    logger.info("Invalid manifest ('contributes' invalid): %s", manifest_path)
+                    manifest_valid = False
                 if not manifest_valid:
                     continue
                 for module in manifest.get("modules", list()):
@@ -311,6 +463,16 @@ def load_plug_ins(document_location: str, data_location: str, root_dir: typing.O
                 if not manifest_valid:
                     continue
                 version_map[manifest["identifier"]] = manifest["version"]
+                contributions = _get_manifest_contributions(manifest.get("contributes"))
+                if contributions:
+                    # the plug-in declares its contributions; load it when one is first used.
+                    with __deferred_plug_ins_lock:
+                        __deferred_plug_ins.append(DeferredPlugIn(plugin_adapter, contributions))
+                    _get_load_info(plugin_adapter.module_path, plugin_adapter.module_name).status = "deferred"
+                    log_message(f"Plug-in '{plugin_adapter.module_name}' deferred until first use ({plugin_adapter.module_path}).")
+                    progress = True
+                    continue
+                _load_deferred_requirements(manifest)
             # read the manifests, if any
             # repeat loop of plug-ins until no plug-ins left in the list
             #   if all dependencies satisfied for a plug-in, load it
@@ -326,19 +488,10 @@ def load_plug_ins(document_location: str, data_location: str, root_dir: typing.O
         log_message(f"Plug-in '{plugin_adapter.module_name}' NOT loaded (requirements) ({plugin_adapter.module_path}).")
 
     for plugin_adapter in ordered_module_adapters:
-        module = plugin_adapter.loaded_module
-        assert module
-        for member in inspect.getmembers(module):
-            if inspect.isfunction(member[1]) and member[0] == "run":
-                try:
-                    start_time = time.time()
-                    member[1]()
-                    elapsed_s = int(time.time() - start_time)
-                    log_message(f"Plug-in '{plugin_adapter.module_name}' initialized ({elapsed_s}s)")
-                except Exception as e:
-                    log_message(f"Plug-in '" + str(module) + "' exception during 'run'.")
-                    logger.info(traceback.format_exc())
-                    logger.info("--------")
+        _run_plug_in(plugin_adapter)
+
+    log_load_report()
+
 
 def unload_plug_ins() -> None:
     global extensions
@@ -350,6 +503,9 @@ def unload_plug_ins() -> None:
 
     extensions = []
 
+    with __deferred_plug_ins_lock:
+        __deferred_plug_ins.clear()
+
 
 def append_test_suites(suites: typing.Sequence[unittest.suite.TestSuite]) -> None:
     __test_suites.extend(suites)
@@ -17,14 +17,14 @@ import typing
 
 # third party libraries
 import numpy
-import scipy.signal
-import scipy.signal.windows
+import numpy.typing
 
 # local libraries
 from nion.data import Core
 from nion.data import DataAndMetadata
 from nion.data import xdata_1_0 as xd
 from nion.swift.model import Symbolic
+from nion.swift.model import Utility
 from nion.utils import Registry
 
 if typing.TYPE_CHECKING:
@@ -37,6 +37,57 @@ _ProcessingResult = typing.Union[DataAndMetadata.DataAndMetadata, DataAndMetadat
 _ = gettext.gettext
 
 
+def _get_window_dtype(dtype: numpy.typing.DTypeLike) -> numpy.dtype[typing.Any]:
+    # single precision sources are windowed in single precision; everything else in double precision.
+    return numpy.dtype(numpy.float32) if numpy.dtype(dtype) in (numpy.float32, numpy.complex64) else numpy.dtype(numpy.float64)
+
+
+# windows of large data are large (a 4096x4096 float64 window is 128 MB), so the cache is limited by size.
+_window_cache: Utility.LRUCache[typing.Tuple[typing.Any, ...], _ImageDataType] = Utility.LRUCache(max_count=8, max_bytes=128 * 1024 * 1024)
+
+
+def _make_window_data(kind: str, shape: typing.Tuple[int, ...], params: typing.Tuple[typing.Tuple[str, float], ...], dtype: numpy.dtype[typing.Any]) -> _ImageDataType:
+    import scipy.signal.windows  # slow to import; import on first use.
+    kwargs = dict(params)
+    if kind == "gaussian":
+        if len(shape) == 1:
+            window = scipy.signal.windows.gaussian(shape[0], std=shape[0] / 2)
+        else:
+            # uses circularly rotated approach of generating 2D filter from 1D
+            h, w = shape
+            y, x = numpy.meshgrid(numpy.linspace(-h / 2, h / 2, h, dtype=dtype), numpy.linspace(-w / 2, w / 2, w, dtype=dtype), indexing='ij')
+            s = 1 / (min(w, h) * kwargs["sigma"])
+            r = numpy.sqrt(y * y + x * x) * s
+            window = numpy.exp(-0.5 * r * r)
+    elif kind in ("hamming", "hann"):
+        window_fn = scipy.signal.windows.hamming if kind == "hamming" else scipy.signal.windows.hann
+        if len(shape) == 1:
+            window = window_fn(shape[0])
+        else:
+            # uses outer product approach of generating 2D filter from 1D
+            h, w = shape
+            window = numpy.outer(window_fn(h).astype(dtype), window_fn(w).astype(dtype))
+    else:
+        raise ValueError(f"Unknown window kind {kind}.")
+    window = numpy.ascontiguousarray(window, dtype=dtype)
+    # the window is shared between callers; make sure it cannot be modified.
+    window.setflags(write=False)
+    return window
+
+
+def get_window_data(kind: str, shape: DataAndMetadata.ShapeType, dtype: numpy.typing.DTypeLike, **kwargs: float) -> _ImageDataType:
+    """Return the read-only window array of kind (gaussian, hamming, hann) for a datum of shape.
+
+    The window is computed in single precision if dtype is single precision, otherwise in double precision. Windows are
+    cached by kind, shape, parameters, and dtype so that repeated processing of same shaped data (live data, mapped
+    processing) does not recompute them. The cache is limited to 128 MB of windows.
+    """
+    shape_tuple = tuple(shape)
+    params = tuple(sorted(kwargs.items()))
+    window_dtype = _get_window_dtype(dtype)
+    return _window_cache.get((kind, shape_tuple, params, window_dtype), functools.partial(_make_window_data, kind, shape_tuple, params, window_dtype))
+
+
 class ProcessingDataSource:
     """A data source that provides cropped and filtered versions of the xdata passed to it.
 
@@ -205,15 +256,9 @@ class ProcessingGaussianWindow(ProcessingBase):
         sigma = kwargs.get("sigma", 1.0)
         src_xdata = src.xdata
         if src_xdata and src_xdata.datum_dimension_count == 1:
-            w = src_xdata.datum_dimension_shape[0]
-            return src_xdata * scipy.signal.windows.gaussian(src_xdata.datum_dimension_shape[0], std=w / 2)  # type: ignore
+            return src_xdata * get_window_data("gaussian", src_xdata.datum_dimension_shape, src_xdata.data_dtype)  # type: ignore
         elif src_xdata and src_xdata.datum_dimension_count == 2:
-            # uses circularly rotated approach of generating 2D filter from 1D
-            h, w = src_xdata.datum_dimension_shape
-            y, x = numpy.meshgrid(numpy.linspace(-h / 2, h / 2, h), numpy.linspace(-w / 2, w / 2, w), indexing='ij')
-            s = 1 / (min(w, h) * sigma)
-            r = numpy.sqrt(y * y + x * x) * s
-            return src_xdata * numpy.exp(-0.5 * r * r)  # type: ignore
+            return src_xdata * get_window_data("gaussian", src_xdata.datum_dimension_shape, src_xdata.data_dtype, sigma=sigma)  # type: ignore
         return None
 
 
@@ -231,13 +276,9 @@ class ProcessingHammingWindow(ProcessingBase):
     def process(self, *, src: ProcessingDataSource, **kwargs: typing.Any) -> _ProcessingResult:
         src_xdata = src.xdata
         if src_xdata and src_xdata.datum_dimension_count == 1:
-            return src_xdata * scipy.signal.windows.hamming(src_xdata.datum_dimension_shape[0])  # type: ignore
+            return src_xdata * get_window_data("hamming", src_xdata.datum_dimension_shape, src_xdata.data_dtype)  # type: ignore
         elif src_xdata and src_xdata.datum_dimension_count == 2:
-            # uses outer product approach of generating 2D filter from 1D
-            h, w = src_xdata.datum_dimension_shape
-            w0 = numpy.reshape(scipy.signal.windows.hamming(w), (1, w))
-            w1 = numpy.reshape(scipy.signal.windows.hamming(h), (h, 1))
-            return src_xdata * w0 * w1
+            return src_xdata * get_window_data("hamming", src_xdata.datum_dimension_shape, src_xdata.data_dtype)  # type: ignore
         return None
 
 
@@ -255,13 +296,9 @@ class ProcessingHannWindow(ProcessingBase):
     def process(self, *, src: ProcessingDataSource, **kwargs: typing.Any) -> _ProcessingResult:
         src_xdata = src.xdata
         if src_xdata and  src_xdata.datum_dimension_count == 1:
-            return src_xdata * scipy.signal.windows.hann(src_xdata.datum_dimension_shape[0])  # type: ignore
+            return src_xdata * get_window_data("hann", src_xdata.datum_dimension_shape, src_xdata.data_dtype)  # type: ignore
         elif src_xdata and src_xdata.datum_dimension_count == 2:
-            # uses outer product approach of generating 2D filter from 1D
-            h, w = src_xdata.datum_dimension_shape
-            w0 = numpy.reshape(scipy.signal.windows.hann(w), (1, w))
-            w1 = numpy.reshape(scipy.signal.windows.hann(h), (h, 1))
-            return src_xdata * w0 * w1
+            return src_xdata * get_window_data("hann", src_xdata.datum_dimension_shape, src_xdata.data_dtype)  # type: ignore
         return None
 
 
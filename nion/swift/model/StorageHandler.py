@@ -79,6 +79,14 @@ class StorageHandler(typing.Protocol):
         """Reserve space for data in storage with the given shape, dtype, descriptor, and file datetime."""
         ...
 
+    def append_data(self, data: _NDArray, data_descriptor: DataAndMetadata.DataDescriptor, file_datetime: datetime.datetime) -> None:
+        """Append the data array along the first axis of the data in storage with the specified file datetime.
+
+        The data array must match the data in storage except for the length of the first axis. If there is no data in
+        storage, the data array is written.
+        """
+        ...
+
     def prepare_move(self) -> None:
         """Prepare the storage handler for moving or renaming the underlying storage."""
         ...
@@ -29,6 +29,7 @@ import uuid
 
 # third party libraries
 import numpy
+import numpy.typing
 
 # local libraries
 from nion.data import Core
@@ -230,7 +231,7 @@ class ComputationOutput(Persistence.PersistentObject):
         # for registered computations, the computation class takes precedence in defining the labels.
         computation = self.container
         if isinstance(computation, Computation) and computation.processing_id:
-            compute_class = _computation_types.get(computation.processing_id)
+            compute_class = get_computation_type(computation.processing_id)
             if compute_class:
                 label = typing.cast(typing.Optional[str], getattr(compute_class, "outputs", dict()).get(self.name, dict()).get("label", str()))
                 if label:
@@ -1030,7 +1031,7 @@ class ComputationVariable(Persistence.PersistentObject):
         computation = self.container
         if isinstance(computation, Computation):
             processing_id = computation.processing_id
-            compute_class = _computation_types.get(processing_id) if processing_id else None
+            compute_class = get_computation_type(processing_id)
             if compute_class:
                 label = typing.cast(typing.Optional[str], getattr(compute_class, "inputs", dict()).get(self.name, dict()).get("label", str()))
                 if label:
@@ -1043,7 +1044,7 @@ class ComputationVariable(Persistence.PersistentObject):
         computation = self.container
         if isinstance(computation, Computation):
             processing_id = computation.processing_id
-            compute_class = _computation_types.get(processing_id) if processing_id else None
+            compute_class = get_computation_type(processing_id)
             if compute_class:
                 label = typing.cast(typing.Optional[str], getattr(compute_class, "inputs", dict()).get(self.name, dict()).get("entity_id", str()))
                 if label:
@@ -1067,6 +1068,64 @@ def result_factory(lookup_id: typing.Callable[[str], str]) -> ComputationOutput:
     return ComputationOutput()
 
 
+MaskCacheValue = typing.TypeVar("MaskCacheValue")
+
+
+def _iter_mask_arrays(value: typing.Any) -> typing.Iterator[numpy.typing.NDArray[typing.Any]]:
+    if isinstance(value, numpy.ndarray):
+        yield value
+    elif isinstance(value, tuple):
+        for item in value:
+            yield from _iter_mask_arrays(item)
+
+
+class MaskCache(Utility.LRUCache[typing.Hashable, typing.Any]):
+    """A small thread safe LRU cache of boolean masks.
+
+    Masks are keyed by the mask graphics (uuid and modified count), the data shape, and how the mask is derived; for
+    instance, computation filters also key by the calibrated origin and whether the mask has been made symmetric for use
+    in the Fourier domain. A cached value is a mask or a tuple including masks, such as the bounding box slices and the
+    mask cropped to them. Cached masks are read-only and may be shared.
+    """
+
+    def __init__(self, max_count: int = 8) -> None:
+        super().__init__(max_count=max_count, size_fn=lambda value: sum(mask.nbytes for mask in _iter_mask_arrays(value)))
+
+    def get_mask(self, key: typing.Hashable, fn: typing.Callable[[], MaskCacheValue]) -> MaskCacheValue:
+        def make_mask() -> MaskCacheValue:
+            value = fn()
+            for mask in _iter_mask_arrays(value):
+                mask.flags.writeable = False
+            return value
+
+        return typing.cast(MaskCacheValue, self.get(key, make_mask))
+
+
+mask_cache = MaskCache()
+
+
+def make_fourier_mask(mask: numpy.typing.NDArray[numpy.bool_]) -> numpy.typing.NDArray[numpy.bool_]:
+    # make the mask symmetric about the center, matching Core.function_fourier_mask.
+    y_half = mask.shape[0] // 2
+    y_half_p1 = y_half + 1
+    y_half_m1 = y_half - 1
+    y_low = 0 if mask.shape[0] % 2 == 0 else None
+    x_half = mask.shape[1] // 2
+    x_half_p1 = x_half + 1
+    x_half_m1 = x_half - 1
+    x_low = 0 if mask.shape[1] % 2 == 0 else None
+    fourier_mask = numpy.empty_like(mask)
+    fourier_mask[y_half_p1:, x_half_p1:] = mask[y_half_p1:, x_half_p1:]
+    fourier_mask[y_half_p1:, x_half_m1:x_low:-1] = mask[y_half_p1:, x_half_m1:x_low:-1]
+    fourier_mask[y_half_m1:y_low:-1, x_half_m1:x_low:-1] = mask[y_half_p1:, x_half_p1:]
+    fourier_mask[y_half_m1:y_low:-1, x_half_p1:] = mask[y_half_p1:, x_half_m1:x_low:-1]
+    fourier_mask[0, :] = mask[0, :]
+    fourier_mask[:, 0] = mask[:, 0]
+    fourier_mask[y_half, :] = mask[y_half, :]
+    fourier_mask[:, x_half] = mask[:, x_half]
+    return fourier_mask
+
+
 class DataSource:
     def __init__(self, data_item: DataItem.DataItem | None, display_data_channel: DisplayItem.DisplayDataChannel | None, graphic: Graphics.Graphic | None) -> None:
         assert not (data_item and display_data_channel)
@@ -1074,11 +1133,14 @@ class DataSource:
         self.__display_data_channel = display_data_channel
         display_item = typing.cast("DisplayItem.DisplayItem", display_data_channel.container) if display_data_channel else None
         self.__mask_items = list[Graphics.MaskItem]()
+        mask_graphic_keys = list[tuple[uuid.UUID, int]]()
         if display_item:
             for graphic_ in display_item.graphics:
                 if graphic_.has_attribute(Graphics.GraphicAttributeEnum.TWO_DIMENSIONAL):
                     if graphic_.used_role in ("mask", "fourier_mask"):
                         self.__mask_items.append(graphic_.get_mask_item())
+                        mask_graphic_keys.append((graphic_.uuid, graphic_.modified_count))
+        self.__mask_graphic_keys = tuple(mask_graphic_keys)
         data_item = display_data_channel.data_item if display_data_channel else data_item
         self.__xdata = data_item.xdata if data_item else None
         self.__display_data_shape_calculator = DisplayItem.DisplayDataShapeCalculator(self.__xdata.data_metadata if self.__xdata else None)
@@ -1184,18 +1246,29 @@ class DataSource:
     @property
     def filtered_xdata(self) -> typing.Optional[DataAndMetadata.DataAndMetadata]:
         xdata = self.__xdata
-        filter_xdata = self.filter_xdata
-        if xdata and filter_xdata:
-            if xdata.is_data_complex_type:
-                return Core.function_fourier_mask(xdata, filter_xdata)
-            else:
-                return filter_xdata * xdata
+        if xdata and self.__mask_items:
+            data = xdata.data
+            assert data is not None
+            is_fourier = xdata.is_data_complex_type and len(data.shape) == 2
+            mask = self.__get_mask(xdata, is_fourier)
+            # apply the boolean mask in the data type of the data, avoiding a full frame float mask multiply.
+            masked_data = numpy.where(mask, data, numpy.zeros((), dtype=data.dtype))
+            return DataAndMetadata.new_data_and_metadata(data=masked_data,
+                                                         intensity_calibration=xdata.intensity_calibration,
+                                                         dimensional_calibrations=xdata.dimensional_calibrations)
         return xdata
 
     @property
     def filter_xdata(self) -> typing.Optional[DataAndMetadata.DataAndMetadata]:
         xdata = self.__xdata
         assert xdata
+        shape = xdata.datum_dimension_shape
+        assert shape is not None
+        if self.__mask_items:
+            return DataAndMetadata.new_data_and_metadata(data=numpy.copy(self.__get_mask(xdata, False)))
+        return DataAndMetadata.new_data_and_metadata(data=numpy.ones(shape))
+
+    def __get_mask(self, xdata: DataAndMetadata.DataAndMetadata, is_fourier: bool) -> numpy.typing.NDArray[numpy.bool_]:
         shape = xdata.datum_dimension_shape
         assert shape is not None
         datum_calibrations = xdata.datum_dimensional_calibrations
@@ -1204,20 +1277,23 @@ class DataSource:
         calibrated_origin: Graphics.CalibratedOriginType
         if len(shape) == 1:
             calibrated_origin = datum_calibrations[0].convert_from_calibrated_value(0.0)
+            calibrated_origin_key: tuple[float, ...] = (calibrated_origin,)
         elif len(shape) == 2:
             calibrated_origin = Geometry.FloatPoint(
                 y=datum_calibrations[0].convert_from_calibrated_value(0.0),
                 x=datum_calibrations[1].convert_from_calibrated_value(0.0))
+            calibrated_origin_key = (calibrated_origin.y, calibrated_origin.x)
         else:
             raise NotImplementedError("Filtering not implemented for data with more than two dimensions.")
-        mask = None
-        for mask_item in self.__mask_items:
-            if mask is None:
-                mask = numpy.zeros(shape)
-            mask = numpy.logical_or(mask, mask_item.get_mask_data(shape, calibrated_origin))
-        if mask is None:
-            mask = numpy.ones(shape)
-        return DataAndMetadata.new_data_and_metadata(data=mask)
+
+        def make_mask() -> numpy.typing.NDArray[numpy.bool_]:
+            mask = numpy.zeros(shape, dtype=bool)
+            for mask_item in self.__mask_items:
+                numpy.logical_or(mask, mask_item.get_mask_data(shape, calibrated_origin), out=mask)
+            return make_fourier_mask(mask) if is_fourier else mask
+
+        key = (self.__mask_graphic_keys, tuple(shape), calibrated_origin_key, is_fourier)
+        return mask_cache.get_mask(key, make_mask)
 
 
 class BoundDataEventType(enum.Enum):
@@ -2085,7 +2161,7 @@ class Computation(Persistence.PersistentObject):
         label = typing.cast(typing.Optional[str], self._get_persistent_property_value("label"))
         if not label:
             processing_id = self.processing_id
-            compute_class = _computation_types.get(processing_id) if processing_id else None
+            compute_class = get_computation_type(processing_id)
             if compute_class:
                 label = typing.cast(typing.Optional[str], getattr(compute_class, "label", None))
         return label
@@ -2097,7 +2173,7 @@ class Computation(Persistence.PersistentObject):
     def get_computation_attribute(self, attribute: str, default: typing.Any = None) -> typing.Any:
         """Returns the attribute for the computation."""
         processing_id = self.processing_id
-        compute_class = _computation_types.get(processing_id) if processing_id else None
+        compute_class = get_computation_type(processing_id)
         if compute_class:
             return getattr(compute_class, "attributes", dict()).get(attribute, default)
         return default
@@ -3296,7 +3372,7 @@ class RegisteredComputationExecutor(ComputationExecutor):
         processing_id = computation.processing_id
         api_computation = api._new_api_object(computation)
         api_computation.api = api
-        compute_class = _computation_types.get(processing_id) if processing_id else None
+        compute_class = get_computation_type(processing_id)
         self.__computation_handler = compute_class(api_computation) if compute_class else None
         if not self.__computation_handler:
             self.error_text = "Missing computation (" + (processing_id or "unknown") + ")."
@@ -3347,6 +3423,15 @@ _computation_types: typing.Dict[str, typing.Callable[[_APIComputation], Computat
 def register_computation_type(computation_type_id: str, compute_class: typing.Callable[[_APIComputation], ComputationHandlerLike]) -> None:
     _computation_types[computation_type_id] = compute_class
 
+def get_computation_type(computation_type_id: typing.Optional[str]) -> typing.Optional[typing.Callable[[_APIComputation], ComputationHandlerLike]]:
+    if not computation_type_id:
+        return None
+    compute_class = _computation_types.get(computation_type_id)
+    # the computation type may be contributed by a plug-in which has not been loaded yet.
+    if not compute_class and PlugInManager.load_deferred_plug_ins("processing", computation_type_id):
+        compute_class = _computation_types.get(computation_type_id)
+    return compute_class
+
 
 # for testing
 
@@ -115,6 +115,57 @@ class Singleton(type):
         return cls.instance
 
 
+LRUCacheKey = typing.TypeVar("LRUCacheKey", bound=typing.Hashable)
+LRUCacheValue = typing.TypeVar("LRUCacheValue")
+
+
+class LRUCache(typing.Generic[LRUCacheKey, LRUCacheValue]):
+    """A small thread safe least recently used cache.
+
+    The cache holds at most max_count values and, if max_bytes is given, at most max_bytes in total as measured by
+    size_fn (by default the nbytes of the value). A value larger than max_bytes is returned but not cached.
+    """
+
+    def __init__(self, max_count: int = 8, max_bytes: typing.Optional[int] = None,
+                 size_fn: typing.Optional[typing.Callable[[LRUCacheValue], int]] = None) -> None:
+        self.__max_count = max_count
+        self.__max_bytes = max_bytes
+        self.__size_fn = size_fn if size_fn else lambda value: int(getattr(value, "nbytes", 0))
+        self.__values: typing.OrderedDict[LRUCacheKey, typing.Tuple[LRUCacheValue, int]] = collections.OrderedDict()
+        self.__nbytes = 0
+        self.__lock = threading.RLock()
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__values.clear()
+            self.__nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Return the total size of the cached values."""
+        return self.__nbytes
+
+    def get(self, key: LRUCacheKey, fn: typing.Callable[[], LRUCacheValue]) -> LRUCacheValue:
+        """Return the cached value for key, calling fn to make it (outside of the lock) if it is not cached."""
+        with self.__lock:
+            value_and_size = self.__values.get(key)
+            if value_and_size is not None:
+                self.__values.move_to_end(key)
+                return value_and_size[0]
+        value = fn()
+        size = self.__size_fn(value)
+        if self.__max_bytes is None or size <= self.__max_bytes:
+            with self.__lock:
+                old_value_and_size = self.__values.pop(key, None)
+                if old_value_and_size is not None:
+                    self.__nbytes -= old_value_and_size[1]
+                self.__values[key] = value, size
+                self.__nbytes += size
+                while len(self.__values) > self.__max_count or (self.__max_bytes is not None and self.__nbytes > self.__max_bytes):
+                    self.__nbytes -= self.__values.popitem(last=False)[1][1]
+        return value
+
+
 DirtyValue = typing.Any
 CleanValue = typing.Union[typing.Dict[str, typing.Any], typing.List[typing.Any], typing.Tuple[typing.Any], str, float, int, bool, None]
 
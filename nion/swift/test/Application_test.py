@@ -2,10 +2,15 @@
 import json
 import logging
 import pathlib
+import subprocess
+import sys
+import tempfile
+import textwrap
 import typing
 import unittest
 
 # local libraries
+from nion.swift import StartupProfile
 from nion.swift.test import TestContext
 
 
@@ -25,6 +30,51 @@ class TestApplicationClass(unittest.TestCase):
             with changes_json_path.open() as changes_json_fp:
                 changes_data: typing.Sequence[typing.Mapping[str, typing.Any]] = json.load(changes_json_fp)
 
+    def test_heavy_modules_are_not_imported_while_constructing_document_model(self) -> None:
+        # run in a fresh interpreter since this process has already imported everything. modules imported by the
+        # nion.data and nion.ui dependencies are outside of this package and are excluded.
+        script = textwrap.dedent("""
+            import json, sys
+            heavy_module_names = ("h5py", "scipy.signal", "scipy.stats", "imageio")
+            import nion.data.xdata_1_0
+            import nion.ui.CanvasItem
+            dependency_module_names = [m for m in heavy_module_names if m in sys.modules]
+            from nion.swift import Application
+            from nion.swift import Facade
+            from nion.swift.test import TestContext
+            with TestContext.create_memory_context() as test_context:
+                test_context.create_document_model()
+            print(json.dumps([m for m in heavy_module_names if m in sys.modules and m not in dependency_module_names]))
+        """)
+        root_path = pathlib.Path(__file__).parent.parent.parent.parent
+        result = subprocess.run([sys.executable, "-c", script], cwd=root_path, capture_output=True, text=True, timeout=300)
+        self.assertEqual(0, result.returncode, result.stderr)
+        self.assertEqual(list(), json.loads(result.stdout.strip().splitlines()[-1]))
+
+    def test_startup_profile_records_imports_and_phases(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            directory_path = pathlib.Path(temporary_directory)
+            (directory_path / "startup_profile_test_module.py").write_text("import json\nvalue = 1\n")
+            profile_path = directory_path / "profile.txt"
+            sys.path.append(str(directory_path))
+            try:
+                StartupProfile.start(profile_path)
+                with StartupProfile.phase("outer"):
+                    with StartupProfile.phase("inner"):
+                        import startup_profile_test_module
+                StartupProfile.finish()
+            finally:
+                sys.path.remove(str(directory_path))
+                sys.modules.pop("startup_profile_test_module", None)
+            self.assertEqual(1, startup_profile_test_module.value)
+            profile_lines = profile_path.read_text().splitlines()
+            self.assertTrue(any(line.endswith(" outer") for line in profile_lines))
+            self.assertTrue(any(line.endswith("   inner") for line in profile_lines))
+            self.assertTrue(any(line.endswith(" startup_profile_test_module") for line in profile_lines))
+            # finished; phases are no longer recorded
+            with StartupProfile.phase("after"):
+                pass
+
 
 if __name__ == '__main__':
     logging.getLogger().setLevel(logging.DEBUG)
@@ -1,5 +1,8 @@
 # standard libraries
 import logging
+import pathlib
+import tempfile
+import types
 import unittest
 import uuid
 
@@ -55,6 +58,31 @@ class TestSuspendableCacheClass(unittest.TestCase):
         suspendable_cache.spill_cache()
         self.assertTrue(suspendable_cache.get_cached_value(suspendable_cache, "key", False))
 
+    def test_get_cached_values_matches_individual_reads(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_cache = Cache.DbStorageCache(pathlib.Path(temp_dir) / "cache.nscache")
+            try:
+                targets = [types.SimpleNamespace(uuid=uuid.uuid4()) for _ in range(1200)]
+                suspendable_caches = [Cache.SuspendableCache(storage_cache) for _ in targets]
+                for i, (suspendable_cache, target) in enumerate(zip(suspendable_caches, targets)):
+                    if i % 3 == 0:
+                        suspendable_cache.set_cached_value(target, "key", i, dirty=i % 2 == 0)
+                # values pending in a suspended cache are returned instead of the stored ones
+                suspendable_caches[3].suspend_cache()
+                suspendable_caches[3].set_cached_value(targets[3], "key", -3)
+                suspendable_caches[6].suspend_cache()
+                suspendable_caches[6].remove_cached_value(targets[6], "key")
+                values = Cache.get_cached_values(list(zip(suspendable_caches, targets)), "key")
+                expected = [(suspendable_cache.get_cached_value(target, "key"), suspendable_cache.is_cached_value_dirty(target, "key")) for suspendable_cache, target in zip(suspendable_caches, targets)]
+                self.assertEqual(expected, values)
+                self.assertEqual((-3, False), values[3])
+                self.assertIsNone(values[6][0])
+                self.assertEqual((None, True), values[1])
+                suspendable_caches[3].spill_cache()
+                suspendable_caches[6].spill_cache()
+            finally:
+                storage_cache.close()
+
 if __name__ == '__main__':
     logging.getLogger().setLevel(logging.DEBUG)
     unittest.main()
@@ -1631,6 +1631,41 @@ class TestDataItemClass(unittest.TestCase):
             document_model.perform_data_item_updates()
             self.assertEqual(data_item.xdata.timestamp, datetime.datetime(2000, 1, 1))
 
+    def test_update_partial_from_thread_writes_data_and_reports_changed_region(self):
+        with TestContext.create_memory_context() as test_context:
+            document_model = test_context.create_document_model()
+            data_item = DataItem.DataItem(numpy.zeros((8, 4), float))
+            document_model.append_data_item(data_item)
+            data_item.increment_data_ref_count()
+            try:
+                data_metadata = copy.deepcopy(data_item.data_metadata)
+                data_and_metadata = DataAndMetadata.new_data_and_metadata(numpy.ones((2, 4), float))
+
+                def update_partial() -> None:
+                    document_model.update_data_item_partial(data_item, data_metadata, data_and_metadata, [slice(0, 2), slice(None)], [slice(2, 4), slice(None)])
+                    document_model.update_data_item_partial(data_item, data_metadata, data_and_metadata, [slice(0, 1), slice(None)], [slice(4, 5), slice(None)])
+
+                thread = threading.Thread(target=update_partial)
+                thread.start()
+                thread.join()
+                # the data is written on the producer thread; only the notification is pending.
+                self.assertEqual(12, numpy.sum(data_item.data))
+                self.assertEqual(1, document_model._get_pending_data_item_updates_count())
+                data_changed_count = 0
+
+                def data_changed() -> None:
+                    nonlocal data_changed_count
+                    data_changed_count += 1
+
+                with contextlib.closing(data_item.data_changed_event.listen(data_changed)):
+                    document_model.perform_data_item_updates()
+                self.assertEqual(1, data_changed_count)
+                self.assertEqual((slice(2, 5), slice(0, None)), data_item.data_changed_region)
+                data_item.set_data(numpy.zeros((8, 4), float))
+                self.assertIsNone(data_item.data_changed_region)
+            finally:
+                data_item.decrement_data_ref_count()
+
     def test_queue_update_uses_timestamp_from_xdata(self):
         with TestContext.create_memory_context() as test_context:
             document_model = test_context.create_document_model()
@@ -4,6 +4,7 @@ import logging
 import pathlib
 import typing
 import unittest
+import unittest.mock
 
 # third party libraries
 import numpy
@@ -16,6 +17,7 @@ from nion.swift import Facade
 from nion.swift import HistogramPanel
 from nion.swift import MimeTypes
 from nion.swift import ProjectPanel
+from nion.swift import Thumbnails
 from nion.swift.model import DataGroup
 from nion.swift.model import DataItem
 from nion.swift.test import TestContext
@@ -642,6 +644,21 @@ class TestDataPanelClass(unittest.TestCase):
             self.assertEqual(data_panel._scroll_area_canvas_item.content_origin, Geometry.IntPoint(-80, 0))
             self.assertEqual(data_panel._scroll_area_canvas_item.content_size, Geometry.IntSize(800, 304))
 
+    def test_data_panel_loads_visible_thumbnails_and_prefetch_window_first_when_scrolling(self):
+        with TestContext.create_memory_context() as test_context:
+            document_controller = test_context.create_document_controller()
+            document_model = document_controller.document_model
+            for _ in range(10):
+                document_model.append_data_item(DataItem.DataItem(numpy.zeros((8, 8), numpy.uint32)))
+            document_controller.periodic()
+            data_panel = document_controller.find_dock_panel("data-panel")
+            display_items = document_controller.filtered_display_items_model.display_items
+            with unittest.mock.patch.object(Thumbnails.ThumbnailManager(), "load_thumbnails") as load_thumbnails:
+                data_panel._data_list_canvas_item.layout_immediate(Geometry.IntSize(width=320, height=160))
+                self.assertEqual(list(display_items[0:4]), load_thumbnails.call_args[0][0])
+                data_panel._scroll_bar_canvas_item.simulate_drag((8, 8), (24, 8))
+                self.assertEqual(list(display_items[1:5]) + [display_items[0]], load_thumbnails.call_args[0][0])
+
     def test_data_panel_grid_contents_resize_properly(self):
         with TestContext.create_memory_context() as test_context:
             document_controller = test_context.create_document_controller()
@@ -10,9 +10,11 @@ import numpy
 
 # local libraries
 from nion.data import Calibration
+from nion.data import Core
 from nion.data import DataAndMetadata
 from nion.swift import Application
 from nion.swift import Facade
+from nion.swift.model import ColorMaps
 from nion.swift.model import DataItem
 from nion.swift.model import DisplayItem
 from nion.swift.model import DynamicString
@@ -838,6 +840,68 @@ class TestDisplayItemClass(unittest.TestCase):
         self.assertEqual(dimensional_calibrations[0], display_data_processor.get_result("data").dimensional_calibrations[0])
         self.assertEqual(dimensional_calibrations[1], display_data_processor.get_result("data").dimensional_calibrations[1])
 
+    def test_adjusted_data_processor_lookup_table_matches_direct_adjustments(self) -> None:
+        data = numpy.linspace(-20.0, 120.0, 64 * 64).reshape(64, 64)
+        data[0, 0] = numpy.nan
+        xdata = DataAndMetadata.new_data_and_metadata(data=data)
+        display_range = (0.0, 100.0)
+        for adjustments in ([{"type": "gamma", "gamma": 0.8}], [{"type": "log"}], [{"type": "gamma", "gamma": 2.0}, {"type": "log"}]):
+            self.assertIsNotNone(DisplayItem.get_adjustment_lut(adjustments, display_range))
+            normalized_data_processor = DisplayItem.NormalizedDataProcessor(display_data=xdata, display_range=display_range)
+            adjusted_data = normalized_data_processor.get_result("data").data
+            for adjustment_d in adjustments:
+                adjusted_data = DisplayItem.adjustment_factory(adjustment_d).transform(adjusted_data, display_range)
+            adjusted_data_processor = DisplayItem.AdjustedDataProcessor(normalized_data=DisplayItem.ProcessorConnection(normalized_data_processor, "data"), display_data=xdata, display_range=display_range, adjustments=adjustments)
+            lut_adjusted_data = adjusted_data_processor.get_result("data").data
+            self.assertEqual(numpy.float32, lut_adjusted_data.dtype)
+            self.assertTrue(numpy.isnan(lut_adjusted_data[0, 0]))
+            self.assertTrue(numpy.allclose(adjusted_data, lut_adjusted_data, atol=1.0 / 512, equal_nan=True))
+        # adjustments too steep to look up within the display precision and data dependent adjustments are not tabulated.
+        self.assertIsNone(DisplayItem.get_adjustment_lut([{"type": "gamma", "gamma": 0.1}], display_range))
+        self.assertIsNone(DisplayItem.get_adjustment_lut([{"type": "equalized"}], display_range))
+
+    def test_adjusted_data_processor_lookup_table_keeps_precision_of_data_far_from_zero(self) -> None:
+        data = 1e9 + numpy.arange(100, dtype=numpy.float64)
+        display_range = (1e9, 1e9 + 99)
+        adjustments = [{"type": "gamma", "gamma": 0.9}]
+        lut = DisplayItem.get_adjustment_lut(adjustments, display_range)
+        self.assertIsNotNone(lut)
+        lut_adjusted_data = DisplayItem.apply_adjustment_lut(data, display_range, lut)
+        self.assertEqual(100, len(numpy.unique(lut_adjusted_data)))
+
+    def test_fused_display_rgba_matches_display_rgba_of_adjusted_data(self) -> None:
+        data = numpy.linspace(-20.0, 120.0, 2048 * 1024).reshape(2048, 1024)
+        data[0, 0] = numpy.nan
+        color_map_data = numpy.random.RandomState(1).randint(0, 256, (256, 3)).astype(numpy.uint8)
+        display_range = (0.0, 100.0)
+        transformed_display_range = (0.1, 0.9)
+        # without adjustments, the display data is mapped directly using the transformed display range.
+        lut = DisplayItem.get_display_rgba_lut(list(), None, display_range, color_map_data)
+        with numpy.errstate(invalid="ignore"):
+            expected = Core.function_display_rgba(DataAndMetadata.new_data_and_metadata(data), display_range, color_map_data).data
+        self.assertTrue(numpy.array_equal(expected, DisplayItem.calculate_display_rgba(data, lut)))
+        self.assertTrue(numpy.array_equal(expected, DisplayItem.calculate_display_rgba(data, lut, use_executor=False)))
+        # with adjustments, the fused result differs by at most one color map entry due to the adjustment table.
+        adjustments = [{"type": "gamma", "gamma": 0.8}]
+        lut = DisplayItem.get_display_rgba_lut(adjustments, display_range, transformed_display_range, color_map_data)
+        adjusted_data = DisplayItem.adjustment_factory(adjustments[0]).transform(data / 100.0, display_range)
+        expected_indexes = numpy.clip((255 / 0.8 * (numpy.nan_to_num(adjusted_data) - 0.1)).astype(int), 0, 255)
+        color_map_rgba = ColorMaps.get_color_map_rgba(color_map_data)
+        fused_display_rgba = DisplayItem.calculate_display_rgba(data, lut)
+        expected_neighbors = [color_map_rgba[numpy.clip(expected_indexes + i, 0, 255)] for i in (-1, 0, 1)]
+        self.assertTrue(numpy.all(numpy.any([fused_display_rgba == neighbor for neighbor in expected_neighbors], axis=0)))
+        self.assertIsNone(DisplayItem.get_display_rgba_lut([{"type": "equalized"}], display_range, transformed_display_range, color_map_data))
+
+    def test_color_map_packed_rgba_is_shared_and_matches_color_map_data(self) -> None:
+        color_map_data = ColorMaps.get_color_map_data_by_id("magma")
+        color_map_rgba = ColorMaps.get_color_map_rgba(color_map_data)
+        self.assertIs(color_map_rgba, ColorMaps.get_color_map_rgba_by_id("magma"))
+        self.assertIs(ColorMaps.get_color_map_rgba_by_id("grayscale"), ColorMaps.get_color_map_rgba(None))
+        self.assertFalse(color_map_rgba.flags.writeable)
+        self.assertEqual(numpy.uint32, color_map_rgba.dtype)
+        self.assertTrue(numpy.array_equal(color_map_data, color_map_rgba.view(numpy.uint8).reshape(-1, 4)[:, 0:3]))
+        self.assertTrue(numpy.all(color_map_rgba.view(numpy.uint8).reshape(-1, 4)[:, 3] == 255))
+
     # test_transaction_does_not_cascade_to_data_item_refs
     # test_increment_data_ref_counts_cascades_to_data_item_refs
     # test_adding_data_item_twice_to_composite_item_fails
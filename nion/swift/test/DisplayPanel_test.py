@@ -5,6 +5,7 @@ import logging
 import math
 import typing
 import unittest
+import unittest.mock
 import uuid
 import weakref
 
@@ -20,6 +21,7 @@ from nion.swift import ImageCanvasItem
 from nion.swift import LinePlotCanvasItem
 from nion.swift import MimeTypes
 from nion.swift import Thumbnails
+from nion.swift import Undo
 from nion.swift.model import DataItem
 from nion.swift.model import DisplayItem
 from nion.swift.model import DocumentModel
@@ -1907,6 +1909,121 @@ class TestDisplayPanelClass(unittest.TestCase):
             self.assertEqual(1, document_controller._undo_stack._undo_count)
             self.assertEqual(0, document_controller._undo_stack._redo_count)
 
+    def test_merged_change_graphics_commands_undo_properties_changed_by_any_merged_command(self):
+        with TestContext.create_memory_context() as test_context:
+            document_controller = test_context.create_document_controller()
+            document_model = document_controller.document_model
+            data_item = DataItem.DataItem(numpy.zeros((8, 8)))
+            document_model.append_data_item(data_item)
+            display_item = document_model.get_display_item_for_data_item(data_item)
+            rect_graphics = [Graphics.RectangleGraphic() for _ in range(3)]
+            for i, rect_graphic in enumerate(rect_graphics):
+                rect_graphic.bounds = (0.1 * i, 0.1), (0.2, 0.2)
+                display_item.add_graphic(rect_graphic)
+            old_properties = [rect_graphic.write_to_dict() for rect_graphic in rect_graphics]
+            command = DisplayPanel.ChangeGraphicsCommand(document_model, display_item, rect_graphics, command_id="nudge", is_mergeable=True)
+            for rect_graphic in rect_graphics:
+                rect_graphic.bounds = (0.5, 0.5), (0.2, 0.2)
+            document_controller.push_undo_command(command)
+            command = DisplayPanel.ChangeGraphicsCommand(document_model, display_item, rect_graphics, command_id="nudge", is_mergeable=True, rotation=0.5, label="moved")
+            command.perform()
+            document_controller.push_undo_command(command)
+            self.assertEqual(1, document_controller._undo_stack._undo_count)
+            new_properties = [rect_graphic.write_to_dict() for rect_graphic in rect_graphics]
+            document_controller.handle_undo()
+            self.assertEqual(old_properties, [rect_graphic.write_to_dict() for rect_graphic in rect_graphics])
+            document_controller.handle_redo()
+            self.assertEqual(new_properties, [rect_graphic.write_to_dict() for rect_graphic in rect_graphics])
+
+    def test_undo_stack_memory_budget_discards_oldest_commands_and_spilled_commands_undo(self):
+        with TestContext.create_memory_context() as test_context:
+            document_controller = test_context.create_document_controller()
+            document_model = document_controller.document_model
+            data_item = DataItem.DataItem(numpy.random.randn(8))
+            document_model.append_data_item(data_item)
+            display_item = document_model.get_display_item_for_data_item(data_item)
+            interval_graphic = Graphics.IntervalGraphic()
+            display_item.add_graphic(interval_graphic)
+            undo_stack = document_controller._undo_stack
+            undo_stack.spill_size = None
+            for i in range(4):
+                command = DisplayPanel.ChangeGraphicsCommand(document_model, display_item, [interval_graphic])
+                interval_graphic.interval = 0.1 * i, 0.1 * i + 0.2
+                document_controller.push_undo_command(command)
+            self.assertEqual(4, undo_stack._undo_count)
+            command_memory_size = undo_stack.last_command.memory_size
+            self.assertGreater(command_memory_size, 0)
+            memory_usage = undo_stack.memory_usage
+            self.assertGreaterEqual(memory_usage, 4 * command_memory_size * 0.9)
+            undo_stack.memory_budget = memory_usage // 2
+            self.assertEqual(2, undo_stack._undo_count)
+            self.assertLessEqual(undo_stack.memory_usage, memory_usage // 2)
+            # commands at least as large as the spill size keep their snapshot in a file and hold less memory.
+            undo_stack.spill_size = 0
+            command = DisplayPanel.ChangeGraphicsCommand(document_model, display_item, [interval_graphic])
+            interval_graphic.interval = 0.7, 0.9
+            document_controller.push_undo_command(command)
+            self.assertLess(undo_stack.last_command.memory_size, command_memory_size)
+            undo_stack.undo()
+            self.assertAlmostEqual(0.3, interval_graphic.interval[0])
+            self.assertAlmostEqual(0.5, interval_graphic.interval[1])
+            undo_stack.redo()
+            self.assertAlmostEqual(0.7, interval_graphic.interval[0])
+            self.assertAlmostEqual(0.9, interval_graphic.interval[1])
+
+    def test_undo_memory_size_counts_data_and_metadata_deeply(self):
+        xdata = DataAndMetadata.new_data_and_metadata(numpy.zeros((1024, 1024), numpy.float64))
+        self.assertGreaterEqual(Undo.estimate_memory_size(xdata), xdata.data.nbytes)
+        self.assertGreaterEqual(Undo.estimate_memory_size({"values": [xdata, xdata.data.copy()]}), 2 * xdata.data.nbytes)
+
+    def test_removed_display_item_spills_undelete_log_and_undo_restores_it(self):
+        with TestContext.create_memory_context() as test_context:
+            document_controller = test_context.create_document_controller()
+            document_model = document_controller.document_model
+            data_item = DataItem.DataItem(numpy.zeros((8, 8)))
+            document_model.append_data_item(data_item)
+            display_item = document_model.get_display_item_for_data_item(data_item)
+            for i in range(20):
+                display_item.add_graphic(Graphics.PointGraphic())
+            display_item.title = "spilled"
+            undo_stack = document_controller._undo_stack
+            undo_stack.spill_size = None
+            command = document_controller.create_remove_display_items_command([display_item])
+            command.perform()
+            memory_size = command.memory_size
+            command.undo()
+            command.close()
+            undo_stack.spill_size = 0
+            display_item = document_model.display_items[0]
+            command = document_controller.create_remove_display_items_command([display_item])
+            command.perform()
+            document_controller.push_undo_command(command)
+            self.assertEqual(0, len(document_model.display_items))
+            self.assertLess(undo_stack.last_command.memory_size, memory_size)
+            document_controller.handle_undo()
+            self.assertEqual(1, len(document_model.display_items))
+            self.assertEqual("spilled", document_model.display_items[0].title)
+            self.assertEqual(20, len(document_model.display_items[0].graphics))
+
+    def test_merging_change_graphics_commands_keeps_cached_memory_size(self):
+        with TestContext.create_memory_context() as test_context:
+            document_controller = test_context.create_document_controller()
+            document_model = document_controller.document_model
+            data_item = DataItem.DataItem(numpy.zeros((8, 8)))
+            document_model.append_data_item(data_item)
+            display_item = document_model.get_display_item_for_data_item(data_item)
+            rect_graphic = Graphics.RectangleGraphic()
+            display_item.add_graphic(rect_graphic)
+            undo_stack = document_controller._undo_stack
+            with unittest.mock.patch.object(Undo, "estimate_memory_size", wraps=Undo.estimate_memory_size) as estimate_memory_size:
+                for i in range(10):
+                    command = DisplayPanel.ChangeGraphicsCommand(document_model, display_item, [rect_graphic], command_id="nudge", is_mergeable=True)
+                    rect_graphic.bounds = (0.01 * i, 0.1), (0.2, 0.2)
+                    document_controller.push_undo_command(command)
+                    undo_stack.memory_usage
+                self.assertEqual(1, undo_stack._undo_count)
+                self.assertEqual(1, estimate_memory_size.call_count)
+
     def test_dragging_to_create_and_change_interval_undo_redo_cycle(self):
         with TestContext.create_memory_context() as test_context:
             document_controller = test_context.create_document_controller()
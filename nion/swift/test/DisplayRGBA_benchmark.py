@@ -0,0 +1,86 @@
+"""Compare the fused display rgba kernel against the chain of display processors.
+
+Run with: python -m nion.swift.test.DisplayRGBA_benchmark [size]
+
+Reports the latency per frame and the peak memory allocated while producing the display rgba for a size x size
+float32 frame, for each of several adjustment configurations.
+"""
+
+# standard libraries
+import sys
+import time
+import tracemalloc
+import typing
+
+# third party libraries
+import numpy
+
+# local libraries
+from nion.data import Core
+from nion.data import DataAndMetadata
+from nion.swift.model import ColorMaps
+from nion.swift.model import DisplayItem
+from nion.swift.model import Persistence
+
+
+def chained_display_rgba(xdata: DataAndMetadata.DataAndMetadata, display_range: typing.Tuple[float, float],
+                         adjustments: typing.Sequence[Persistence.PersistentDictType],
+                         color_map_data: DisplayItem._ImageDataType) -> DisplayItem._ImageDataType:
+    # the normalize, adjust and color map steps as performed without the fused kernel.
+    adjusted_xdata = xdata
+    transformed_display_range = display_range
+    if adjustments:
+        normalized_data_processor = DisplayItem.NormalizedDataProcessor(display_data=xdata, display_range=display_range)
+        adjusted_data = normalized_data_processor.get_result("data").data
+        for adjustment_d in adjustments:
+            adjustment = DisplayItem.adjustment_factory(adjustment_d)
+            assert adjustment
+            adjusted_data = adjustment.transform(adjusted_data, display_range)
+        adjusted_xdata = DataAndMetadata.new_data_and_metadata(adjusted_data)
+        transformed_display_range = (0.0, 1.0)
+    display_rgba = Core.function_display_rgba(adjusted_xdata, transformed_display_range, color_map_data)
+    assert display_rgba
+    return display_rgba.data
+
+
+def fused_display_rgba(xdata: DataAndMetadata.DataAndMetadata, display_range: typing.Tuple[float, float],
+                       adjustments: typing.Sequence[Persistence.PersistentDictType],
+                       color_map_data: DisplayItem._ImageDataType) -> DisplayItem._ImageDataType:
+    transformed_display_range = (0.0, 1.0) if adjustments else display_range
+    lut = DisplayItem.get_display_rgba_lut(adjustments, display_range, transformed_display_range, color_map_data)
+    assert lut
+    return DisplayItem.calculate_display_rgba(xdata.data, lut)
+
+
+def measure(fn: typing.Callable[[], typing.Any], repeat: int) -> typing.Tuple[float, int]:
+    fn()  # warm up, including any table caches.
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    latency = (time.perf_counter() - start) / repeat
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return latency, peak
+
+
+def main(size: int = 4096, repeat: int = 5) -> None:
+    xdata = DataAndMetadata.new_data_and_metadata(numpy.random.RandomState(0).uniform(0.0, 1000.0, (size, size)).astype(numpy.float32))
+    display_range = (100.0, 900.0)
+    color_map_data = ColorMaps.get_color_map_data_by_id("magma")
+    configurations: typing.List[typing.Tuple[str, typing.List[Persistence.PersistentDictType]]] = [
+        ("none", list()),
+        ("gamma", [{"type": "gamma", "gamma": 0.7}]),
+        ("log", [{"type": "log"}]),
+    ]
+    print(f"{size} x {size} float32 frame; latency in ms, peak memory in MB")
+    print(f"{'adjustment':<12}{'chain ms':>10}{'fused ms':>10}{'chain MB':>10}{'fused MB':>10}")
+    for name, adjustments in configurations:
+        chain_latency, chain_peak = measure(lambda: chained_display_rgba(xdata, display_range, adjustments, color_map_data), repeat)
+        fused_latency, fused_peak = measure(lambda: fused_display_rgba(xdata, display_range, adjustments, color_map_data), repeat)
+        print(f"{name:<12}{chain_latency * 1000:>10.1f}{fused_latency * 1000:>10.1f}{chain_peak / 1E6:>10.1f}{fused_peak / 1E6:>10.1f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 4096)
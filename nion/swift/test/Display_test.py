@@ -4,6 +4,7 @@ import copy
 import math
 import typing
 import unittest
+import unittest.mock
 import uuid
 
 # third party libraries
@@ -11,6 +12,7 @@ import numpy
 
 # local libraries
 from nion.data import Calibration
+from nion.data import Core
 from nion.data import DataAndMetadata
 from nion.swift import Application
 from nion.swift import Facade
@@ -85,6 +87,61 @@ class TestDisplayClass(unittest.TestCase):
             display_data_channel.display_limits = (2.0, 3.0)
             self.assertEqual(display_data_channel.get_latest_computed_display_values().display_range, (2.0, 3.0))
 
+    def test_display_values_after_partial_update_match_full_display_values(self):
+        with TestContext.create_memory_context() as test_context:
+            document_model = test_context.create_document_model()
+            data = numpy.zeros((8, 8), float)
+            data[3, 3] = 9.0
+            data_item = DataItem.DataItem(data)
+            document_model.append_data_item(data_item)
+            display_item = document_model.get_display_item_for_data_item(data_item)
+            display_data_channel = display_item.display_data_channels[0]
+            display_data_channel.display_limits = (0.0, 4.0)
+            display_item.increment_display_ref_count()
+            try:
+                display_values = display_data_channel.get_latest_computed_display_values()
+                self.assertEqual((0.0, 9.0), display_values.data_range)
+                self.assertIsNotNone(display_values.display_rgba)
+                # overwrite the row holding the maximum so that the data range shrinks.
+                data_metadata = copy.deepcopy(data_item.data_metadata)
+                data_and_metadata = DataAndMetadata.new_data_and_metadata(numpy.full((2, 8), 2.0))
+                document_model.update_data_item_partial(data_item, data_metadata, data_and_metadata, [slice(0, 2), slice(None)], [slice(2, 4), slice(None)])
+                document_model.perform_data_item_updates()
+                display_values = display_data_channel.get_latest_computed_display_values()
+                self.assertEqual((slice(2, 4), slice(None)), display_values.dirty_region)
+                full_display_values = DisplayItem.DisplayValues(data_item.xdata, display_data_channel.sequence_index,
+                                                                display_data_channel.collection_index, None, None,
+                                                                display_data_channel.display_limits, None, None, 0.0, 1.0, list())
+                self.assertEqual(full_display_values.data_range, display_values.data_range)
+                self.assertEqual((0.0, 2.0), display_values.data_range)
+                self.assertTrue(numpy.array_equal(full_display_values.display_rgba, display_values.display_rgba))
+            finally:
+                display_item.decrement_display_ref_count()
+
+    def test_data_range_processor_tracks_row_statistics_only_for_partial_updates_of_2d_data(self):
+        data = numpy.arange(64, dtype=numpy.float32).reshape(8, 8)
+        xdata = DataAndMetadata.new_data_and_metadata(data)
+        processor = DisplayItem.DataRangeProcessor(data_metadata=xdata.data_metadata, display_data=xdata)
+        processor.execute()
+        self.assertEqual((0, 63), processor.get_cached_result("data_range"))
+        self.assertIsNone(processor.get_cached_result("row_statistics"))
+        processor = DisplayItem.DataRangeProcessor(data_metadata=xdata.data_metadata, display_data=xdata, dirty_region=(slice(2, 4), slice(None)))
+        processor.execute()
+        row_statistics = processor.get_cached_result("row_statistics")
+        self.assertEqual((8,), row_statistics.mins.shape)
+        data[3, :] = 100
+        processor = DisplayItem.DataRangeProcessor(data_metadata=xdata.data_metadata, display_data=xdata, previous_row_statistics=row_statistics, dirty_region=(slice(3, 4), slice(None)))
+        processor.execute()
+        self.assertEqual((0, 100), processor.get_cached_result("data_range"))
+        data_1d = numpy.arange(64, dtype=numpy.float32)
+        data_1d[5] = numpy.nan
+        xdata_1d = DataAndMetadata.new_data_and_metadata(data_1d)
+        processor = DisplayItem.DataRangeProcessor(data_metadata=xdata_1d.data_metadata, display_data=xdata_1d, dirty_region=(slice(0, 8),))
+        processor.execute()
+        self.assertEqual((0, 63), processor.get_cached_result("data_range"))
+        self.assertEqual(1, processor.get_cached_result("nan_count"))
+        self.assertIsNone(processor.get_cached_result("row_statistics"))
+
     def test_display_range_with_zero_display_limits_range_and_adjustment_succeeds(self):
         with TestContext.create_memory_context() as test_context:
             document_model = test_context.create_document_model()
@@ -172,6 +229,40 @@ class TestDisplayClass(unittest.TestCase):
             self.assertEqual(display_data_channel.get_latest_computed_display_values().display_range, (1, 1))
             self.assertEqual(display_data_channel.get_latest_computed_display_values().data_range, (1, 1))
 
+    def test_data_range_excludes_and_counts_non_finite_values(self):
+        with TestContext.create_memory_context() as test_context:
+            document_model = test_context.create_document_model()
+            data = numpy.arange(64, dtype=numpy.float32).reshape(8, 8)
+            data[2, 3] = numpy.nan
+            data[5, 1] = numpy.inf
+            data[5, 2] = -numpy.inf
+            data[6, :] = numpy.nan
+            data_item = DataItem.DataItem(data)
+            document_model.append_data_item(data_item)
+            display_item = document_model.get_display_item_for_data_item(data_item)
+            display_data_channel = display_item.display_data_channels[0]
+            display_values = display_data_channel.get_latest_computed_display_values()
+            self.assertEqual((0, 63), display_values.data_range)
+            self.assertEqual(9, display_values.data_nan_count)
+            self.assertEqual(2, display_values.data_inf_count)
+            display_item.data_item.set_data(numpy.full((8, 8), numpy.nan, dtype=numpy.float32))
+            display_values = display_data_channel.get_latest_computed_display_values()
+            self.assertEqual((0, 0), display_values.data_range)
+            self.assertEqual(64, display_values.data_nan_count)
+            self.assertEqual(0, display_values.data_inf_count)
+
+    def test_row_statistics_exclude_and_count_non_finite_values_per_row(self):
+        rows = numpy.array([[numpy.nan, numpy.inf, -numpy.inf, 1.0],
+                            [numpy.nan, numpy.nan, numpy.nan, numpy.nan],
+                            [numpy.inf, -numpy.inf, 2.0, 3.0],
+                            [1.0, 2.0, 3.0, 4.0],
+                            [numpy.nan, 5.0, numpy.nan, -5.0]])
+        row_statistics = DisplayItem.calculate_data_row_statistics(rows)
+        self.assertEqual([1.0, numpy.inf, 2.0, 1.0, -5.0], row_statistics.mins.tolist())
+        self.assertEqual([1.0, -numpy.inf, 3.0, 4.0, 5.0], row_statistics.maxs.tolist())
+        self.assertEqual([1, 4, 0, 0, 2], row_statistics.nan_counts.tolist())
+        self.assertEqual([2, 0, 2, 0, 0], row_statistics.inf_counts.tolist())
+
     def test_changing_data_notifies_data_and_display_range_change(self):
         with TestContext.create_memory_context() as test_context:
             document_model = test_context.create_document_model()
@@ -270,6 +361,53 @@ class TestDisplayClass(unittest.TestCase):
             display_data_channel.slice_center = 20
             self.assertEqual(display_data_channel.slice_center, 12)
 
+    def test_slice_sum_uses_cumulative_sum_cache_and_updates_when_data_changes(self):
+        with TestContext.create_memory_context() as test_context:
+            document_model = test_context.create_document_model()
+            data = numpy.random.RandomState(0).randint(0, 100, (4, 5, 32)).astype(numpy.uint16)
+            data_item = DataItem.new_data_item(DataAndMetadata.new_data_and_metadata(data, data_descriptor=DataAndMetadata.DataDescriptor(False, 2, 1)))
+            document_model.append_data_item(data_item)
+            display_item = document_model.get_display_item_for_data_item(data_item)
+            display_data_channel = display_item.display_data_channels[0]
+            display_data_channel.slice_center = 8
+            display_data_channel.slice_width = 4
+            element_data = display_data_channel.get_latest_computed_display_values().element_data_and_metadata
+            self.assertTrue(numpy.array_equal(numpy.sum(data[..., 6:10], -1), element_data.data))
+            # wait for the cumulative sum to be built in the background; subsequent slices are differences of it.
+            DisplayItem.SliceSumCache._executor.submit(lambda: None).result()
+            for slice_center, slice_width in ((20, 9), (31, 1), (16, 32)):
+                display_data_channel.slice_center = slice_center
+                display_data_channel.slice_width = slice_width
+                element_data = display_data_channel.get_latest_computed_display_values().element_data_and_metadata
+                expected = Core.function_slice_sum(DataAndMetadata.new_data_and_metadata(data), display_data_channel.slice_center, display_data_channel.slice_width)
+                self.assertEqual(expected.data_dtype, element_data.data_dtype)
+                self.assertEqual(expected.dimensional_calibrations, element_data.dimensional_calibrations)
+                self.assertTrue(numpy.array_equal(expected.data, element_data.data))
+            # changing the data invalidates the cumulative sum.
+            data_item.set_data(data * 2)
+            element_data = display_data_channel.get_latest_computed_display_values().element_data_and_metadata
+            self.assertTrue(numpy.array_equal(numpy.sum(data * 2, -1), element_data.data))
+
+    def test_slice_sum_cache_fits_eels_spectrum_image_within_max_bytes(self):
+        for dtype, expected_cumulative_sum_dtype in ((numpy.float32, numpy.float64), (numpy.uint16, numpy.int32), (numpy.uint32, numpy.uint64)):
+            cumulative_sum_dtype, stride = DisplayItem.SliceSumCache._get_cumulative_sum_layout((256, 256, 2048), dtype)
+            self.assertEqual(numpy.dtype(expected_cumulative_sum_dtype), numpy.dtype(cumulative_sum_dtype))
+            self.assertLessEqual(256 * 256 * (2048 // stride + 1) * numpy.dtype(cumulative_sum_dtype).itemsize, DisplayItem.SliceSumCache.max_bytes)
+
+    def test_slice_sum_with_strided_cumulative_sum_matches_direct_slice_sum(self):
+        data = numpy.random.RandomState(0).randint(0, 1000, (4, 5, 64)).astype(numpy.uint16)
+        slice_sum_cache = DisplayItem.SliceSumCache()
+        # scale the maximum size down so that the cumulative sum of this data is kept every 4 planes.
+        with unittest.mock.patch.object(DisplayItem.SliceSumCache, "max_bytes", 4 * 5 * 20 * 4):
+            self.assertEqual((numpy.int32, 4), DisplayItem.SliceSumCache._get_cumulative_sum_layout(data.shape, data.dtype))
+            self.assertIsNone(slice_sum_cache.get_slice_sum(data, 0, 8, 4))
+            DisplayItem.SliceSumCache._executor.submit(lambda: None).result()
+            for slice_center, slice_width in ((8, 4), (9, 1), (10, 3), (21, 13), (31, 62), (32, 64), (63, 1)):
+                expected = Core.function_slice_sum(DataAndMetadata.new_data_and_metadata(data), slice_center, slice_width)
+                slice_sum = slice_sum_cache.get_slice_sum(data, 0, slice_center, slice_width)
+                self.assertEqual(expected.data_dtype, slice_sum.dtype)
+                self.assertTrue(numpy.array_equal(expected.data, slice_sum))
+
     def test_data_item_setting_slice_validates_when_data_changes(self):
         with TestContext.create_memory_context() as test_context:
             document_controller = test_context.create_document_controller()
@@ -1744,6 +1744,51 @@ class TestDocumentModelClass(unittest.TestCase):
             self.assertIn(graphic, document_model.get_source_items(data_item2))
             self.assertIn(data_item, document_model.get_source_items(data_item2))
 
+    def test_filtered_xdata_keeps_data_type_and_updates_when_mask_changes(self):
+        Symbolic.register_computation_type("pass_thru", functools.partial(self.PassThru, "filtered_xdata"))
+        with TestContext.create_memory_context() as test_context:
+            document_model = test_context.create_document_model()
+            data_item = DataItem.DataItem(numpy.full((20, 20), 5, dtype=numpy.uint16))
+            data_item2 = DataItem.DataItem(numpy.zeros((2, 2)))
+            document_model.append_data_item(data_item)
+            document_model.append_data_item(data_item2)
+            graphic = Graphics.RectangleGraphic()
+            graphic.bounds = (0.0, 0.0), (0.5, 0.5)
+            graphic.role = "mask"
+            display_item = document_model.get_display_item_for_data_item(data_item)
+            display_item.add_graphic(graphic)
+            computation = document_model.create_computation()
+            computation.create_input_item("src", Symbolic.make_item(display_item.display_data_channel, type="filtered_xdata"))
+            computation.create_output_item("dst", Symbolic.make_item(data_item2))
+            computation.processing_id = "pass_thru"
+            document_model.append_computation(computation)
+            document_model.recompute_all()
+            self.assertEqual(numpy.uint16, data_item2.data.dtype)
+            self.assertEqual(5 * 10 * 10, numpy.sum(data_item2.data))
+            # changing the mask graphic must not return the previously cached mask
+            graphic.bounds = (0.0, 0.0), (0.5, 1.0)
+            data_source = Symbolic.DataSource(None, display_item.display_data_channel, None)
+            self.assertEqual(5 * 10 * 20, numpy.sum(data_source.filtered_xdata.data))
+
+    def test_computation_scheduler_delay_follows_execution_time_and_visibility(self):
+        visible_computation = Symbolic.Computation()
+        hidden_computation = Symbolic.Computation()
+        scheduler = DocumentModel.ComputationScheduler(lambda computation: computation == visible_computation)
+        # computations that have not run yet are not delayed
+        self.assertEqual(0.0, scheduler.get_delay(visible_computation))
+        self.assertEqual(0.0, scheduler.get_delay(hidden_computation))
+        scheduler.computation_evaluated(visible_computation, 0.2)
+        scheduler.computation_evaluated(hidden_computation, 0.2)
+        visible_delay = scheduler.get_delay(visible_computation)
+        hidden_delay = scheduler.get_delay(hidden_computation)
+        self.assertLess(visible_delay, hidden_delay)
+        self.assertLessEqual(hidden_delay, DocumentModel.ComputationScheduler.maximum_delay)
+        # fast computations are only delayed by the minimum delay
+        scheduler.computation_evaluated(visible_computation, 0.0)
+        self.assertLessEqual(scheduler.get_delay(visible_computation), DocumentModel.ComputationScheduler.minimum_delay)
+        visible_computation.close()
+        hidden_computation.close()
+
     def test_computation_sequence_evaluates(self):
         Symbolic.register_computation_type("pass_thru", functools.partial(self.PassThru, "xdata"))
         with TestContext.create_memory_context() as test_context:
@@ -1768,6 +1813,31 @@ class TestDocumentModelClass(unittest.TestCase):
             self.assertTrue(numpy.array_equal(data_item1.data, data_item2.data))
             self.assertTrue(numpy.array_equal(data_item1.data, data_item3.data))
 
+    def test_computation_depending_on_source_and_upstream_computation_evaluates_once_per_change(self):
+        with TestContext.create_memory_context() as test_context:
+            document_model = test_context.create_document_model()
+            data_item1 = DataItem.DataItem(numpy.zeros((2, 2)))
+            data_item2 = DataItem.DataItem(numpy.zeros((2, 2)))
+            data_item3 = DataItem.DataItem(numpy.zeros((2, 2)))
+            document_model.append_data_item(data_item1)
+            document_model.append_data_item(data_item2)
+            document_model.append_data_item(data_item3)
+            computation1 = document_model.create_computation("target.xdata = a.xdata + 1")
+            computation1.create_input_item("a", Symbolic.make_item(data_item1))
+            document_model.set_data_item_computation(data_item2, computation1)
+            computation2 = document_model.create_computation("target.xdata = a.xdata + b.xdata")
+            computation2.create_input_item("a", Symbolic.make_item(data_item1))
+            computation2.create_input_item("b", Symbolic.make_item(data_item2))
+            document_model.set_data_item_computation(data_item3, computation2)
+            document_model.recompute_all()
+            self.assertTrue(numpy.array_equal(numpy.full((2, 2), 1), data_item3.data))
+            evaluation_count = computation2._evaluation_count_for_test
+            data_item1.set_data(numpy.ones((2, 2)))
+            document_model.recompute_all()
+            # the dependent computation waits for the upstream computation and runs once, with current inputs.
+            self.assertEqual(1, computation2._evaluation_count_for_test - evaluation_count)
+            self.assertTrue(numpy.array_equal(numpy.full((2, 2), 3), data_item3.data))
+
     def test_computation_deletes_when_source_deletes(self):
         Symbolic.register_computation_type("pass_thru", functools.partial(self.PassThru, "xdata"))
         with TestContext.create_memory_context() as test_context:
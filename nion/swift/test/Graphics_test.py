@@ -84,6 +84,56 @@ class TestGraphicsClass(unittest.TestCase):
         self.assertIsNone(line_graphic.test(mapping, ui_settings, Geometry.FloatPoint(), move_only=False)[0])
         line_graphic.close()
 
+    def test_hit_test_index_candidates_include_every_graphic_hit(self):
+        mapping = self.__get_mapping()
+        ui_settings = DisplayPanel.FixedUISettings()
+        graphics = list()
+        rect_graphic = Graphics.RectangleGraphic()
+        rect_graphic.bounds = (0.2, 0.2), (0.1, 0.3)
+        rect_graphic.rotation = 0.7
+        graphics.append(rect_graphic)
+        ellipse_graphic = Graphics.EllipseGraphic()
+        ellipse_graphic.bounds = (0.6, 0.1), (0.2, 0.2)
+        graphics.append(ellipse_graphic)
+        line_graphic = Graphics.LineGraphic()
+        line_graphic.start = (0.9, 0.1)
+        line_graphic.end = (0.7, 0.6)
+        graphics.append(line_graphic)
+        for i in range(8):
+            point_graphic = Graphics.PointGraphic()
+            point_graphic.position = (0.1 * i + 0.05, 0.8)
+            graphics.append(point_graphic)
+        labeled_point_graphic = Graphics.PointGraphic()
+        labeled_point_graphic.position = (0.5, 0.5)
+        labeled_point_graphic.label = "label"
+        graphics.append(labeled_point_graphic)
+        spot_graphic = Graphics.SpotGraphic()
+        graphics.append(spot_graphic)
+        hit_test_index = Graphics.GraphicHitTestIndex()
+        hit_test_index.update(graphics)
+        margin = ui_settings.cursor_tolerance + Graphics.HIT_TEST_WIDGET_MARGIN
+        candidate_counts = list()
+        for y in range(0, 1000, 40):
+            for x in range(0, 1000, 40):
+                p = Geometry.FloatPoint(y=y, x=x)
+                p1 = mapping.map_point_widget_to_image_norm(p - Geometry.FloatSize(margin, margin))
+                p2 = mapping.map_point_widget_to_image_norm(p + Geometry.FloatSize(margin, margin))
+                candidate_indexes = hit_test_index.get_candidate_indexes(Geometry.FloatRect.from_tlbr(p1.y, p1.x, p2.y, p2.x))
+                candidate_counts.append(len(candidate_indexes))
+                for graphic_index, graphic in enumerate(graphics):
+                    if graphic.test(mapping, ui_settings, p, move_only=False)[0]:
+                        self.assertIn(graphic_index, candidate_indexes)
+        # the labeled and spot graphics are always candidates; most points have few other candidates.
+        self.assertEqual(2, min(candidate_counts))
+        self.assertLess(sum(candidate_counts) / len(candidate_counts), 4)
+        # moving a graphic updates its candidate cells.
+        graphics[3].position = (0.05, 0.05)
+        hit_test_index.update(graphics)
+        self.assertIn(3, hit_test_index.get_candidate_indexes(Geometry.FloatRect.from_tlbr(0.04, 0.04, 0.06, 0.06)))
+        self.assertNotIn(3, hit_test_index.get_candidate_indexes(Geometry.FloatRect.from_tlbr(0.04, 0.79, 0.06, 0.81)))
+        for graphic in graphics:
+            graphic.close()
+
     def test_line_dragging(self):
         with TestContext.create_memory_context() as test_context:
             document_controller = test_context.create_document_controller()
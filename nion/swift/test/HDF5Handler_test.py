@@ -92,3 +92,42 @@ class TestHDF5Handler(unittest.TestCase):
         finally:
             #logging.debug("rmtree %s", data_dir)
             shutil.rmtree(data_dir)
+
+    def test_hdf5_handler_appends_data_along_first_axis(self):
+        now = datetime.datetime.now()
+        current_working_directory = pathlib.Path.cwd()
+        data_dir = current_working_directory / "__Test"
+        if data_dir.exists():
+            shutil.rmtree(data_dir)
+        Cache.db_make_directory_if_needed(data_dir)
+        try:
+            h = HDF5Handler.HDF5Handler(os.path.join(data_dir, "abc.h5"))
+            with contextlib.closing(h):
+                p = {u"abc": 1, u"uuid": str(uuid.uuid4())}
+                data_descriptor = DataAndMetadata.DataDescriptor(True, 0, 2)
+                h.write_properties(p, now)
+                # existing data which is not resizable is converted on the first append
+                h.write_data(numpy.full((2, 4, 4), 1, dtype=numpy.float32), data_descriptor, now)
+                h.append_data(numpy.full((1, 4, 4), 2, dtype=numpy.float32), data_descriptor, now)
+                self.assertEqual(h.read_properties(), p)
+                d = h.read_data()
+                self.assertEqual((3, 4, 4), d.shape)
+                self.assertEqual([1, 1, 2], list(d[:, 0, 0]))
+                # later appends only write the appended data
+                write_count = h._write_count
+                h.append_data(numpy.full((2, 4, 4), 3, dtype=numpy.float32), data_descriptor, now)
+                self.assertEqual(write_count + 1, h._write_count)
+                d = h.read_data()
+                self.assertEqual((5, 4, 4), d.shape)
+                self.assertEqual([1, 1, 2, 3, 3], list(d[:, 0, 0]))
+                self.assertEqual(h.read_properties(), p)
+                # writing data with a different length along the first axis resizes the data
+                h.write_data(numpy.full((6, 4, 4), 4, dtype=numpy.float32), data_descriptor, now)
+                d = h.read_data()
+                self.assertEqual((6, 4, 4), d.shape)
+                self.assertIsNone(d.maxshape[0])
+                # data with a different shape cannot be appended
+                with self.assertRaises(ValueError):
+                    h.append_data(numpy.zeros((1, 5, 5), dtype=numpy.float32), data_descriptor, now)
+        finally:
+            shutil.rmtree(data_dir)
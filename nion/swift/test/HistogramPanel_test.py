@@ -1,13 +1,16 @@
 # standard libraries
 import contextlib
+import time
 import typing
 import unittest
+import weakref
 
 # third party libraries
 import numpy
 
 # local libraries
 from nion.data import Calibration
+from nion.data import DataAndMetadata
 from nion.swift import Application
 from nion.swift import HistogramPanel
 from nion.swift.model import DataItem
@@ -256,6 +259,26 @@ class TestHistogramPanelClass(unittest.TestCase):
             self.assertAlmostEqual(float(statistics_dict["min"]), numpy.amin(numpy.sum(data[..., 14:16], -1)))
             self.assertAlmostEqual(float(statistics_dict["max"]), numpy.amax(numpy.sum(data[..., 14:16], -1)))
 
+    def test_histogram_statistics_exclude_and_count_non_finite_values(self):
+        data = numpy.arange(16, dtype=numpy.float32).reshape(4, 4)
+        data[1, 1] = numpy.nan
+        data[2, 2] = numpy.inf
+        xdata = DataAndMetadata.new_data_and_metadata(data)
+        finite_data = data[numpy.isfinite(data)]
+        statistics_dict = HistogramPanel.calculate_statistics(xdata, (0, 15), None, Calibration.Calibration())
+        self.assertAlmostEqual(float(statistics_dict["mean"]), numpy.mean(finite_data), places=4)
+        self.assertAlmostEqual(float(statistics_dict["sum"]), numpy.sum(finite_data), places=2)
+        self.assertEqual("1", statistics_dict["nan"])
+        self.assertEqual("1", statistics_dict["inf"])
+        rect_region = Graphics.RectangleGraphic()
+        with contextlib.closing(rect_region):
+            statistics_dict = HistogramPanel.calculate_statistics(xdata, (0, 15), rect_region, Calibration.Calibration())
+            self.assertAlmostEqual(float(statistics_dict["min"]), 0)
+            self.assertAlmostEqual(float(statistics_dict["max"]), 15)
+        statistics_dict = HistogramPanel.calculate_statistics(DataAndMetadata.new_data_and_metadata(numpy.arange(16.0)), (0, 15), None, Calibration.Calibration())
+        self.assertNotIn("nan", statistics_dict)
+        self.assertNotIn("inf", statistics_dict)
+
     def test_histogram_processor(self):
         with TestContext.create_memory_context() as test_context:
             document_controller = test_context.create_document_controller()
@@ -285,6 +308,79 @@ class TestHistogramPanelClass(unittest.TestCase):
                         document_controller.periodic()
                 display_values = None
 
+    def test_region_data_of_ellipse_is_masked_pixels_only(self):
+        data = numpy.random.RandomState(0).uniform(0, 100, (64, 48))
+        xdata = DataAndMetadata.new_data_and_metadata(data, intensity_calibration=Calibration.Calibration(units="e"))
+        ellipse = Graphics.EllipseGraphic()
+        ellipse.bounds = (0.25, 0.2), (0.5, 0.4)
+        mask = ellipse.get_mask(data.shape) != 0
+        region_xdata = HistogramPanel.calculate_region_data(weakref.ref(xdata), weakref.ref(ellipse))
+        self.assertEqual((numpy.count_nonzero(mask),), region_xdata.data_shape)
+        self.assertTrue(numpy.array_equal(data[mask], region_xdata.data))
+        self.assertEqual("e", region_xdata.intensity_calibration.units)
+        statistics_dict = HistogramPanel.calculate_statistics(region_xdata, None, ellipse, Calibration.Calibration())
+        self.assertAlmostEqual(float(statistics_dict["mean"]), numpy.mean(data[mask]), places=4)
+        self.assertAlmostEqual(float(statistics_dict["sum"]), numpy.sum(data[mask]), places=0)
+        self.assertAlmostEqual(float(statistics_dict["min"]), numpy.amin(data[mask]), places=4)
+        # the mask is cached until the graphic changes
+        slices, cropped_mask = HistogramPanel.get_region_mask(ellipse, data.shape)
+        self.assertIs(cropped_mask, HistogramPanel.get_region_mask(ellipse, data.shape)[1])
+        self.assertEqual(cropped_mask.shape, data[slices].shape)
+        self.assertFalse(cropped_mask.flags.writeable)
+        ellipse.bounds = (0.5, 0.5), (0.25, 0.25)
+        self.assertIsNot(cropped_mask, HistogramPanel.get_region_mask(ellipse, data.shape)[1])
+        region_xdata = HistogramPanel.calculate_region_data(weakref.ref(xdata), weakref.ref(ellipse))
+        self.assertTrue(numpy.array_equal(data[ellipse.get_mask(data.shape) != 0], region_xdata.data))
+        ellipse.close()
+
+    def test_region_data_of_unrotated_rectangle_is_cropped(self):
+        data = numpy.random.RandomState(0).uniform(0, 100, (64, 48))
+        xdata = DataAndMetadata.new_data_and_metadata(data)
+        rectangle = Graphics.RectangleGraphic()
+        rectangle.bounds = (0.25, 0.25), (0.5, 0.5)
+        region_xdata = HistogramPanel.calculate_region_data(weakref.ref(xdata), weakref.ref(rectangle))
+        self.assertEqual((32, 24), region_xdata.data_shape)
+        rectangle.rotation = 0.5
+        region_xdata = HistogramPanel.calculate_region_data(weakref.ref(xdata), weakref.ref(rectangle))
+        self.assertEqual(1, len(region_xdata.data_shape))
+        rectangle.close()
+
+    def test_histogram_processor_refines_subsampled_histogram_of_latest_frame(self):
+        with TestContext.create_memory_context() as test_context:
+            document_controller = test_context.create_document_controller()
+            histogram_processor = HistogramPanel.HistogramProcessor(document_controller.event_loop)
+            with contextlib.closing(histogram_processor):
+                frames = [DataAndMetadata.new_data_and_metadata(numpy.random.RandomState(i).uniform(0, 10 * (i + 1), (1024, 1024))) for i in range(3)]
+                histogram_processor.display_range = (0.0, 30.0)
+                histogram_processor.display_data_range = (0.0, 30.0)
+                histogram_processor.displayed_intensity_calibration = Calibration.Calibration()
+                histogram_widget_datas = list()
+                def property_changed(key: str) -> None:
+                    if key == "histogram_widget_data":
+                        histogram_widget_datas.append(histogram_processor.histogram_widget_data)
+                with contextlib.closing(histogram_processor.property_changed_event.listen(property_changed)):
+                    # new frames arriving while the previous ones are processed make the previous results stale.
+                    for frame in frames:
+                        histogram_processor.display_data_and_metadata = frame
+                    expected_histogram_widget_data = HistogramPanel.calculate_histogram_widget_data(frames[-1], (0.0, 30.0))
+                    expected_statistics = HistogramPanel.calculate_statistics(frames[-1], (0.0, 30.0), None, Calibration.Calibration())
+                    # the results are stored before their change notifications are delivered via the event loop, so
+                    # also wait for the notification of the final histogram.
+                    start = time.time()
+                    while (histogram_processor.histogram_widget_data != expected_histogram_widget_data or
+                           histogram_processor.statistics != expected_statistics or
+                           expected_histogram_widget_data not in histogram_widget_datas):
+                        document_controller.periodic()
+                        self.assertLess(time.time() - start, 10.0)
+                    self.assertIn(expected_histogram_widget_data, histogram_widget_datas)
+
+    def test_subsampled_histogram_approximates_exact_histogram(self):
+        xdata = DataAndMetadata.new_data_and_metadata(numpy.random.RandomState(0).normal(50, 10, (2048, 2048)))
+        exact_histogram_widget_data = HistogramPanel.calculate_histogram_widget_data(xdata, (0.0, 100.0))
+        subsampled_histogram_widget_data = HistogramPanel.calculate_histogram_widget_data(xdata, (0.0, 100.0), HistogramPanel.HistogramProcessor.subsample_size)
+        self.assertEqual(exact_histogram_widget_data.data.shape, subsampled_histogram_widget_data.data.shape)
+        self.assertLess(numpy.amax(numpy.abs(exact_histogram_widget_data.data - subsampled_histogram_widget_data.data)), 0.1)
+
 
 if __name__ == '__main__':
     unittest.main()
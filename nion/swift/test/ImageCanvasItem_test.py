@@ -292,6 +292,38 @@ class TestImageCanvasItemClass(unittest.TestCase):
             drawing_context = DrawingContext.DrawingContext()
             display_panel.root_container.repaint_immediate(drawing_context, display_panel.root_container.canvas_size)
 
+    def test_repaint_after_changing_one_graphic_only_draws_changed_graphic(self):
+        with TestContext.create_memory_context() as test_context:
+            document_controller = test_context.create_document_controller()
+            document_model = document_controller.document_model
+            display_panel = document_controller.selected_display_panel
+            data_item = DataItem.DataItem(numpy.zeros((10, 10)))
+            document_model.append_data_item(data_item)
+            display_item = document_model.get_display_item_for_data_item(data_item)
+            display_panel.set_display_panel_display_item(display_item)
+            header_height = display_panel.header_canvas_item.header_height
+            display_panel.root_container.layout_immediate((1000 + header_height, 1000))
+            for i in range(20):
+                point_graphic = Graphics.PointGraphic()
+                point_graphic.position = (0.04 * i + 0.1, 0.5)
+                display_item.add_graphic(point_graphic)
+            graphic_drawing_cache = display_panel.display_canvas_item._graphics_canvas_item.graphic_drawing_cache
+            drawing_context = DrawingContext.DrawingContext()
+            display_panel.root_container.repaint_immediate(drawing_context, display_panel.root_container.canvas_size)
+            self.assertEqual(20, graphic_drawing_cache.draw_count)
+            full_drawing_commands = bytes(drawing_context.binary_commands)
+            # changing one graphic draws only that graphic again
+            display_item.graphics[5].position = (0.3, 0.3)
+            drawing_context = DrawingContext.DrawingContext()
+            display_panel.root_container.repaint_immediate(drawing_context, display_panel.root_container.canvas_size)
+            self.assertEqual(21, graphic_drawing_cache.draw_count)
+            # changing it back produces the same drawing commands as before
+            display_item.graphics[5].position = (0.3, 0.5)
+            drawing_context = DrawingContext.DrawingContext()
+            display_panel.root_container.repaint_immediate(drawing_context, display_panel.root_container.canvas_size)
+            self.assertEqual(22, graphic_drawing_cache.draw_count)
+            self.assertEqual(full_drawing_commands, bytes(drawing_context.binary_commands))
+
     def test_hand_tool_on_one_image_of_multiple_displays(self):
         # setup
         with TestContext.create_memory_context() as test_context:
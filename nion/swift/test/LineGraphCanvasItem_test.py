@@ -564,6 +564,32 @@ class TestLineGraphCanvasItem(unittest.TestCase):
         self.assertEqual(("10", "-3"), e.used_labels("1e-03"))
         self.assertEqual(("10", "3"), e.used_labels("1e+03"))
 
+    def test_min_max_index_range_matches_numpy_for_random_windows(self):
+        rng = numpy.random.default_rng(0)
+        for data in (rng.standard_normal((5000,)), rng.integers(-1000, 1000, (3, 3000)).astype(numpy.int32)):
+            min_max_index = LineGraphCanvasItem.MinMaxIndex(data, block_size=64)
+            self.assertEqual(data.shape[-1], min_max_index.length)
+            for left, right in [(0, data.shape[-1]), (10, 11), (63, 65), (100, 2000)] + [tuple(sorted(rng.integers(0, data.shape[-1], 2))) for _ in range(50)]:
+                if left < right:
+                    self.assertEqual((numpy.amin(data[..., left:right]), numpy.amax(data[..., left:right])), min_max_index.get_range(left, right))
+            self.assertIsNone(min_max_index.get_range(20, 20))
+
+    def test_calculate_y_axis_limits_range_to_calibrated_x_range(self):
+        data = numpy.zeros((1000,))
+        data[100] = 50
+        data[900] = -40
+        data[500] = 5
+        xdata = DataAndMetadata.new_data_and_metadata(data, dimensional_calibrations=[Calibration.Calibration(scale=0.1)])
+        min_max_index = LineGraphCanvasItem.MinMaxIndex(data)
+        full_min, full_max, _ = LineGraphCanvasItem.calculate_y_axis([xdata], None, None, None)
+        self.assertLessEqual(full_min, -40)
+        self.assertGreaterEqual(full_max, 50)
+        for min_max_indexes in (None, [min_max_index]):
+            visible_min, visible_max, _ = LineGraphCanvasItem.calculate_y_axis([xdata], None, None, None, calibrated_x_range=(20.0, 80.0), min_max_indexes=min_max_indexes)
+            self.assertGreater(visible_min, -40)
+            self.assertLess(visible_max, 50)
+            self.assertGreaterEqual(visible_max, 5)
+
     # test rgb 1d data in line plot.
     def test_line_plot_handles_rgb_1d(self):
         with TestContext.create_memory_context() as test_context:
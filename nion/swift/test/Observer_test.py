@@ -9,6 +9,7 @@ import unittest
 
 # local libraries
 from nion.swift.model import Observer
+from nion.utils import Observable
 from nion.utils import StructuredModel
 
 
@@ -198,6 +199,59 @@ class TestObserver(unittest.TestCase):
             del model.a[2]
             self.assertEqual(["b-a", "c"], o.items)  # b-a, a-b, c
 
+    def test_observer_item_sequence_filter_passes_mutations_along_without_remove_and_insert(self):
+        # configure the model
+        record_schema = StructuredModel.define_record("V", [StructuredModel.define_field("v", StructuredModel.INT)])
+        array_field = StructuredModel.define_array(record_schema)
+        schema = StructuredModel.define_record("R", [StructuredModel.define_field("a", array_field)])
+        model = StructuredModel.build_model(schema, value={"a": [{"v": 1}, {"v": -1}, {"v": 2}]})
+        # build the observer
+        oo = Observer.ObserverBuilder()
+        oo.source(model).ordered_sequence_from_array("a").map(oo.x.prop("v")).filter(lambda x: x > 0)
+        with contextlib.closing(typing.cast(Observer.AbstractItemSequenceSource, oo.make_observable())) as o:
+            events = list()
+            inserted_listener = o.item_inserted_event.listen(lambda item, index: events.append(("insert", item, index)))
+            removed_listener = o.item_removed_event.listen(lambda item, index: events.append(("remove", item, index)))
+            mutated_listener = o.item_mutated_event.listen(lambda item, index: events.append(("mutate", item, index)))
+            self.assertEqual([1, 2], o.items)
+            model.a[2].v = 3
+            self.assertEqual([("mutate", 3, 1)], events)
+            self.assertEqual([1, 3], o.items)
+            events.clear()
+            model.a[0].v = -2
+            self.assertEqual([("remove", 1, 0)], events)
+            self.assertEqual([3], o.items)
+            events.clear()
+            model.a[1].v = 4
+            self.assertEqual([("insert", 4, 0)], events)
+            self.assertEqual([4, 3], o.items)
+            events.clear()
+            model.a[0].v = -3
+            self.assertEqual(list(), events)
+            self.assertEqual([4, 3], o.items)
+
+    def test_observer_item_sequence_trampoline_replaces_mutated_items(self):
+        # configure the model
+        record_schema = StructuredModel.define_record("V", [StructuredModel.define_field("v", StructuredModel.STRING)])
+        array_field = StructuredModel.define_array(record_schema)
+        schema = StructuredModel.define_record("R", [StructuredModel.define_field("a", array_field)])
+        model = StructuredModel.build_model(schema, value={"a": [{"v": "a"}, {"v": None}, {"v": "c"}]})
+        target = Observable.Observable()
+        target_items = list()
+        inserted_listener = target.item_inserted_event.listen(lambda key, item, index: target_items.insert(index, item))
+        removed_listener = target.item_removed_event.listen(lambda key, item, index: target_items.pop(index))
+        # build the observer
+        oo = Observer.ObserverBuilder()
+        oo.source(model).ordered_sequence_from_array("a").map(oo.x.prop("v")).filter(lambda x: x is not None).trampoline(target, "items")
+        with contextlib.closing(oo.make_observable()):
+            self.assertEqual(["a", "c"], target_items)
+            model.a[1].v = "b"
+            self.assertEqual(["a", "b", "c"], target_items)
+            model.a[2].v = "d"
+            self.assertEqual(["a", "b", "d"], target_items)
+            model.a[0].v = None
+            self.assertEqual(["b", "d"], target_items)
+
     def test_observer_item_sequence_collect(self):
         # configure the model
         array_field = StructuredModel.define_array(StructuredModel.STRING)
@@ -4,10 +4,13 @@ import contextlib
 import copy
 import functools
 import logging
+import typing
 import unittest
+import unittest.mock
 
 # third party libraries
 import numpy
+import scipy.signal.windows
 
 # local libraries
 from nion.data import Calibration
@@ -15,6 +18,8 @@ from nion.data import DataAndMetadata
 from nion.swift import Facade
 from nion.swift.model import DataItem
 from nion.swift.model import Graphics
+from nion.swift.model import Processing
+from nion.swift.model import Utility
 from nion.swift.test import TestContext
 from nion.utils import Geometry
 
@@ -1150,6 +1155,40 @@ class TestProcessingClass(unittest.TestCase):
                     self.assertEqual(element_xdata.data_shape, document_model.data_items[-1].data_shape)
                     self.assertFalse(document_model.computations[-1].error_text)
 
+    def test_window_data_is_cached_by_shape_and_computed_in_source_precision(self):
+        window_f32 = Processing.get_window_data("hann", (10, 12), numpy.float32)
+        self.assertIs(window_f32, Processing.get_window_data("hann", (10, 12), numpy.float32))
+        self.assertEqual(numpy.float32, window_f32.dtype)
+        self.assertFalse(window_f32.flags.writeable)
+        window_f64 = Processing.get_window_data("hann", (10, 12), numpy.int32)
+        self.assertEqual(numpy.float64, window_f64.dtype)
+        self.assertTrue(numpy.allclose(numpy.outer(scipy.signal.windows.hann(10), scipy.signal.windows.hann(12)), window_f64))
+        self.assertIsNot(Processing.get_window_data("gaussian", (10, 12), numpy.float32, sigma=1.0), Processing.get_window_data("gaussian", (10, 12), numpy.float32, sigma=2.0))
+        with TestContext.create_memory_context() as test_context:
+            document_model = test_context.create_document_model()
+            data_item = DataItem.DataItem(numpy.ones((10, 12), numpy.float32))
+            document_model.append_data_item(data_item)
+            display_item = document_model.get_display_item_for_data_item(data_item)
+            document_model.get_processing_new("hann_window", display_item, data_item)
+            document_model.recompute_all()
+            self.assertEqual(numpy.float32, document_model.data_items[-1].data_dtype)
+            self.assertTrue(numpy.allclose(window_f64, document_model.data_items[-1].data))
+
+    def test_window_data_cache_stays_under_its_byte_budget(self):
+        max_bytes = 4 * 256 * 256 * 8
+        window_cache = Utility.LRUCache[typing.Any, typing.Any](max_count=8, max_bytes=max_bytes)
+        with unittest.mock.patch.object(Processing, "_window_cache", window_cache):
+            for size in (256, 257, 258, 259, 260, 261, 262, 263):
+                window = Processing.get_window_data("hann", (size, size), numpy.float64)
+                self.assertLessEqual(window_cache.nbytes, max_bytes)
+            # the most recent window is cached; the oldest ones were released.
+            self.assertIs(window, Processing.get_window_data("hann", (263, 263), numpy.float64))
+            self.assertGreater(window_cache.nbytes, 0)
+            # a window larger than the budget is returned but not cached.
+            nbytes = window_cache.nbytes
+            self.assertEqual((1024, 1024), Processing.get_window_data("hann", (1024, 1024), numpy.float64).shape)
+            self.assertEqual(nbytes, window_cache.nbytes)
+
     def test_scalar_processing_function_against_collections(self):
         with TestContext.create_memory_context() as test_context:
             data_and_metadata_list = [
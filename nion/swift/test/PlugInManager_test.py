@@ -0,0 +1,84 @@
+# standard libraries
+import json
+import logging
+import pathlib
+import sys
+import tempfile
+import unittest
+
+# local libraries
+from nion.swift.model import PlugInManager
+from nion.swift.model import Symbolic
+
+
+class TestPlugInManagerClass(unittest.TestCase):
+
+    def setUp(self):
+        self.__temporary_directory = tempfile.TemporaryDirectory()
+        self.__plug_ins_path = pathlib.Path(self.__temporary_directory.name)
+        sys.path.append(str(self.__plug_ins_path))
+        self.__module_names = list()
+
+    def tearDown(self):
+        PlugInManager.unload_plug_ins()
+        for module_name in self.__module_names:
+            sys.modules.pop(module_name, None)
+        sys.path.remove(str(self.__plug_ins_path))
+        self.__temporary_directory.cleanup()
+
+    def __make_plug_in(self, module_name: str, manifest: dict, source: str) -> PlugInManager.PlugInAdapter:
+        plug_in_path = self.__plug_ins_path / module_name
+        plug_in_path.mkdir()
+        (plug_in_path / "__init__.py").write_text(source)
+        (plug_in_path / "manifest.json").write_text(json.dumps(manifest))
+        self.__module_names.append(module_name)
+        return PlugInManager.PlugInAdapter(str(self.__plug_ins_path), module_name)
+
+    def test_plug_in_declaring_contributions_is_loaded_on_first_use(self):
+        eager_adapter = self.__make_plug_in("eager_test_plug_in", {"name": "Eager", "identifier": "eager_test_plug_in", "version": "1.0.0"}, "")
+        deferred_source = "\n".join([
+            "from nion.swift.model import Symbolic",
+            "run_count = 0",
+            "def run():",
+            "    global run_count",
+            "    run_count += 1",
+            "Symbolic.register_computation_type('deferred_test_processing', lambda computation: None)",
+        ])
+        deferred_manifest = {"name": "Deferred", "identifier": "deferred_test_plug_in", "version": "1.0.0", "contributes": {"processing": ["deferred_test_processing"]}}
+        deferred_adapter = self.__make_plug_in("deferred_test_plug_in", deferred_manifest, deferred_source)
+        logging.disable(logging.CRITICAL)
+        try:
+            PlugInManager._load_plug_in_adapters([eager_adapter, deferred_adapter])
+        finally:
+            logging.disable(logging.NOTSET)
+        self.assertIn("eager_test_plug_in", sys.modules)
+        self.assertNotIn("deferred_test_plug_in", sys.modules)
+        self.assertEqual(["deferred_test_processing"], [c["id"] for c in PlugInManager.get_deferred_contributions("processing")])
+        load_infos = {load_info.module_name: load_info for load_info in PlugInManager.get_load_report()}
+        self.assertEqual("loaded", load_infos["eager_test_plug_in"].status)
+        self.assertEqual("deferred", load_infos["deferred_test_plug_in"].status)
+        # an unrelated lookup does not load it
+        self.assertIsNone(Symbolic.get_computation_type("unknown_test_processing"))
+        self.assertNotIn("deferred_test_plug_in", sys.modules)
+        # the first use of its contribution does, once
+        self.assertIsNotNone(Symbolic.get_computation_type("deferred_test_processing"))
+        self.assertIsNotNone(Symbolic.get_computation_type("deferred_test_processing"))
+        self.assertEqual(1, sys.modules["deferred_test_plug_in"].run_count)
+        self.assertEqual(list(), PlugInManager.get_deferred_contributions("processing"))
+        self.assertEqual("loaded", load_infos["deferred_test_plug_in"].status)
+        self.assertGreater(load_infos["deferred_test_plug_in"].import_ms, 0.0)
+
+    def test_plug_in_with_invalid_contributions_is_not_loaded(self):
+        adapter = self.__make_plug_in("invalid_test_plug_in", {"name": "Invalid", "identifier": "invalid_test_plug_in", "version": "1.0.0", "contributes": {"unknown": ["x"]}}, "")
+        logging.disable(logging.CRITICAL)
+        try:
+            PlugInManager._load_plug_in_adapters([adapter])
+        finally:
+            logging.disable(logging.NOTSET)
+        self.assertNotIn("invalid_test_plug_in", sys.modules)
+        self.assertEqual(list(), PlugInManager.get_deferred_contributions("unknown"))
+
+
+if __name__ == '__main__':
+    logging.getLogger().setLevel(logging.DEBUG)
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Compare per frame window + FFT latency with and without the cached window data.
+
+Run with: python -m nion.swift.test.ProcessingWindow_benchmark [size]
+
+Reports the latency per frame of applying a window to a size x size float32 frame followed by an FFT, computing the
+window for every frame (the previous behavior) and using the cached window data, for each window kind.
+"""
+
+# standard libraries
+import sys
+import time
+import typing
+
+# third party libraries
+import numpy
+import scipy.signal.windows
+
+# local libraries
+from nion.data import DataAndMetadata
+from nion.data import xdata_1_0 as xd
+from nion.swift.model import Processing
+
+
+def uncached_window(kind: str, xdata: DataAndMetadata.DataAndMetadata) -> DataAndMetadata.DataAndMetadata:
+    # the window as computed for each frame without the cache.
+    h, w = xdata.datum_dimension_shape
+    if kind == "gaussian":
+        y, x = numpy.meshgrid(numpy.linspace(-h / 2, h / 2, h), numpy.linspace(-w / 2, w / 2, w), indexing='ij')
+        s = 1 / min(w, h)
+        r = numpy.sqrt(y * y + x * x) * s
+        return xdata * numpy.exp(-0.5 * r * r)
+    window_fn = scipy.signal.windows.hamming if kind == "hamming" else scipy.signal.windows.hann
+    w0 = numpy.reshape(window_fn(w), (1, w))
+    w1 = numpy.reshape(window_fn(h), (h, 1))
+    return xdata * w0 * w1
+
+
+def cached_window(kind: str, xdata: DataAndMetadata.DataAndMetadata) -> DataAndMetadata.DataAndMetadata:
+    params = {"sigma": 1.0} if kind == "gaussian" else dict()
+    return xdata * Processing.get_window_data(kind, xdata.datum_dimension_shape, xdata.data_dtype, **params)
+
+
+def measure(fn: typing.Callable[[], typing.Any], repeat: int) -> float:
+    fn()  # warm up, including the window cache.
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(size: int = 2048, repeat: int = 10) -> None:
+    xdata = DataAndMetadata.new_data_and_metadata(numpy.random.RandomState(0).uniform(0.0, 1000.0, (size, size)).astype(numpy.float32))
+    print(f"{size} x {size} float32 frame; latency in ms")
+    print(f"{'window':<12}{'uncached ms':>14}{'cached ms':>14}{'fft only ms':>14}")
+    fft_latency = measure(lambda: xd.fft(xdata), repeat)
+    for kind in ("gaussian", "hamming", "hann"):
+        uncached_latency = measure(lambda: xd.fft(uncached_window(kind, xdata)), repeat)
+        cached_latency = measure(lambda: xd.fft(cached_window(kind, xdata)), repeat)
+        print(f"{kind:<12}{uncached_latency * 1000:>14.1f}{cached_latency * 1000:>14.1f}{fft_latency * 1000:>14.1f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2048)
@@ -47,6 +47,32 @@ class TestRecorderPanelClass(unittest.TestCase):
             self.assertTrue(recorded_data_item.is_sequence)
             self.assertEqual((4, 8, 8), recorded_data_item.dimensional_shape)
 
+    def test_recorder_writes_each_frame_into_reserved_sequence_and_trims_when_stopped_early(self):
+        with TestContext.create_memory_context() as test_context:
+            document_controller = test_context.create_document_controller()
+            document_model = document_controller.document_model
+            data_item = DataItem.DataItem(numpy.ones((8, 8)))
+            document_model.append_data_item(data_item)
+            recorder = RecorderPanel.Recorder(document_controller, data_item)
+            with contextlib.closing(recorder):
+                with document_model.data_item_live(data_item):
+                    count = 4
+                    recorder.start_recording(10, 1, count)
+                    for i in range(2):
+                        recorder.continue_recording(10 + i + 0.25)
+                        recorded_data_item = document_model.data_items[1]
+                        # the sequence is reserved for all frames and each frame is a partial update
+                        self.assertEqual((4, 8, 8), recorded_data_item.dimensional_shape)
+                        self.assertEqual(i, recorded_data_item.data_changed_region[0].start)
+                        data_item.set_data(data_item.data + 1)
+                    recorder.stop_recording()
+            recorded_data_item = document_model.data_items[1]
+            self.assertEqual((2, 8, 8), recorded_data_item.dimensional_shape)
+            self.assertTrue(recorded_data_item.is_sequence)
+            self.assertEqual("s", recorded_data_item.dimensional_calibrations[0].units)
+            self.assertTrue(numpy.array_equal(numpy.ones((8, 8)), recorded_data_item.data[0]))
+            self.assertTrue(numpy.array_equal(numpy.full((8, 8), 2), recorded_data_item.data[1]))
+
     def test_recorder_puts_recorded_data_item_under_transaction(self):
         with TestContext.create_memory_context() as test_context:
             document_controller = test_context.create_document_controller()
@@ -839,6 +839,67 @@ class TestStorageClass(unittest.TestCase):
                 self.assertEqual(1, len(document_model.data_items))
                 self.assertEqual(data_item_uuid, document_model.data_items[0].uuid)
 
+    def test_delete_and_undelete_from_file_storage_system_uses_trash_entries(self):
+        with create_temp_profile_context() as profile_context:
+            document_model = profile_context.create_document_model(auto_close=False)
+            with document_model.ref():
+                data_item_uuids = list()
+                for i in range(3):
+                    data_item = DataItem.DataItem(numpy.full((16, 16), i))
+                    document_model.append_data_item(data_item)
+                    data_item_uuids.append(data_item.uuid)
+                for data_item in list(document_model.data_items):
+                    document_model.remove_data_item(data_item, safe=True)
+                project_storage_system = document_model._project.project_storage_system
+                trash_entry_paths = {str(data_item_uuid): project_storage_system._trash_dir / (str(data_item_uuid) + ".trash.json") for data_item_uuid in data_item_uuids}
+                self.assertEqual(set(trash_entry_paths.values()), set(project_storage_system._trash_dir.glob("*.trash.json")))
+                with open(trash_entry_paths[str(data_item_uuids[1])]) as fp:
+                    trash_entry = json.load(fp)
+                self.assertEqual(str(data_item_uuids[1]), trash_entry["properties"]["uuid"])
+                # restoring from the entry must not read the other files in the trash or change their entries.
+                for file_path in project_storage_system._trash_dir.glob("*.ndata"):
+                    if file_path.name != trash_entry["file_name"]:
+                        file_path.write_bytes(b"")
+                trash_entry_mtime = trash_entry_paths[str(data_item_uuids[0])].stat().st_mtime_ns
+                document_model.restore_data_item(data_item_uuids[1])
+                self.assertEqual(1, len(document_model.data_items))
+                self.assertEqual(data_item_uuids[1], document_model.data_items[0].uuid)
+                self.assertEqual(1, document_model.data_items[0].data[0, 0])
+                self.assertFalse(trash_entry_paths[str(data_item_uuids[1])].exists())
+                self.assertEqual(trash_entry_mtime, trash_entry_paths[str(data_item_uuids[0])].stat().st_mtime_ns)
+
+    def test_prune_file_storage_system_retains_trash_items_younger_than_max_age(self):
+        with create_temp_profile_context() as profile_context:
+            document_model = profile_context.create_document_model(auto_close=False)
+            with document_model.ref():
+                data_item_uuids = list()
+                for i in range(2):
+                    data_item = DataItem.DataItem(numpy.full((16, 16), i))
+                    document_model.append_data_item(data_item)
+                    data_item_uuids.append(data_item.uuid)
+                for data_item in list(document_model.data_items):
+                    document_model.remove_data_item(data_item, safe=True)
+                project_storage_system = document_model._project.project_storage_system
+                # age the trash entry of the second item beyond the maximum age.
+                old_trash_entry_path = project_storage_system._trash_dir / (str(data_item_uuids[1]) + ".trash.json")
+                old_trash_entry = json.loads(old_trash_entry_path.read_text())
+                old_trash_entry["trashed"] = (datetime.datetime.fromisoformat(old_trash_entry["trashed"]) - datetime.timedelta(days=2)).isoformat()
+                old_trash_entry_path.write_text(json.dumps(old_trash_entry))
+                (project_storage_system._trash_dir / "unindexed.ndata").write_bytes(b"")
+                project_storage_system._trash_max_age = datetime.timedelta(days=1)
+                project_storage_system.prune()
+                self.assertFalse((project_storage_system._trash_dir / "unindexed.ndata").exists())
+                self.assertFalse(old_trash_entry_path.exists())
+                self.assertFalse((project_storage_system._trash_dir / old_trash_entry["file_name"]).exists())
+                self.assertTrue((project_storage_system._trash_dir / (str(data_item_uuids[0]) + ".trash.json")).exists())
+                self.assertEqual(2, len(list(project_storage_system._trash_dir.rglob("*"))))
+                document_model.restore_data_item(data_item_uuids[0])
+                self.assertEqual(1, len(document_model.data_items))
+                document_model.remove_data_item(document_model.data_items[0], safe=True)
+                project_storage_system._trash_max_age = datetime.timedelta()
+                project_storage_system.prune()
+                self.assertEqual(0, len(list(project_storage_system._trash_dir.rglob("*"))))
+
     def test_deleted_file_removed_from_file_storage_system_restores_data_item_after_reload(self):
         # is established for restoring items in the trash.
         with create_temp_profile_context() as profile_context:
@@ -1025,6 +1086,32 @@ class TestStorageClass(unittest.TestCase):
                 data_item = document_model.data_items[0]
                 self.assertTrue(numpy.array_equal(zeros.data, data_item.data))
 
+    def test_data_item_append_data_grows_stored_data(self):
+        for large_format in (True, False):
+            with self.subTest(large_format=large_format):
+                with create_temp_profile_context() as profile_context:
+                    document_model = profile_context.create_document_model(auto_close=False)
+                    with document_model.ref():
+                        data_item = DataItem.DataItem(large_format=large_format)
+                        document_model.append_data_item(data_item)
+                        data_descriptor = DataAndMetadata.DataDescriptor(True, 0, 2)
+                        dimensional_calibrations = [Calibration.Calibration(units="s"), Calibration.Calibration(), Calibration.Calibration()]
+                        data_item.set_xdata(DataAndMetadata.new_data_and_metadata(numpy.full((2, 8, 8), 1, numpy.float32), dimensional_calibrations=dimensional_calibrations, data_descriptor=data_descriptor))
+                        document_model.append_data_item_data(data_item, DataAndMetadata.new_data_and_metadata(numpy.full((1, 8, 8), 2, numpy.float32)))
+                        document_model.append_data_item_data(data_item, DataAndMetadata.new_data_and_metadata(numpy.full((2, 8, 8), 3, numpy.float32)))
+                        self.assertEqual((5, 8, 8), data_item.data_shape)
+                        self.assertEqual([1, 1, 2, 3, 3], list(data_item.data[:, 0, 0]))
+                        self.assertEqual("s", data_item.dimensional_calibrations[0].units)
+                        with self.assertRaises(ValueError):
+                            data_item.append_data(DataAndMetadata.new_data_and_metadata(numpy.zeros((1, 4, 4), numpy.float32)))
+                    document_model = profile_context.create_document_model(auto_close=False)
+                    with document_model.ref():
+                        data_item = document_model.data_items[0]
+                        self.assertEqual((5, 8, 8), data_item.data_shape)
+                        self.assertTrue(data_item.is_sequence)
+                        self.assertEqual("s", data_item.dimensional_calibrations[0].units)
+                        self.assertEqual([1, 1, 2, 3, 3], list(data_item.data[:, 0, 0]))
+
     def test_line_plot_display_calculation_with_large_format_after_reload(self):
         with create_temp_profile_context() as profile_context:
             document_controller = profile_context.create_document_controller(auto_close=False)
@@ -4527,6 +4614,44 @@ class TestStorageClass(unittest.TestCase):
             with document_model.ref():
                 self.assertEqual(1, len(document_model.data_items))
 
+    def test_update_partial_from_thread_is_not_lost_when_data_is_unloaded_before_update(self):
+        # use file storage so that the reloaded data is a copy of the stored data.
+        with create_temp_profile_context() as profile_context:
+            document_model = profile_context.create_document_model(auto_close=False)
+            with document_model.ref():
+                data_item = DataItem.DataItem(numpy.zeros((64, 4), float))
+                document_model.append_data_item(data_item)
+                data_metadata = copy.deepcopy(data_item.data_metadata)
+                data_and_metadata = DataAndMetadata.new_data_and_metadata(numpy.ones((1, 4), float))
+                self.assertTrue(data_item.is_unloadable)
+                # unload the data after a partial update has been written on the producer thread.
+                data_item.increment_data_ref_count()
+                thread = threading.Thread(target=lambda: document_model.update_data_item_partial(data_item, data_metadata, data_and_metadata, [slice(0, 1), slice(None)], [slice(0, 1), slice(None)]))
+                thread.start()
+                thread.join()
+                data_item.decrement_data_ref_count()
+                document_model.perform_data_item_updates()
+                self.assertEqual(4, numpy.sum(data_item.data))
+                # and while partial updates are being queued on the producer thread.
+                finished = threading.Event()
+
+                def update_partial() -> None:
+                    for i in range(1, 64):
+                        document_model.update_data_item_partial(data_item, data_metadata, data_and_metadata, [slice(0, 1), slice(None)], [slice(i, i + 1), slice(None)])
+                    finished.set()
+
+                data_item.increment_data_ref_count()
+                thread = threading.Thread(target=update_partial)
+                thread.start()
+                while not finished.is_set():
+                    data_item.decrement_data_ref_count()
+                    data_item.increment_data_ref_count()
+                thread.join()
+                data_item.decrement_data_ref_count()
+                document_model.perform_data_item_updates()
+                self.assertEqual(64 * 4, numpy.sum(data_item.data))
+                self.assertEqual(0, data_item._data_ref_count)
+
     def disabled_test_document_controller_disposes_threads(self):
         thread_count = threading.activeCount()
         with TestContext.create_memory_context() as test_context:
@@ -0,0 +1,53 @@
+"""Compare reading cached thumbnails one at a time with reading them in batches.
+
+Run with: python -m nion.swift.test.ThumbnailCache_benchmark [count]
+
+Fills a cache database with count 256 x 256 thumbnails and reports the time to read the thumbnail data and dirty flag
+of all of them, one query per value (the previous behavior) and in batches as done by the thumbnail cache loader.
+"""
+
+# standard libraries
+import pathlib
+import sys
+import tempfile
+import time
+import types
+import uuid
+
+# third party libraries
+import numpy
+
+# local libraries
+from nion.swift.model import Cache
+
+
+def main(count: int = 20000, batch_size: int = 256) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        storage_cache = Cache.DbStorageCache(pathlib.Path(temp_dir) / "cache.nscache")
+        try:
+            thumbnail_data = numpy.random.RandomState(0).randint(0, 2 ** 32, (256, 256), dtype=numpy.uint32)
+            targets = [types.SimpleNamespace(uuid=uuid.uuid4()) for _ in range(count)]
+            caches = [Cache.SuspendableCache(storage_cache) for _ in targets]
+            for cache, target in zip(caches, targets):
+                cache.set_cached_value(target, "thumbnail_data", thumbnail_data)
+            storage_cache.get_cached_value(targets[-1], "thumbnail_data")  # wait for the writes to finish.
+
+            start = time.perf_counter()
+            for cache, target in zip(caches, targets):
+                cache.get_cached_value(target, "thumbnail_data")
+                cache.is_cached_value_dirty(target, "thumbnail_data")
+            individual_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for i in range(0, count, batch_size):
+                Cache.get_cached_values(list(zip(caches[i:i + batch_size], targets[i:i + batch_size])), "thumbnail_data")
+            batched_s = time.perf_counter() - start
+        finally:
+            storage_cache.close()
+    print(f"{count} thumbnails; batch size {batch_size}")
+    print(f"{'individual ms':>14}{'batched ms':>14}{'batch latency ms':>18}")
+    print(f"{individual_s * 1000:>14.1f}{batched_s * 1000:>14.1f}{batched_s * 1000 / -(-count // batch_size):>18.2f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -1,5 +1,7 @@
 # standard libraries
+import concurrent.futures
 import contextlib
+import functools
 import logging
 import threading
 import typing
@@ -76,6 +78,38 @@ class TestThumbnailsClass(unittest.TestCase):
             # so use the event instead.
             self.assertTrue(thumbnail_dirty)
 
+    def test_cache_loader_reads_requested_display_items_first_in_batches(self):
+        with TestContext.create_memory_context() as test_context:
+            document_model = test_context.create_document_model()
+            for i in range(8):
+                document_model.append_data_item(DataItem.DataItem(numpy.full((4, 4), i)))
+            display_items = list(document_model.display_items)
+            for i, display_item in enumerate(display_items[:6]):
+                display_item._display_cache.set_cached_value(display_item, "thumbnail_data", numpy.full((2, 2), i, dtype=numpy.uint32))
+            # block the loader executor until all thumbnail sources are added.
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            blocked = threading.Event()
+            executor.submit(blocked.wait)
+            cache_loader = Thumbnails.ThumbnailCacheLoader(executor)
+            cache_loader.batch_size = 3
+            read_display_items = list()
+            thumbnail_sources = list()
+            listeners = list()
+            for display_item in display_items:
+                thumbnail_source = Thumbnails.ThumbnailSource(self._test_setup.app.ui, display_item, lambda display_item_uuid: None, cache_loader=cache_loader)
+                thumbnail_sources.append(thumbnail_source)
+                listeners.append(thumbnail_source.thumbnail_updated_event.listen(functools.partial(read_display_items.append, display_item)))
+            cache_loader.load([display_items[5], display_items[4]])
+            blocked.set()
+            executor.shutdown(wait=True)
+            self.assertEqual(0, cache_loader._pending_count)
+            self.assertEqual([display_items[5], display_items[4], display_items[0]], read_display_items[:3])
+            self.assertEqual(set(display_items), set(read_display_items))
+            for i, thumbnail_source in enumerate(thumbnail_sources[:6]):
+                self.assertEqual(i, thumbnail_source.thumbnail_data[0, 0])
+                self.assertFalse(thumbnail_source._is_thumbnail_dirty)
+            listeners = None
+
 
 if __name__ == '__main__':
     logging.getLogger().setLevel(logging.DEBUG)
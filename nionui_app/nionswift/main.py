@@ -1,6 +1,10 @@
 import typing
 import warnings
 
+# start the opt-in startup profile before the application modules are imported.
+from nion.swift import StartupProfile
+StartupProfile.start()
+
 from nion.swift import Application
 from nion.swift import Facade
 from nion.ui import Application as ApplicationUI
@@ -9,8 +13,12 @@ from nion.ui import Application as ApplicationUI
 def main(args: list[typing.Any], bootstrap_args: dict[str, typing.Any]) -> Application.Application:
     # from nion.swift import Application
     warnings.simplefilter("always", RuntimeWarning)
-    Facade.initialize()
-    app = Application.Application(ApplicationUI.make_ui(bootstrap_args))
-    app.initialize(use_root_dir=False)
-    Facade.start_server()
+    with StartupProfile.phase("facade"):
+        Facade.initialize()
+    with StartupProfile.phase("application"):
+        app = Application.Application(ApplicationUI.make_ui(bootstrap_args))
+    with StartupProfile.phase("initialize"):
+        app.initialize(use_root_dir=False)
+    with StartupProfile.phase("server"):
+        Facade.start_server()
     return app